@@ -17,14 +17,15 @@ Contents:
 - File Statistics Models:
     - BaseFileStat:
         Base model for POSIX file statistics (st_mode, st_size, st_atime, st_mtime,
-        st_ctime, etc.). Includes serialization that converts timestamps to ISO 8601
-        datetime strings.
+        st_ctime, etc.). A single serializer converts the fields named in the
+        class-level _TS_FIELDS tuple to ISO 8601 datetime strings; from_stat_json()
+        rebuilds a model from a trusted dump without validation.
     - MacOSFileStat:
         Extends BaseFileStat with macOS/BSD-specific fields (st_flags, st_gen,
-        st_birthtime).
+        st_birthtime); adds st_birthtime to _TS_FIELDS.
     - LinuxFileStat:
         Extends BaseFileStat with Linux-specific fields (st_atim, st_mtim, st_ctim,
-        and nanosecond variants).
+        and nanosecond variants); adds st_atim/st_mtim/st_ctim to _TS_FIELDS.
     - WindowsFileStat:
         Extends BaseFileStat with Windows-specific fields (st_file_attributes,
         st_reparse_tag).
@@ -37,8 +38,9 @@ Contents:
     - GenericFile:
         Simple file model with type="file" for unclassified files.
     - TextFileLine:
-        Represents a single line in a text file with file_id, content, line_number,
-        and content_hash. Includes is_empty and line_length properties.
+        Slotted dataclass representing a single line in a text file with file_id,
+        content, line_number, and content_hash. Includes is_empty and line_length
+        properties.
     - BaseTextFile:
         Extends BaseFileModel for text files. Adds content (full text) and lines_json
         (list of TextFileLine). The populate() method reads file content and splits
@@ -52,46 +54,66 @@ Contents:
         Base model for scan operation results. Includes root path, scanning mode
         (git-local, git-cloned, image, video, database, obsidian, docs, pdf, all),
         started_at/ended_at timestamps, and duration_seconds property. Validators
-        handle ISO string parsing for timestamps.
+        handle ISO string parsing for timestamps. Scanned files' sizes and times
+        are kept as int64 columns, filled from scanned_files() as files are
+        added, for scan-wide aggregates such as total_size().
 Design Notes:
 - All models use Pydantic v2 conventions with field_validator, field_serializer,
-    and model_serializer decorators.
+    and model_serializer decorators. TextFileLine is the exception: it is a slotted
+    dataclass validated at the list boundary to keep per-line memory small.
 - Timestamp fields are consistently serialized to ISO 8601 strings for API compatibility.
 - The populate() pattern allows models to be instantiated empty and filled from
     actual file system data via utility functions.
 - Tag validation ensures lowercase, dash-separated, hash-prefixed format for consistency.
+- FilePath and the stat models are frozen (immutable): entities cache and share one
+    instance per row, and callers cannot mutate it behind the row's back.
 - Platform-specific stat models allow accurate representation of file metadata across
     macOS, Linux, and Windows environments.
 """
 
 # endregion
 # region Imports
+import os
+import re
+import sys
+from array import array
+from dataclasses import dataclass
 from datetime import datetime
 from hashlib import sha256
+from itertools import compress, count, repeat
 from pathlib import Path
-from typing import Literal, Optional, Union
+from typing import Any, ClassVar, Literal, Optional, Sequence, Union
 
 from pydantic import (
     BaseModel,
     ConfigDict,
     Field,
+    PrivateAttr,
+    TypeAdapter,
     field_validator,
     model_serializer,
     model_validator,
 )
 
 from .utils import (
-    get_file_sha256,
+    get_file_fingerprint,
     get_file_stat_model,
-    get_mime_type,
     get_path_model,
     is_binary_file,
     is_data_file,
     is_image_file,
     is_markdown_formattable,
     is_video_file,
+    parse_iso_datetime,
 )
 
+# endregion
+# region Tag Normalization
+_TAG_RE = re.compile(r"#[a-z0-9][a-z0-9-]*")
+"""Matches a tag that is already in canonical '#lower-dash' form."""
+_TAG_NORMALIZE = str.maketrans(" ", "-")
+"""Translation table mapping spaces to dashes in tags."""
+
 # endregion
 # region Base File System Models
 # --- FILE PART MODELS ---
@@ -171,6 +193,9 @@ class FilePath(BaseModel):
     )
     is_absolute: bool = Field(..., description="Whether the path is absolute")
 
+    # read-only value object: entities cache one instance per row and share it
+    model_config = ConfigDict(frozen=True)
+
     def _path(self) -> Path:
         """
         Helper method to reconstruct the full Path object from its components.
@@ -341,10 +366,61 @@ class BaseFileStat(BaseModel):
     st_blksize: Optional[int] = None
     st_rdev: Optional[int] = None
 
+    _TS_FIELDS: ClassVar[tuple[str, ...]] = ()
+    """
+    Timestamp fields serialized as ISO 8601 strings. Empty here so st_mtime and
+    st_ctime stay numeric for the DB computed columns; subclasses extend it.
+    """
+
     model_config = ConfigDict(
-        arbitrary_types_allowed=True, ignore_extra=True, check_fields=False
+        arbitrary_types_allowed=True,
+        ignore_extra=True,
+        check_fields=False,
+        frozen=True,
     )
 
+    @model_validator(mode="before")
+    @classmethod
+    def parse_iso_datetimes(cls, data):
+        """
+        Accept the ISO 8601 strings produced by serialization back as timestamps.
+        """
+        if not cls._TS_FIELDS or not isinstance(data, dict):
+            return data
+        parsed = {
+            field: parse_iso_datetime(data[field]).timestamp()
+            for field in cls._TS_FIELDS
+            if isinstance(data.get(field), str)
+        }
+        return {**data, **parsed} if parsed else data
+
+    @classmethod
+    def from_stat_json(cls, data: dict) -> "BaseFileStat":
+        """
+        Rebuild a stat model from a trusted stat_json dump (e.g. a DB row) without
+        running validation. ISO timestamps in _TS_FIELDS are parsed back first.
+
+        Args:
+            data (dict): The dumped stat fields.
+
+        Returns:
+            BaseFileStat: The stat model, as an instance of cls.
+        """
+        return cls.model_construct(**cls.parse_iso_datetimes(data))
+
+    @model_serializer(mode="wrap")
+    def convert_to_iso_datetimes(self, handler) -> dict:
+        """
+        Convert timestamp fields to ISO 8601 datetime strings during serialization.
+        """
+        data = handler(self)
+        for field in self._TS_FIELDS:
+            if data.get(field) is not None:
+                data[field] = (
+                    datetime.fromtimestamp(data[field]).astimezone().isoformat()
+                )
+        return data
+
 
 class MacOSFileStat(BaseFileStat):
     """
@@ -377,17 +453,7 @@ class MacOSFileStat(BaseFileStat):
     st_gen: Optional[int] = None
     st_birthtime: Optional[float] = None
 
-    @model_serializer()
-    def convert_to_iso_datetimes(self) -> dict:
-        """
-        Convert timestamp fields to ISO 8601 datetime strings during serialization.
-        """
-        data = super().convert_to_iso_datetimes()
-        if data.get("st_birthtime") is not None:
-            data["st_birthtime"] = datetime.fromtimestamp(
-                data["st_birthtime"], tz=datetime.now()
-            ).isoformat()
-        return data
+    _TS_FIELDS: ClassVar[tuple[str, ...]] = BaseFileStat._TS_FIELDS + ("st_birthtime",)
 
 
 class LinuxFileStat(BaseFileStat):
@@ -429,18 +495,11 @@ class LinuxFileStat(BaseFileStat):
     st_mtimensec: Optional[int] = None
     st_atimensec: Optional[int] = None
 
-    @model_serializer()
-    def convert_to_iso_datetimes(self) -> dict:
-        """
-        Convert timestamp fields to ISO 8601 datetime strings during serialization.
-        """
-        data = super().convert_to_iso_datetimes()
-        for field in ["st_atim", "st_mtim", "st_ctim"]:
-            if data.get(field) is not None:
-                data[field] = datetime.fromtimestamp(
-                    data[field], tz=datetime.now()
-                ).isoformat()
-        return data
+    _TS_FIELDS: ClassVar[tuple[str, ...]] = BaseFileStat._TS_FIELDS + (
+        "st_atim",
+        "st_mtim",
+        "st_ctim",
+    )
 
 
 class WindowsFileStat(BaseFileStat):
@@ -471,6 +530,15 @@ class WindowsFileStat(BaseFileStat):
     st_reparse_tag: Optional[int] = None
 
 
+_PLATFORM_STAT: type[BaseFileStat] = {
+    "darwin": MacOSFileStat,
+    "linux": LinuxFileStat,
+    "win32": WindowsFileStat,
+}.get(sys.platform, BaseFileStat)
+"""The FileStat model for the running platform, resolved once at import."""
+_PLATFORM_STAT_ADAPTER = TypeAdapter(_PLATFORM_STAT)
+"""Validator for raw stat data into the platform FileStat model."""
+
 # endregion
 # endregion
 # region Base File Models
@@ -539,11 +607,16 @@ class BaseFileModel(BaseModel):
         """
         if v is None:
             return v
+        # fast path: already-canonical tags (e.g. a DB round-trip) need no rebuild
+        if isinstance(v, list) and all(
+            isinstance(tag, str) and _TAG_RE.fullmatch(tag) for tag in v
+        ):
+            return v
         validated_tags = []
         for tag in v:
             if not isinstance(tag, str):
                 raise ValueError("All tags must be strings.")
-            tag = tag.strip().lower().replace(" ", "-")
+            tag = tag.strip().lower().translate(_TAG_NORMALIZE)
             if not tag.startswith("#"):
                 tag = f"#{tag}"
             validated_tags.append(tag)
@@ -571,17 +644,10 @@ class BaseFileModel(BaseModel):
         """
         Validator for 'stat_json' field to ensure it is a BaseFileStatModel instance.
         """
+        if isinstance(v, BaseFileStat):
+            return v
         try:
-            if isinstance(v, BaseFileStat):
-                return v
-            elif isinstance(v, MacOSFileStat):
-                return v
-            elif isinstance(v, LinuxFileStat):
-                return v
-            elif isinstance(v, WindowsFileStat):
-                return v
-            else:
-                return BaseFileStat.model_validate(v, from_attributes=True)
+            return _PLATFORM_STAT_ADAPTER.validate_python(v, from_attributes=True)
         except Exception as e:
             raise ValueError(f"Invalid stat_json data: {e}")
 
@@ -624,15 +690,21 @@ class BaseFileModel(BaseModel):
     def suffix(self) -> str:
         return self.path_json.suffix
 
+    def _id_hash(self):
+        """Hash object primed with the path and content digest (the id inputs)."""
+        digest = sha256(os.fsencode(self.Path))
+        digest.update(self.sha256.encode())
+        return digest
+
     @property
     def id(self) -> Optional[str]:
-        return sha256(f"{self.Path}{self.sha256}".encode()).hexdigest()
+        return self._id_hash().hexdigest()
 
     @property
     def uuid(self) -> Optional[str]:
-        return sha256(
-            f"{self.Path}{self.sha256}{self.stat_json.model_dump_json()}".encode()
-        ).hexdigest()
+        digest = self._id_hash()
+        digest.update(self.stat_json.model_dump_json().encode())
+        return digest.hexdigest()
 
     @property
     def has_md_formatting(self) -> bool:
@@ -677,11 +749,16 @@ class BaseFileModel(BaseModel):
                 raise FileNotFoundError(f"File not found: {file_path}")
         except Exception as e:
             raise ValueError(f"Error populating BaseFileModel: {e}")
+        # stat first; unchanged files reuse the cached sha256/mime_type
+        stat_json = get_file_stat_model(file_path)
+        file_sha256, mime_type = get_file_fingerprint(
+            file_path, stat_json.st_mtime_ns, stat_json.st_size
+        )
         instance = cls(
-            sha256=get_file_sha256(file_path),
-            stat_json=get_file_stat_model(file_path),
+            sha256=file_sha256,
+            stat_json=stat_json,
             path_json=get_path_model(file_path),
-            mime_type=get_mime_type(file_path) or "application/octet-stream",
+            mime_type=mime_type,
             tags=[],
             short_description=None,
             long_description=None,
@@ -807,8 +884,11 @@ class BaseDirectory(BaseModel):
     def is_empty(self) -> bool:
         """
         Check if the directory is empty (no files and no subdirectories).
+
+        Stops at the first directory entry instead of listing the whole directory.
         """
-        return len(self.files) == 0 and len(self.directories) == 0
+        with os.scandir(self.Path) as entries:
+            return next(entries, None) is None
 
 
 class GenericFile(BaseFileModel):
@@ -823,29 +903,32 @@ class GenericFile(BaseFileModel):
 # region Text File Models
 
 
-class TextFileLine(BaseModel):
+@dataclass(slots=True)
+class TextFileLine:
     """
-    A Pydantic model to represent a line in a text file.
+    A slotted dataclass to represent a line in a text file.
+
+    This is the most-multiplied object in a scan (files x lines), so it skips the
+    per-instance __dict__ and Pydantic bookkeeping of a BaseModel. Validation
+    happens once, at the BaseTextFile.lines_json list boundary.
 
     Attributes:
         file_id (str): The ID of the text file.
-        line (TextFileLine): A line in the text file.
+        content (str): The content of the line.
+        line_number (Optional[int]): The line number in the file.
+        content_hash (Optional[str]): SHA256 hash of the line content for deduplication.
     """
 
-    file_id: str = Field(..., description="The ID of the text file")
-    content: str = Field(..., description="The content of the line")
-    line_number: Optional[int] = Field(None, description="The line number in the file")
-    content_hash: Optional[str] = Field(
-        None, description="SHA256 hash of the line content for deduplication"
-    )
+    file_id: str
+    content: str
+    line_number: Optional[int] = None
+    content_hash: Optional[str] = None
 
-    @model_validator(mode="after")
-    def compute_content_hash(self) -> "TextFileLine":
+    def __post_init__(self) -> None:
         """
         Compute the SHA256 hash of the line content for deduplication.
         """
         self.content_hash = sha256(self.content.encode()).hexdigest()
-        return self
 
     @property
     def id(self) -> str:
@@ -863,6 +946,10 @@ class TextFileLine(BaseModel):
         return len(self.content)
 
 
+_LINES_ADAPTER = TypeAdapter(list[TextFileLine])
+"""Shared validator/serializer for whole lists of TextFileLine, built once."""
+
+
 class BaseTextFile(BaseFileModel):
     """
     A Pydantic model to represent a text file with its lines.
@@ -911,14 +998,17 @@ class BaseTextFile(BaseFileModel):
 
             content = "".join(lines).replace("\x00", "")
 
-            lines_json = [
-                TextFileLine(
-                    file_id=instance.id,  # Access ID from the instance
-                    content=line.rstrip("\n").rstrip("\r"),
-                    line_number=i + 1,
+            # instance.id hashes on every access, so resolve it once; map() keeps
+            # the per-line loop in C (threads don't help, this is GIL-bound)
+            file_id = instance.id
+            lines_json = list(
+                map(
+                    TextFileLine,
+                    repeat(file_id),
+                    (line.rstrip("\r\n") for line in lines),
+                    count(1),
                 )
-                for i, line in enumerate(lines)
-            ]
+            )
 
         instance.content = content
         instance.lines_json = lines_json
@@ -927,18 +1017,16 @@ class BaseTextFile(BaseFileModel):
 
     @model_serializer(when_used="json")
     def serialize_model(self) -> dict:
-        base_serialization = super().serialize_model()
-        base_serialization.update(
-            {
-                "content": self.content,
-                "lines_json": (
-                    [line.model_dump() for line in self.lines_json]
-                    if self.lines_json
-                    else []
-                ),
-            }
-        )
-        return base_serialization
+        return {
+            **super().serialize_model(),
+            "content": self.content,
+            # one Rust-side pass over the whole list, already JSON-safe
+            "lines_json": (
+                _LINES_ADAPTER.dump_python(self.lines_json, mode="json")
+                if self.lines_json
+                else []
+            ),
+        }
 
     @property
     def lines(self) -> list[TextFileLine]:
@@ -972,6 +1060,12 @@ class DirectoryTree(BaseDirectory):
         )
         return base_serialization
 
+    def is_empty(self) -> bool:
+        """
+        Check if the populated tree holds no files and no subdirectories.
+        """
+        return len(self.files) == 0 and len(self.directories) == 0
+
     @classmethod
     def populate(cls, dir_path: Path) -> "DirectoryTree":
         """
@@ -1048,6 +1142,10 @@ DirectoryTree.model_rebuild()  # To handle self-referencing type
 # region Scan Result Models
 
 
+_STAT_COLUMNS = ("st_size", "st_mtime_ns", "st_ctime_ns")
+"""Stat fields BaseScanResult keeps as scan-wide int64 columns."""
+
+
 class BaseScanResult(BaseModel):
     """
     A Pydantic model to represent the result of a file system scan.
@@ -1095,6 +1193,82 @@ class BaseScanResult(BaseModel):
             raise ValueError(f"Invalid scan mode: {v}")
         return v
 
+    _stat_cols: dict[str, array] = PrivateAttr(
+        default_factory=lambda: {name: array("q") for name in _STAT_COLUMNS}
+    )
+    _stat_known: dict[str, array] = PrivateAttr(
+        default_factory=lambda: {name: array("B") for name in _STAT_COLUMNS}
+    )
+
+    def scanned_files(self) -> Sequence[Any]:
+        """
+        Return the scanned files, in scan order.
+
+        Subclasses return their own file list; the stat columns are filled from it.
+        Files are expected to be appended, as scans do: new entries are recorded on
+        the next aggregate call, and a shorter list causes a rebuild.
+
+        Returns:
+            Sequence[Any]: The scanned file models.
+        """
+        return ()
+
+    def _sync_stats(self) -> None:
+        """Record the stats of files added since the last call."""
+        files = self.scanned_files()
+        recorded = len(self._stat_cols["st_size"])
+        if len(files) < recorded:
+            for column in (*self._stat_cols.values(), *self._stat_known.values()):
+                del column[:]
+            recorded = 0
+        for index in range(recorded, len(files)):
+            stat = getattr(files[index], "stat_json", None)
+            for name in _STAT_COLUMNS:
+                value = getattr(stat, name, None)
+                # missing values are marked unknown rather than stored as 0
+                self._stat_cols[name].append(0 if value is None else value)
+                self._stat_known[name].append(value is not None)
+
+    def stat_at(self, index: int) -> Optional[BaseFileStat]:
+        """
+        Build the recorded stat columns for one file back into a BaseFileStat.
+
+        Args:
+            index (int): The position of the file in scan order.
+
+        Returns:
+            Optional[BaseFileStat]: A stat model holding the recorded columns, or None
+                if the file has no stat information.
+        """
+        self._sync_stats()
+        values = {
+            name: (
+                self._stat_cols[name][index] if self._stat_known[name][index] else None
+            )
+            for name in _STAT_COLUMNS
+        }
+        if all(value is None for value in values.values()):
+            return None
+        return BaseFileStat(**values)
+
+    @property
+    def file_count(self) -> int:
+        """Number of scanned files."""
+        return len(self.scanned_files())
+
+    def total_size(self) -> int:
+        """Total size, in bytes, of the scanned files whose size is known."""
+        self._sync_stats()
+        return sum(compress(self._stat_cols["st_size"], self._stat_known["st_size"]))
+
+    def newest_mtime_ns(self) -> Optional[int]:
+        """Most recent modification time, in nanoseconds, of the scanned files."""
+        self._sync_stats()
+        return max(
+            compress(self._stat_cols["st_mtime_ns"], self._stat_known["st_mtime_ns"]),
+            default=None,
+        )
+
     @property
     def Path(self) -> Path:
         return Path(self.root)
@@ -1116,19 +1290,18 @@ class BaseScanResult(BaseModel):
     @field_validator("started_at", mode="before")
     def validate_started_at(cls, v: Union[datetime, str, None]) -> Optional[datetime]:
         if isinstance(v, str):
-            return datetime.fromisoformat(v)
+            return parse_iso_datetime(v)
         return v
 
     @field_validator("ended_at", mode="before")
     def validate_ended_at(cls, v: Union[datetime, str, None]) -> Optional[datetime]:
         if isinstance(v, str):
-            return datetime.fromisoformat(v)
+            return parse_iso_datetime(v)
         return v
 
     @model_serializer(when_used="json")
     def serialize_model(self):
         return {
-            "scanned_on": self.scanned_on.isoformat() if self.scanned_on else None,
             "root": self.root,
             "mode": self.mode,
             "started_at": self.started_at.isoformat() if self.started_at else None,
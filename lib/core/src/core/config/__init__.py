@@ -55,7 +55,8 @@ Contents:
         convenience property for database access.
     - AppSettings:
         Global application settings including app root directory, environment, timezone,
-        and computed properties for logs, cache, temp, and remotes directories.
+        the optional image serve URL used by image tags, and computed properties for
+        logs, cache, temp, and remotes directories.
 Design Notes:
 - All settings classes use Pydantic Field with aliases to support environment variable
     configuration (e.g., CONTROLLER_API_HOST, OLLAMA_MODEL).
@@ -73,6 +74,7 @@ Design Notes:
 # region Imports
 
 from pathlib import Path
+from typing import Optional
 
 from pydantic import Field
 from sqlite_utils import Database
@@ -668,7 +670,14 @@ class CliSettings(FactoryBaseSettings):
 
 
 class AppSettings(FactoryBaseSettings):
-    """Application configuration settings."""
+    """
+    Application configuration settings.
+
+    Attributes:
+        app_root (Path): Root directory for application data storage.
+        environment (str): Current application environment (prod, docker, dev).
+        image_serve_url (Optional[str]): Base URL that serves stored image bytes by id.
+    """
 
     # Application Data Root
     app_root: Path = Field(
@@ -680,6 +689,15 @@ class AppSettings(FactoryBaseSettings):
         description="Current application environment (prod, docker, dev).",
         alias="ENVIRONMENT",
     )
+    image_serve_url: Optional[str] = Field(
+        default=None,
+        description=(
+            "Base URL serving raw image bytes as {url}/{id} (thumbnails at "
+            "{url}/{id}/thumbnail). When set, image tags link there instead of "
+            "embedding base64 data URIs."
+        ),
+        alias="CNTRLR_IMAGE_SERVE_URL",
+    )
 
     @property
     def logs_dir(self) -> Path:
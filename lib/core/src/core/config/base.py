@@ -25,6 +25,9 @@ Contents:
     - TTS_MODELS_DIR (Path): The directory where TTS models are stored, resolved
         based on the current environment.
     - REMOTES_DIR (Path): The directory where remote resources are stored.
+    - OPENAPI_EXAMPLES (bool): Whether Pydantic models attach their JSON schema
+        examples; on in development or when INCLUDE_OPENAPI_EXAMPLES=true, off in
+        production so schema generation stays small.
 
 Environment Detection Logic:
 - Priority 1: Checks the ENVIRONMENT environment variable for explicit configuration.
@@ -111,12 +114,17 @@ TTS_MODELS_DIR: Path = AppEnv.tts_models_dir()
 """[Path] Directory where TTS models are stored."""
 REMOTES_DIR: Path = APP_ROOT / "remotes"
 """[Path] Directory where remote resources are stored."""
+OPENAPI_EXAMPLES: bool = (
+    APP_ENV == AppEnv.DEV or os.getenv("INCLUDE_OPENAPI_EXAMPLES", "").lower() == "true"
+)
+"""[bool] Whether models attach JSON schema examples (dev, or INCLUDE_OPENAPI_EXAMPLES)."""
 # endregion
 
 
 __all__ = [
     "APP_ENV",
     "APP_ROOT",
+    "OPENAPI_EXAMPLES",
     "TTS_MODELS_DIR",
     "AppEnv",
 ]
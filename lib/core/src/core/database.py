@@ -15,6 +15,19 @@ Contents:
     ObsidianNoteEntity, ObsidianVaultEntity, ObsidianNoteLineEntity) should inherit
     from this base to participate in the shared ORM registry and metadata.
 
+- copy_rows(session, table, rows):
+    Bulk-load column dictionaries into a table, streaming them through PostgreSQL
+    COPY when the batch is large and the driver is psycopg 3, and falling back to a
+    multi-row INSERT otherwise.
+
+- invalidate_cached_properties(entity_cls, *names):
+    Registers ORM event listeners that drop an entity's functools.cached_property
+    values whenever its mapped attributes are set, expired, refreshed, or flushed.
+
+- json_dumps / json_loads:
+    The JSON codec used for JSON/JSONB columns (and COPY); orjson when the optional
+    "speedups" extra is installed, the standard library otherwise.
+
 - DatabaseSessionGenerator:
     Utility class to generate SQLAlchemy sessions bound to a specific engine.
     - __init__(settings: DatabaseSettings):
@@ -36,15 +49,127 @@ Design Notes:
     access patterns for flexibility in different application contexts.
 """
 
-from sqlalchemy import engine
-from sqlalchemy.orm import declarative_base
+import json
+from typing import Any, Sequence
+
+from sqlalchemy import JSON, Table, engine, event, insert, inspect
+from sqlalchemy.orm import Session, declarative_base
 
 from core.config import DatabaseSettings
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "speedups" extra
+    orjson = None
+
 Base = declarative_base()
 """Singleton `declarative_base` instance for ORM models."""
 
 
+def json_dumps(obj: Any) -> str:
+    """Serialize a JSON column value, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj)
+
+
+def json_loads(data: Any) -> Any:
+    """Deserialize a JSON column value, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+ENGINE_JSON_OPTIONS: dict[str, Any] = {
+    "json_serializer": json_dumps,
+    "json_deserializer": json_loads,
+}
+"""create_engine() options that route JSON/JSONB columns through json_dumps/loads."""
+
+COPY_THRESHOLD = 1024
+"""Batches at or below this many rows are inserted with a plain multi-row INSERT."""
+
+
+def copy_rows(session: Session, table: Table, rows: Sequence[dict[str, Any]]) -> None:
+    """
+    Bulk-load rows into a table within the session's current transaction.
+
+    Large batches are streamed with ``COPY ... FROM STDIN`` on a psycopg 3
+    connection, which skips per-row parameter binding. Small batches, and drivers
+    without ``cursor.copy`` (e.g. psycopg2), use ``session.execute(insert(table),
+    rows)``. Columns are taken from the first row, so computed and server-default
+    columns are simply left out and filled in by the database.
+
+    Args:
+        session (Session): The session whose connection and transaction to use.
+        table (Table): The target table, e.g. ``ImageFileEntity.__table__``.
+        rows (Sequence[dict[str, Any]]): Column values keyed by column name; every
+            row must have the same keys.
+    """
+    if not rows:
+        return
+    cursor = session.connection().connection.cursor()
+    if len(rows) <= COPY_THRESHOLD or not hasattr(cursor, "copy"):
+        cursor.close()
+        session.execute(insert(table), rows)
+        return
+
+    columns = list(rows[0])
+    # None in a JSON column is written the way the INSERT path binds it: as the JSON
+    # 'null' document, or as SQL NULL where the column type sets none_as_null
+    json_columns = {
+        name: table.columns[name].type.none_as_null
+        for name in columns
+        if isinstance(table.columns[name].type, JSON)
+    }
+    statement = f"COPY {table.name} ({', '.join(columns)}) FROM STDIN"
+    with cursor, cursor.copy(statement) as copy:
+        for row in rows:
+            copy.write_row(
+                [
+                    (
+                        row[name]
+                        if name not in json_columns
+                        or (row[name] is None and json_columns[name])
+                        else json_dumps(row[name])
+                    )
+                    for name in columns
+                ]
+            )
+
+
+def invalidate_cached_properties(entity_cls: type, *names: str) -> None:
+    """
+    Keep ``functools.cached_property`` values on an entity consistent with its row.
+
+    Cached values live in the instance ``__dict__``; they are dropped whenever any
+    mapped column attribute is set, when the instance is expired (e.g. after a
+    commit) or refreshed from the database, and after a flush inserts or updates
+    its row, since the flush writes generated keys and defaults without firing
+    attribute set events.
+
+    Args:
+        entity_cls (type): The mapped entity class.
+        *names (str): The cached property names to drop.
+    """
+
+    def clear(target, *_) -> None:
+        for name in names:
+            target.__dict__.pop(name, None)
+
+    def clear_flushed(mapper, connection, target) -> None:
+        clear(target)
+
+    # mapper.columns is available before mapper configuration, so this can run
+    # right after the class body even if its relationships are not resolvable yet
+    for key in inspect(entity_cls).columns.keys():
+        event.listen(getattr(entity_cls, key), "set", clear)
+    event.listen(entity_cls, "expire", clear)
+    event.listen(entity_cls, "refresh", clear)
+    event.listen(entity_cls, "after_insert", clear_flushed)
+    event.listen(entity_cls, "after_update", clear_flushed)
+
+
 class DatabaseSessionGenerator:
     """
     Utility class to generate SQLAlchemy sessions bound to a specific engine.
@@ -54,7 +179,7 @@ class DatabaseSessionGenerator:
     """
 
     def __init__(self, settings: DatabaseSettings):
-        self.engine = engine.create_engine(settings.database_url)
+        self.engine = engine.create_engine(settings.database_url, **ENGINE_JSON_OPTIONS)
 
     def get_session(self):
         """
@@ -78,7 +203,7 @@ class DatabaseSessionGenerator:
         from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
         from sqlalchemy.orm import sessionmaker
 
-        async_engine = create_async_engine(self.engine.url)
+        async_engine = create_async_engine(self.engine.url, **ENGINE_JSON_OPTIONS)
         AsyncSessionLocal = sessionmaker(
             bind=async_engine, class_=AsyncSession, expire_on_commit=False
         )
@@ -61,6 +61,7 @@ from .file_system import (  # noqa: F401
     FilePath,
     GenericFile,
     ImageFile,
+    ImageFileBlobEntity,
     ImageFileEntity,
     ImageScanResult,
     LinuxFileStat,
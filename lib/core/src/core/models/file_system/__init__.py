@@ -18,6 +18,7 @@ Entities (SQLAlchemy):
     - AudioFileEntity: Database entity for audio files.
     - DataFileEntity: Database entity for data files.
     - ImageFileEntity: Database entity for image files.
+    - ImageFileBlobEntity: Database entity holding the bytes of an image file.
     - VideoFileEntity: Database entity for video files.
     - SQLiteFileEntity: Database entity for SQLite files.
 Pydantic Models:
@@ -67,7 +68,12 @@ from ...base import (  # noqa: F401
 )
 from .audio_file import AudioFile, AudioFileEntity  # noqa: F401
 from .data_file import DataFile, DataFileEntity  # noqa: F401
-from .image_file import ImageFile, ImageFileEntity, ImageScanResult  # noqa: F401
+from .image_file import (  # noqa: F401
+    ImageFile,
+    ImageFileBlobEntity,
+    ImageFileEntity,
+    ImageScanResult,
+)
 from .sqlite_file import SQLiteFile, SQLiteFileEntity  # noqa: F401
 from .video_file import VideoFile, VideoFileEntity, VideoScanResult  # noqa: F401
 
@@ -77,6 +83,7 @@ __all__ = [
     "AudioFileEntity",
     "DataFileEntity",
     "ImageFileEntity",
+    "ImageFileBlobEntity",
     "VideoFileEntity",
     "SQLiteFileEntity",
     "AudioFile",
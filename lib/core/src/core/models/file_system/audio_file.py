@@ -40,7 +40,7 @@ from pydantic import model_serializer
 from sqlalchemy import Computed, DateTime, Integer, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column
 
-from core.base import BaseFileModel, BaseFileStat, FilePath
+from core.base import _PLATFORM_STAT, BaseFileModel, BaseFileStat, FilePath
 from core.database import Base
 from core.utils import is_video_file
 
@@ -139,7 +139,7 @@ class AudioFileEntity(Base):
     @property
     def stat_model(self) -> BaseFileStat:
         """Return the FileStat model representation of the file's stat_json."""
-        return BaseFileStat.model_validate(self.stat_json)
+        return _PLATFORM_STAT.from_stat_json(self.stat_json)
 
     @property
     def path_model(self) -> FilePath:
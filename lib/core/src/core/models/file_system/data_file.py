@@ -17,38 +17,77 @@ Contents:
         Several columns are computed from JSON fields (e.g., filename, extension, size,
         filesystem timestamps). Includes a .model property to convert to the DataFile
         Pydantic model, as well as helper properties for stat_model, path_model, Path,
-        and summary. Provides freeze/unfreeze methods to toggle immutability.
+        and summary. Provides freeze/unfreeze methods to toggle immutability, and
+        bulk_copy_insert() to load many DataFile models through PostgreSQL COPY.
 
 - Pydantic models:
     - DataFile:
         A domain model representing a generic data file. Includes discriminator type ("data"),
         optional content, and all common file metadata (path/stat/tags/descriptions).
         Validates that the file path corresponds to a recognized data file type.
-        Provides JSON-oriented serialization for consistent API output.
+        Provides JSON-oriented serialization for consistent API output, plus .row
+        (entity column values) and .entity for persistence.
 
 Design notes:
 - .model property on the SQLAlchemy entity provides an immediate conversion to the Pydantic
     model for safe I/O layers.
 - Computed columns reduce duplication and ensure consistent derivation of metadata from
     JSON fields without requiring application-side recomputation.
-- The model_validator ensures only recognized data file types are represented by this model.
-- Equality and hashing on the entity are based on id and sha256 for reliable identity checks.
+- The model_validator ensures only recognized data file types are represented by this model;
+    trusted payloads skip it with context={"skip_fs_checks": True}, and entity reads skip
+    validation entirely (model_construct).
+- Equality and hashing on the entity are based on the primary key (id) only, so set/dict
+    operations never load another column.
+- tags is a native text[] with a GIN index (tags @> ARRAY['#foo']); frozen is a boolean.
+- path_json/stat_json are JSONB; path_json->>'parent' has an expression index so
+    directory listings do not scan the table.
+- select_summaries() loads only the columns list views need; eager_defaults fetches
+    computed/server-default columns with RETURNING at INSERT time.
+- stat_model, path_model, Path, and summary are cached per entity instance and dropped
+    whenever a column is set or the instance is expired/refreshed.
 """
 
 # endregion
 # region Imports
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Dict, Literal, Optional
-
-from pydantic import Field, model_serializer, model_validator
-from sqlalchemy import JSON, Computed, DateTime, Integer, String, Text, func
-from sqlalchemy.orm import Mapped, mapped_column
-
-from core.base import BaseFileModel, BaseFileStat, FilePath
-from core.database import Base
+from typing import Any, Dict, Literal, Optional, Sequence
+
+from pydantic import Field, ValidationInfo, model_serializer, model_validator
+from sqlalchemy import (
+    Boolean,
+    Computed,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    Text,
+    Select,
+    func,
+    select,
+    text,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.orm import Mapped, Session, load_only, mapped_column
+
+from core.base import _PLATFORM_STAT, BaseFileModel, BaseFileStat, FilePath
+from core.database import Base, copy_rows, invalidate_cached_properties
 from core.utils import is_data_file
 
+# endregion
+# region Constants
+_SUMMARY_COLUMNS = (
+    "id",
+    "sha256",
+    "path_json",
+    "mime_type",
+    "tags",
+    "short_description",
+    "long_description",
+)
+"""Columns read by the entity's .summary and .Path properties."""
+
 
 # endregion
 # region Sqlalchemy Model
@@ -69,6 +108,13 @@ class DataFileEntity(Base):
     """
 
     __tablename__ = "data_files"
+    __table_args__ = (
+        Index("ix_data_files_path_parent", text("(path_json->>'parent')")),
+        Index("ix_data_files_tags", "tags", postgresql_using="gin"),
+    )
+    # fetch server defaults/computed columns via RETURNING at INSERT time instead of
+    # a lazy SELECT on first access (e.g. .filename in __repr__)
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[str] = mapped_column(primary_key=True)
 
@@ -100,13 +146,13 @@ class DataFileEntity(Base):
 
     # Standard Columns
     sha256: Mapped[str] = mapped_column(String(64))
-    path_json: Mapped[Dict[str, Any]] = mapped_column(JSON)
-    stat_json: Mapped[Dict[str, Any]] = mapped_column(JSON)
+    path_json: Mapped[Dict[str, Any]] = mapped_column(JSONB)
+    stat_json: Mapped[Dict[str, Any]] = mapped_column(JSONB)
     mime_type: Mapped[Optional[str]] = mapped_column(String(100))
-    tags: Mapped[Optional[list[str]]] = mapped_column(String, nullable=True)
+    tags: Mapped[Optional[list[str]]] = mapped_column(ARRAY(String), nullable=True)
     short_description: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     long_description: Mapped[Optional[str]] = mapped_column(String, nullable=True)
-    frozen: Mapped[bool] = mapped_column(String, default=False, server_default="0")
+    frozen: Mapped[bool] = mapped_column(Boolean, default=False, server_default="0")
 
     # Text file specific column
     content: Mapped[str] = mapped_column(Text)
@@ -123,27 +169,29 @@ class DataFileEntity(Base):
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, DataFileEntity):
             return NotImplemented
-        return self.id == other.id and self.sha256 == other.sha256
+        return self.id == other.id
 
     def __hash__(self) -> int:
-        return hash((self.id, self.sha256))
+        return hash(self.id)
 
     @property
     def model(self) -> "DataFile":
-        """Return the Pydantic model representation of the data file."""
-        return DataFile.model_validate(
-            {
-                "type": "data",
-                "id": self.id,
-                "path_json": self.path_json,
-                "stat_json": self.stat_json,
-                "mime_type": self.mime_type,
-                "tags": self.tags,
-                "short_description": self.short_description,
-                "long_description": self.long_description,
-                "frozen": self.frozen,
-                "content": self.content,
-            }
+        """
+        Return the Pydantic model representation of the data file.
+
+        The row was validated when it was written, so the model is built with
+        model_construct() instead of being validated again.
+        """
+        return DataFile.model_construct(
+            path_json=FilePath.model_construct(**self.path_json),
+            stat_json=_PLATFORM_STAT.from_stat_json(self.stat_json),
+            sha256=self.sha256,
+            mime_type=self.mime_type,
+            tags=self.tags,
+            short_description=self.short_description,
+            long_description=self.long_description,
+            frozen=self.frozen,
+            content=self.content,
         )
 
     @property
@@ -164,22 +212,22 @@ class DataFileEntity(Base):
             "updated_at": self.updated_at,
         }
 
-    @property
+    @cached_property
     def stat_model(self) -> BaseFileStat:
         """Return the FileStat model representation of the file's stat_json."""
-        return BaseFileStat.model_validate(self.stat_json)
+        return _PLATFORM_STAT.from_stat_json(self.stat_json)
 
-    @property
+    @cached_property
     def path_model(self) -> FilePath:
         """Return the FilePath model representation of the file's path_json."""
         return FilePath.model_validate(self.path_json)
 
-    @property
+    @cached_property
     def Path(self) -> Path:
         """Return the pathlib.Path representation of the file's full path."""
         return self.path_model.Path
 
-    @property
+    @cached_property
     def summary(self) -> dict:
         """Return a summary dictionary of the DataFileEntity."""
         return {
@@ -189,9 +237,45 @@ class DataFileEntity(Base):
             "mimetype": self.mime_type or "unknown",
             "short_description": self.short_description or "",
             "long_description": self.long_description or "",
-            "tags": ", ".join(self.tags) if self.tags else "",
+            "tags": ", ".join(self.tags or ()),
         }
 
+    @classmethod
+    def select_summaries(cls, raiseload: bool = False) -> Select:
+        """
+        Build a SELECT that loads only the columns .summary and .Path need.
+
+        List views typically only render summaries; this leaves the large payload
+        and stat columns unloaded instead of pulling them for every row.
+
+        Args:
+            raiseload (bool): Make access to the unloaded columns raise instead of
+                lazily emitting a SELECT per row (useful in tests). DEFAULT: False
+
+        Returns:
+            Select: The statement, e.g. for session.scalars().
+        """
+        return select(cls).options(
+            load_only(
+                *(getattr(cls, name) for name in _SUMMARY_COLUMNS), raiseload=raiseload
+            )
+        )
+
+    @classmethod
+    def bulk_copy_insert(cls, session: Session, files: Sequence["DataFile"]) -> None:
+        """
+        Insert many DataFile models in one round-trip.
+
+        Batches larger than core.database.COPY_THRESHOLD are streamed with
+        PostgreSQL COPY; smaller ones use a single multi-row INSERT. The computed
+        columns are left to the database. The caller owns the transaction.
+
+        Args:
+            session (Session): The session to insert with.
+            files (Sequence[DataFile]): The models to insert.
+        """
+        copy_rows(session, cls.__table__, [file.row for file in files])
+
     def freeze(self) -> None:
         """Mark the file as frozen (immutable)."""
         self.frozen = True
@@ -201,6 +285,11 @@ class DataFileEntity(Base):
         self.frozen = False
 
 
+invalidate_cached_properties(
+    DataFileEntity, "stat_model", "path_model", "Path", "summary"
+)
+
+
 # endregion
 # region Pydantic Model
 class DataFile(BaseFileModel):
@@ -240,13 +329,18 @@ class DataFile(BaseFileModel):
         return instance
 
     @model_validator(mode="after")
-    def validate_content_data_type(self) -> "DataFile":
+    def validate_content_data_type(self, info: ValidationInfo) -> "DataFile":
         """
-        Validates and converts the content to a string if it's a DataFrame.
+        Validates that the path is a recognized data file type.
+
+        Skipped when validating with ``context={"skip_fs_checks": True}``, for
+        payloads already checked on write (e.g. rows from our own database).
 
         Returns:
             DataFile: The validated DataFile instance.
         """
+        if info.context and info.context.get("skip_fs_checks"):
+            return self
         if not is_data_file(self.path_json.Path):
             raise ValueError(
                 f"The file at {self.path_json.Path} is not a recognized data file type."
@@ -255,11 +349,31 @@ class DataFile(BaseFileModel):
 
     @model_serializer(when_used="json")
     def serialize_model(self) -> dict:
+        # extend the base dict in place rather than copying it into a new one
+        data = super().serialize_model()
+        data["content"] = self.content
+        return data
+
+    @property
+    def row(self) -> dict[str, Any]:
+        """Return the DataFileEntity column values, e.g. for a bulk INSERT."""
         return {
-            **super().serialize_model(),
-            "content": self.content,
+            "id": self.id,
+            "sha256": self.sha256,
+            "path_json": self.path_json.model_dump(),
+            "stat_json": self.stat_json.model_dump(),
+            "mime_type": self.mime_type,
+            "tags": self.tags,
+            "short_description": self.short_description,
+            "long_description": self.long_description,
+            "frozen": self.frozen,
+            "content": self.content if self.content is not None else "",
         }
 
+    @property
+    def entity(self) -> DataFileEntity:
+        return DataFileEntity(**self.row)
+
 
 # endregion
 
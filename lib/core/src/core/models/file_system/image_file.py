@@ -14,22 +14,33 @@ Overview:
 Contents:
 - SQLAlchemy entities:
     - ImageFileEntity:
-        Persists an image file with path/stat metadata (as JSON), SHA256 hash, base64 encoded
-        image data, thumbnail data, and EXIF metadata. Several columns are computed from JSON
+        Persists an image file with path/stat metadata (as JSON), SHA256 hash, and EXIF
+        metadata; the image bytes hang off the .blob relationship. Several columns are computed from JSON
         fields (e.g., filename, extension, size_bytes, modified_at_fs). Includes a .model
         property to convert to the ImageFile Pydantic model and convenience properties for
         accessing stat/path models (.stat_model, .path_model, .Path). Provides .summary for
         quick metadata access and .freeze()/.unfreeze() methods for immutability toggling.
+        bulk_copy_insert() loads many ImageFile models through PostgreSQL COPY.
+    - ImageFileBlobEntity:
+        Holds the raw image and thumbnail bytes of an ImageFileEntity (same id) in the
+        separate image_files_blobs table, so metadata queries never read them. The
+        relationship is lazy="raise"; load it with selectinload(ImageFileEntity.blob).
+        .model and .dict read it through .loaded_blob, so on rows loaded without the
+        blob they leave the image bytes as None instead of raising.
 
 - Pydantic models:
     - ImageFile:
-        A domain model extending BaseFileModel representing an image file. Includes base64
-        encoded data for both the full image (b64_data) and thumbnail (thumbnail_b64_data),
-        EXIF metadata (exif_data), format information (fmt), and NSFW flag (is_nsfw).
-        The populate() method handles reading image files, extracting EXIF data, generating
-        thumbnails, and encoding to base64. Provides helper properties for generating
+        A domain model extending BaseFileModel representing an image file. Includes the raw
+        bytes of both the full image (b64_data) and thumbnail (thumbnail_b64_data), which
+        are base64 encoded only at the JSON boundary and in the tag helpers, plus EXIF
+        metadata (exif_data), format information (fmt), and NSFW flag (is_nsfw).
+        The populate() method handles reading image files, extracting EXIF data, and
+        generating thumbnails. Provides helper properties for generating
         HTML/Markdown image tags (html_thumbnail_tag, md_thumbnail_tag, html_img_tag,
-        md_img_tag) and an .entity property for SQLAlchemy conversion.
+        md_img_tag), .row/.blob_row properties holding the entity column values for
+        bulk INSERTs, and an .entity property for SQLAlchemy conversion. populate_many()
+        fans populate() out over a process pool and yields batches of models;
+        populate_batch() does the same on a thread pool and returns a list.
 
 - Scan Result models:
     - ImageScanResult:
@@ -43,13 +54,30 @@ Design notes:
 - .model properties on SQLAlchemy entities provide an immediate conversion to Pydantic
     models for safe I/O layers.
 - The ImageFile.populate() method handles reading image files, extracting EXIF data,
-    generating thumbnails (default 512x512), and encoding to base64.
+    and generating thumbnails (default 512x512).
+- Image and thumbnail data are kept as raw bytes (BYTEA in the database); the b64_data
+    field names are kept for API compatibility, and JSON input/output of those fields is
+    still base64.
 - Computed columns in ImageFileEntity reduce duplication and ensure consistent derivation
     of metadata from JSON fields without requiring application-side recomputation.
+- path_json/stat_json/exif_data are JSONB; path_json->>'parent' has an expression index
+    and exif_data a jsonb_path_ops GIN index for containment (@>) queries.
+- select_summaries() loads only the columns list views need; eager_defaults fetches
+    computed/server-default columns with RETURNING at INSERT time.
+- Equality and hashing on the entity are based on the primary key (id) only, matching
+    DataFileEntity, so set/dict operations never load another column.
+- stat_model, path_model, Path, and summary are cached per entity instance and dropped
+    whenever a column is set or the instance is expired/refreshed.
+- The full image is stored as the file's own bytes (no decode/re-encode). Thumbnails
+    use pyvips (shrink-on-load) when the optional "speedups" extra and libvips are
+    installed, and PIL otherwise.
 - Thumbnail generation maintains aspect ratio and handles transparency for images with
     alpha channels (RGBA, LA, or P mode with transparency).
-- EXIF data extraction handles various byte encodings (UTF-8, unicode_escape, latin-1)
-    with graceful fallback.
+- Image tags link to AppSettings.image_serve_url ({url}/{id}, {url}/{id}/thumbnail)
+    when CNTRLR_IMAGE_SERVE_URL is set, so large images are not base64 encoded into
+    the markup; without it they embed data URIs as before.
+- EXIF tag ids are mapped to names and byte values decoded as UTF-8 (undecodable bytes
+    dropped) in a single pass.
 - Tag validation (inherited from BaseFileModel) ensures lowercase, dash-separated,
     hash-prefixed format for consistency.
 """
@@ -57,23 +85,82 @@ Design notes:
 # endregion
 # region Imports
 import base64
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from functools import cached_property
 from io import BytesIO
+from itertools import repeat
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Union,
+)
 
 from PIL import ExifTags, Image
-from pydantic import Field, field_validator, model_serializer
-from sqlalchemy import JSON, Boolean, Computed, DateTime, Integer, String, Text, func
-from sqlalchemy.orm import Mapped, mapped_column
+
+try:
+    import pyvips
+except (ImportError, OSError):  # optional speedup (needs libvips), see "speedups"
+    pyvips = None
+from pydantic import (
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    field_validator,
+    model_serializer,
+)
+from sqlalchemy import (
+    Boolean,
+    Computed,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+    Select,
+    func,
+    inspect,
+    select,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, Session, load_only, mapped_column, relationship
 
 from core.base import (
+    _PLATFORM_STAT,
     BaseFileModel,
     BaseFileStat,
     BaseScanResult,
     FilePath,
 )
-from core.database import Base
+from core.config import AppSettings, get_settings
+from core.database import Base, copy_rows, invalidate_cached_properties
+
+# endregion
+# region Constants
+_EXIF_TAG_NAMES: dict[int, str] = ExifTags.TAGS
+"""EXIF tag id to tag name lookup."""
+
+_SUMMARY_COLUMNS = (
+    "id",
+    "sha256",
+    "path_json",
+    "mime_type",
+    "tags",
+    "short_description",
+    "long_description",
+)
+"""Columns read by the entity's .summary and .Path properties."""
 
 
 # endregion
@@ -93,14 +180,26 @@ class ImageFileEntity(Base):
         long_description (Optional[str]): Long description of the image file.
         frozen (bool): Indicates if the file is frozen (immutable).
         fmt (Optional[str]): Format of the image (e.g., 'JPEG', 'PNG').
-        b64_data (str): Base64 encoded image data.
-        thumbnail_b64_data (Optional[str]): Base64 encoded thumbnail image data.
+        blob (ImageFileBlobEntity): The image/thumbnail bytes, kept in a separate table.
+            Not loaded by default: use selectinload(ImageFileEntity.blob).
         exif_data (Dict[str, Any]): EXIF metadata of the image.
         created_at (datetime): Timestamp when the record was created.
         updated_at (datetime): Timestamp when the record was last updated.
     """
 
     __tablename__ = "image_files"
+    __table_args__ = (
+        Index("ix_image_files_path_parent", text("(path_json->>'parent')")),
+        Index(
+            "ix_image_files_exif_gin",
+            "exif_data",
+            postgresql_using="gin",
+            postgresql_ops={"exif_data": "jsonb_path_ops"},
+        ),
+    )
+    # fetch server defaults/computed columns via RETURNING at INSERT time instead of
+    # a lazy SELECT on first access (e.g. .filename in __repr__)
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[str] = mapped_column(primary_key=True)
 
@@ -123,21 +222,25 @@ class ImageFileEntity(Base):
 
     # Standard Columns
     sha256: Mapped[str] = mapped_column(String(64))
-    path_json: Mapped[Dict[str, Any]] = mapped_column(JSON)
-    stat_json: Mapped[Dict[str, Any]] = mapped_column(JSON)
+    path_json: Mapped[Dict[str, Any]] = mapped_column(JSONB)
+    stat_json: Mapped[Dict[str, Any]] = mapped_column(JSONB)
     mime_type: Mapped[Optional[str]] = mapped_column(String(100))
-    tags: Mapped[Optional[list[str]]] = mapped_column(JSON, default=None)
+    tags: Mapped[Optional[list[str]]] = mapped_column(JSONB, default=None)
     short_description: Mapped[Optional[str]] = mapped_column(Text, default=None)
     long_description: Mapped[Optional[str]] = mapped_column(Text, default=None)
     frozen: Mapped[bool] = mapped_column(Boolean, default=False, server_default="0")
 
     # Image Specific
     fmt: Mapped[Optional[str]] = mapped_column(String(10))
-    b64_data: Mapped[str] = mapped_column(Text)
-    thumbnail_b64_data: Mapped[Optional[str]] = mapped_column(Text)
-    exif_data: Mapped[Dict[str, Any]] = mapped_column(JSON, default=dict)
+    exif_data: Mapped[Dict[str, Any]] = mapped_column(JSONB, default=dict)
     is_nsfw: Mapped[bool] = mapped_column(Boolean, default=False, server_default="0")
 
+    # Image payloads live in image_files_blobs so metadata scans never touch them;
+    # accessing .blob without selectinload(ImageFileEntity.blob) raises.
+    blob: Mapped[Optional["ImageFileBlobEntity"]] = relationship(
+        lazy="raise", cascade="all, delete-orphan", passive_deletes=True
+    )
+
     # DB Record Timestamps
     created_at: Mapped[datetime] = mapped_column(server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
@@ -151,36 +254,49 @@ class ImageFileEntity(Base):
         if not isinstance(other, ImageFileEntity):
             return NotImplemented
 
-        return self.sha256 == other.sha256
+        return self.id == other.id
 
     def __hash__(self) -> int:
-        return hash(self.sha256)
+        return hash(self.id)
 
     @property
     def model(self) -> "ImageFile":
-        """Return the Pydantic model representation of the image file."""
-        return ImageFile.model_validate(
-            {
-                "type": "image",
-                "id": self.id,
-                "path_json": self.path_json,
-                "stat_json": self.stat_json,
-                "mime_type": self.mime_type,
-                "tags": self.tags,
-                "short_description": self.short_description,
-                "long_description": self.long_description,
-                "frozen": self.frozen,
-                "fmt": self.fmt,
-                "b64_data": self.b64_data,
-                "thumbnail_b64_data": self.thumbnail_b64_data,
-                "exif_data": self.exif_data,
-                "is_nsfw": self.is_nsfw,
-            }
+        """
+        Return the Pydantic model representation of the image file.
+
+        The row was validated when it was written, so the model is built with
+        model_construct() instead of being validated again. The image bytes are
+        only filled in when the blob is loaded (selectinload(ImageFileEntity.blob));
+        otherwise b64_data and thumbnail_b64_data are None.
+        """
+        blob = self.loaded_blob
+        return ImageFile.model_construct(
+            path_json=FilePath.model_construct(**self.path_json),
+            stat_json=_PLATFORM_STAT.from_stat_json(self.stat_json),
+            sha256=self.sha256,
+            mime_type=self.mime_type,
+            tags=self.tags,
+            short_description=self.short_description,
+            long_description=self.long_description,
+            frozen=self.frozen,
+            fmt=self.fmt,
+            b64_data=blob.b64_data if blob else None,
+            thumbnail_b64_data=blob.thumbnail_b64_data if blob else None,
+            exif_data=self.exif_data,
+            is_nsfw=self.is_nsfw,
         )
 
+    @property
+    def loaded_blob(self) -> Optional["ImageFileBlobEntity"]:
+        """The blob if it is loaded or was set here, else None; never emits a query."""
+        if "blob" in inspect(self).unloaded:
+            return None
+        return self.blob
+
     @property
     def dict(self) -> dict[str, Any]:
-        """Return a dictionary representation of the ImageFileEntity."""
+        """Return a dictionary representation (image bytes only if the blob is loaded)."""
+        blob = self.loaded_blob
         return {
             "id": self.id,
             "sha256": self.sha256,
@@ -192,30 +308,30 @@ class ImageFileEntity(Base):
             "long_description": self.long_description,
             "frozen": self.frozen,
             "fmt": self.fmt,
-            "b64_data": self.b64_data,
-            "thumbnail_b64_data": self.thumbnail_b64_data,
+            "b64_data": blob.b64_data if blob else None,
+            "thumbnail_b64_data": blob.thumbnail_b64_data if blob else None,
             "exif_data": self.exif_data,
             "is_nsfw": self.is_nsfw,
             "created_at": self.created_at,
             "updated_at": self.updated_at,
         }
 
-    @property
+    @cached_property
     def stat_model(self) -> BaseFileStat:
         """Return the FileStat model representation of the file's stat_json."""
-        return BaseFileStat.model_validate(self.stat_json)
+        return _PLATFORM_STAT.from_stat_json(self.stat_json)
 
-    @property
+    @cached_property
     def path_model(self) -> FilePath:
         """Return the FilePath model representation of the file's path_json."""
         return FilePath.model_validate(self.path_json)
 
-    @property
+    @cached_property
     def Path(self) -> Path:
         """Return the pathlib.Path representation of the file's full path."""
         return self.path_model.Path
 
-    @property
+    @cached_property
     def summary(self) -> dict:
         """Return a summary dictionary of the DataFileEntity."""
         return {
@@ -225,9 +341,48 @@ class ImageFileEntity(Base):
             "mimetype": self.mime_type or "unknown",
             "short_description": self.short_description or "",
             "long_description": self.long_description or "",
-            "tags": ", ".join(self.tags) if self.tags else "",
+            "tags": ", ".join(self.tags or ()),
         }
 
+    @classmethod
+    def select_summaries(cls, raiseload: bool = False) -> Select:
+        """
+        Build a SELECT that loads only the columns .summary and .Path need.
+
+        List views typically only render summaries; this leaves the large payload
+        and stat columns unloaded instead of pulling them for every row.
+
+        Args:
+            raiseload (bool): Make access to the unloaded columns raise instead of
+                lazily emitting a SELECT per row (useful in tests). DEFAULT: False
+
+        Returns:
+            Select: The statement, e.g. for session.scalars().
+        """
+        return select(cls).options(
+            load_only(
+                *(getattr(cls, name) for name in _SUMMARY_COLUMNS), raiseload=raiseload
+            )
+        )
+
+    @classmethod
+    def bulk_copy_insert(cls, session: Session, files: Sequence["ImageFile"]) -> None:
+        """
+        Insert many ImageFile models in one round-trip.
+
+        Batches larger than core.database.COPY_THRESHOLD are streamed with
+        PostgreSQL COPY; smaller ones use a single multi-row INSERT. The computed
+        columns are left to the database. The caller owns the transaction.
+
+        Args:
+            session (Session): The session to insert with.
+            files (Sequence[ImageFile]): The models to insert.
+        """
+        copy_rows(session, cls.__table__, [file.row for file in files])
+        copy_rows(
+            session, ImageFileBlobEntity.__table__, [file.blob_row for file in files]
+        )
+
     def freeze(self) -> None:
         """Mark the file as frozen (immutable)."""
         self.frozen = True
@@ -237,6 +392,36 @@ class ImageFileEntity(Base):
         self.frozen = False
 
 
+invalidate_cached_properties(
+    ImageFileEntity, "stat_model", "path_model", "Path", "summary"
+)
+
+
+class ImageFileBlobEntity(Base):
+    """
+    The image payloads of an ImageFileEntity, one row per image.
+
+    Kept out of image_files so listing and index scans on the metadata never pull
+    the (TOASTed) image bytes, and the metadata table can be COPYed without them.
+
+    Attributes:
+        id (str): Primary key; also the id of the owning image_files row.
+        b64_data (bytes): Raw image data.
+        thumbnail_b64_data (Optional[bytes]): Raw thumbnail image data.
+    """
+
+    __tablename__ = "image_files_blobs"
+
+    id: Mapped[str] = mapped_column(
+        ForeignKey("image_files.id", ondelete="CASCADE"), primary_key=True
+    )
+    b64_data: Mapped[bytes] = mapped_column(LargeBinary)
+    thumbnail_b64_data: Mapped[Optional[bytes]] = mapped_column(LargeBinary)
+
+    def __repr__(self) -> str:
+        return f"<ImageFileBlob(id={self.id})>"
+
+
 # endregion
 # region Pydantic Model
 class ImageFile(BaseFileModel):
@@ -253,19 +438,21 @@ class ImageFile(BaseFileModel):
         short_description (Optional[str]): A short description of the file.
         long_description (Optional[str]): A long description of the file.
         frozen (bool): Indicates if the file is frozen (immutable).
-        b64_data (Optional[str]): Base64 encoded string of the full image.
-        thumbnail_b64_data (Optional[str]): Base64 encoded string of the thumbnail image.
+        b64_data (Optional[bytes]): Raw bytes of the full image (base64 in JSON).
+        thumbnail_b64_data (Optional[bytes]): Raw bytes of the thumbnail image (base64 in JSON).
         exif_data (dict[str, Any]): EXIF metadata extracted from the image.
         fmt (Optional[str]): The image format (e.g., 'jpeg', 'png').
         is_nsfw (Optional[bool]): Flag indicating if the image is NSFW. DEFAULT: False
     """
 
+    model_config = ConfigDict(ser_json_bytes="base64", val_json_bytes="base64")
+
     type: Literal["image"] = "image"
-    b64_data: Optional[str] = Field(
-        None, description="Base64 encoded string of the full image"
+    b64_data: Optional[bytes] = Field(
+        None, description="Raw bytes of the full image (base64 encoded in JSON)"
     )
-    thumbnail_b64_data: Optional[str] = Field(
-        None, description="Base64 encoded string of the thumbnail image"
+    thumbnail_b64_data: Optional[bytes] = Field(
+        None, description="Raw bytes of the thumbnail image (base64 encoded in JSON)"
     )
     exif_data: dict[str, Any] = Field(
         {}, description="EXIF metadata extracted from the image"
@@ -277,80 +464,70 @@ class ImageFile(BaseFileModel):
         False, description="Flag indicating if the image is NSFW. DEFAULT: False"
     )
 
+    @field_validator("b64_data", "thumbnail_b64_data", mode="before")
+    def validate_image_bytes(cls, v: Union[bytes, str, None]) -> Optional[bytes]:
+        """Accept base64 text (the JSON and pre-BYTEA form) as well as raw bytes."""
+        if isinstance(v, str):
+            # pydantic emits URL-safe base64; older rows use the standard alphabet
+            return base64.b64decode(v, altchars=b"-_")
+        return v
+
     @classmethod
-    def populate(cls, file_path: Path, thumbnail_size: tuple = (512, 512)) -> None:
+    def populate(
+        cls, file_path: Path, thumbnail_size: tuple = (512, 512)
+    ) -> "ImageFile":
         """
-        Populate the model attributes based on the given image file path.
+        Create a new ImageFile populated from the given image file path.
 
         Args:
             file_path (Path): The path to the image file.
             thumbnail_size (tuple): Size of the thumbnail to generate. DEFAULT: (512, 512)
 
         Returns:
-            None
+            ImageFile: A new instance; the class itself is never modified, so
+                concurrent calls are safe.
         """
         instance = super().populate(file_path)
 
         try:
-            img = Image.open(file_path)
+            # keep the file's own bytes; re-encoding them would only lose fidelity
+            b64_data = file_path.read_bytes()
+            img = Image.open(BytesIO(b64_data))
             fmt = img.format.lower() if img.format else "unknown"
 
-            # Encode full image to base64
-            buffered = BytesIO()
-            img.save(buffered, format=img.format)
-            b64_data = base64.b64encode(buffered.getvalue()).decode("utf-8")
-
-            # copy the image for modifications
-            img_copy = img.copy()
-
-            # shrink the copy to fit longest side to thumbnail_size while maintaining aspect ratio
-            img_copy.thumbnail(thumbnail_size)
-
-            # fill the background with transparency if image has alpha channel
-            if img_copy.mode in ("RGBA", "LA") or (
-                img_copy.mode == "P" and "transparency" in img_copy.info
-            ):
-                background = Image.new("RGBA", img_copy.size, (255, 255, 255, 0))
-                background.paste(
-                    img_copy, mask=img_copy.split()[3]
-                )  # 3 is the alpha channel
-                img_copy = background
-            else:
-                img_copy = img_copy.convert("RGB")
-            # Encode thumbnail to base64
-            thumb_buffered = BytesIO()
-            img_copy.save(thumb_buffered, format=img.format)
-            thumbnail_b64_data = base64.b64encode(thumb_buffered.getvalue()).decode(
-                "utf-8"
-            )
-            try:
-                exif = img.getexif()
-                if exif:
-                    exif_data = {
-                        ExifTags.TAGS.get(tag, tag): value
-                        for tag, value in exif.items()
-                    }
-                    # Some exif values are bytes, decode them if possible
-                    for key, value in exif_data.items():
-                        if isinstance(value, bytes):
-                            try:
-                                exif_data[key] = value.decode("utf-8", errors="ignore")
-                            except Exception:
-                                try:
-                                    # I know some of them use unicode encoding
-                                    exif_data[key] = value.decode(
-                                        "unicode_escape", errors="ignore"
-                                    )
-                                except Exception:
-                                    # try latin-1 as last resort
-                                    try:
-                                        exif_data[key] = value.decode(
-                                            "latin-1", errors="ignore"
-                                        )
-                                    except Exception:
-                                        continue
+            thumbnail_b64_data = _vips_thumbnail(b64_data, thumbnail_size, fmt)
+            if thumbnail_b64_data is None:
+                if img.format == "JPEG":
+                    # decode at a reduced DCT scale, keeping 2x headroom like
+                    # Image.thumbnail's own reducing_gap, instead of full size
+                    img.draft(img.mode, (thumbnail_size[0] * 2, thumbnail_size[1] * 2))
+                # copy the image for modifications
+                img_copy = img.copy()
+
+                # shrink the copy to fit longest side to thumbnail_size while maintaining aspect ratio
+                img_copy.thumbnail(thumbnail_size)
+
+                # fill the background with transparency if image has alpha channel
+                if img_copy.mode in ("RGBA", "LA") or (
+                    img_copy.mode == "P" and "transparency" in img_copy.info
+                ):
+                    img_copy = img_copy.convert("RGBA")
+                    background = Image.new("RGBA", img_copy.size, (255, 255, 255, 0))
+                    # getchannel() builds only the alpha band; split() built all four
+                    background.paste(img_copy, mask=img_copy.getchannel("A"))
+                    img_copy = background
                 else:
-                    exif_data = {}
+                    img_copy = img_copy.convert("RGB")
+                # Encode thumbnail
+                thumb_buffered = BytesIO()
+                img_copy.save(thumb_buffered, format=img.format)
+                thumbnail_b64_data = thumb_buffered.getvalue()
+            exif_data = {}
+            try:
+                exif_data = {
+                    _EXIF_TAG_NAMES.get(tag, tag): _exif_value(value)
+                    for tag, value in img.getexif().items()
+                }
             except Exception as e:
                 print(f"Error processing image file {file_path}: {e}")
             instance.fmt = fmt
@@ -361,6 +538,28 @@ class ImageFile(BaseFileModel):
             raise ValueError(f"Error processing image file {file_path}: {e}")
         return instance
 
+    def _src(self, data: Optional[bytes], thumbnail: bool = False) -> Optional[str]:
+        """
+        Resolve the src attribute for an image tag.
+
+        Links to the configured image serve URL (AppSettings.image_serve_url) when one is
+        set, and falls back to an inline base64 data URI otherwise.
+
+        Args:
+            data (Optional[bytes]): Image bytes to inline when no serve URL is set.
+            thumbnail (bool): Whether the src refers to the thumbnail.
+
+        Returns:
+            Optional[str]: The src value, or None if no image data is available.
+        """
+        if not data or not self.fmt:
+            return None
+        serve_url = get_settings(AppSettings).image_serve_url
+        if serve_url:
+            src = f"{serve_url.rstrip('/')}/{self.id}"
+            return f"{src}/thumbnail" if thumbnail else src
+        return f"data:image/{self.fmt};base64,{_b64(data)}"
+
     @property
     def html_thumbnail_tag(self) -> Optional[str]:
         """
@@ -369,9 +568,8 @@ class ImageFile(BaseFileModel):
         Returns:
             Optional[str]: HTML img tag string if thumbnail data is available, else None.
         """
-        if self.thumbnail_b64_data and self.fmt:
-            return f'<img src="data:image/{self.fmt};base64,{self.thumbnail_b64_data}" alt="Thumbnail"/>'
-        return None
+        src = self._src(self.thumbnail_b64_data, thumbnail=True)
+        return f'<img src="{src}" alt="Thumbnail"/>' if src else None
 
     @property
     def md_thumbnail_tag(self) -> Optional[str]:
@@ -381,11 +579,8 @@ class ImageFile(BaseFileModel):
         Returns:
             Optional[str]: Markdown image tag string if thumbnail data is available, else None.
         """
-        if self.thumbnail_b64_data and self.fmt:
-            return (
-                f"![Thumbnail](data:image/{self.fmt};base64,{self.thumbnail_b64_data})"
-            )
-        return None
+        src = self._src(self.thumbnail_b64_data, thumbnail=True)
+        return f"![Thumbnail]({src})" if src else None
 
     @property
     def html_img_tag(self) -> Optional[str]:
@@ -395,11 +590,8 @@ class ImageFile(BaseFileModel):
         Returns:
             Optional[str]: HTML img tag string if image data is available, else None.
         """
-        if self.b64_data and self.fmt:
-            return (
-                f'<img src="data:image/{self.fmt};base64,{self.b64_data}" alt="Image"/>'
-            )
-        return None
+        src = self._src(self.b64_data)
+        return f'<img src="{src}" alt="Image"/>' if src else None
 
     @property
     def md_img_tag(self) -> Optional[str]:
@@ -409,28 +601,165 @@ class ImageFile(BaseFileModel):
         Returns:
             Optional[str]: Markdown image tag string if image data is available, else None.
         """
-        if self.b64_data and self.fmt:
-            return f"![Image](data:image/{self.fmt};base64,{self.b64_data})"
-        return None
+        src = self._src(self.b64_data)
+        return f"![Image]({src})" if src else None
+
+    @classmethod
+    def populate_batch(
+        cls,
+        paths: Iterable[Path],
+        thumbnail_size: tuple = (512, 512),
+        workers: int = 8,
+        on_error: Optional[Callable[[Path, str], None]] = None,
+    ) -> List["ImageFile"]:
+        """
+        Populate image files on a thread pool.
+
+        PIL and libvips release the GIL while decoding and resizing, so threads
+        overlap that work without the process start-up and pickling costs of
+        populate_many(). Prefer populate_many() for very large scans.
+
+        Args:
+            paths (Iterable[Path]): The image file paths to populate.
+            thumbnail_size (tuple): Size of the thumbnails to generate. DEFAULT: (512, 512)
+            workers (int): Number of worker threads. DEFAULT: 8
+            on_error (Optional[Callable[[Path, str], None]]): Called with the path and
+                error message of every image that could not be populated.
+
+        Returns:
+            List[ImageFile]: The populated image files, in input order.
+        """
+        paths = list(paths)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_populate_one, paths, repeat(thumbnail_size)))
+        images: List[ImageFile] = []
+        for path, result in zip(paths, results):
+            if isinstance(result, str):
+                if on_error is not None:
+                    on_error(path, result)
+                continue
+            images.append(result)
+        return images
+
+    @classmethod
+    def populate_many(
+        cls,
+        paths: Iterable[Path],
+        thumbnail_size: tuple = (512, 512),
+        batch_size: int = 500,
+        max_workers: Optional[int] = None,
+        on_error: Optional[Callable[[Path, str], None]] = None,
+    ) -> Iterator[List["ImageFile"]]:
+        """
+        Populate many image files in a process pool, yielding them in batches.
+
+        Decoding and thumbnailing are CPU-bound, so the work is spread across
+        worker processes. Each yielded batch is meant to be written with a single
+        bulk INSERT (see .row). Batches hold the full image data, so keep
+        batch_size modest.
+
+        Args:
+            paths (Iterable[Path]): The image file paths to populate.
+            thumbnail_size (tuple): Size of the thumbnails to generate. DEFAULT: (512, 512)
+            batch_size (int): Maximum number of models per yielded batch. DEFAULT: 500
+            max_workers (Optional[int]): Number of worker processes. DEFAULT: os.cpu_count()
+            on_error (Optional[Callable[[Path, str], None]]): Called with the path and
+                error message of every image that could not be populated.
+
+        Yields:
+            List[ImageFile]: Batches of populated image files, in input order.
+        """
+        paths = list(paths)
+        batch: List[ImageFile] = []
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(
+                _populate_one, paths, repeat(thumbnail_size), chunksize=64
+            )
+            for path, result in zip(paths, results):
+                if isinstance(result, str):
+                    if on_error is not None:
+                        on_error(path, result)
+                    continue
+                batch.append(result)
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+        if batch:
+            yield batch
+
+    @property
+    def row(self) -> dict[str, Any]:
+        """Return the ImageFileEntity column values, e.g. for a bulk INSERT."""
+        return {
+            "id": self.id,
+            "sha256": self.sha256,
+            "path_json": self.path_json.model_dump(),
+            "stat_json": self.stat_json.model_dump(),
+            "mime_type": self.mime_type,
+            "tags": self.tags,
+            "short_description": self.short_description,
+            "long_description": self.long_description,
+            "frozen": self.frozen,
+            "fmt": self.fmt,
+            "exif_data": self.exif_data,
+            "is_nsfw": self.is_nsfw if self.is_nsfw is not None else False,
+        }
+
+    @property
+    def blob_row(self) -> dict[str, Any]:
+        """Return the ImageFileBlobEntity column values, e.g. for a bulk INSERT."""
+        return {
+            "id": self.id,
+            "b64_data": self.b64_data if self.b64_data is not None else b"",
+            "thumbnail_b64_data": self.thumbnail_b64_data,
+        }
 
     @property
     def entity(self) -> ImageFileEntity:
-        return ImageFileEntity(
-            id=self.id,
-            sha256=self.sha256,
-            path_json=self.path_json,
-            stat_json=self.stat_json,
-            mime_type=self.mime_type,
-            tags=self.tags,
-            short_description=self.short_description,
-            long_description=self.long_description,
-            frozen=self.frozen,
-            fmt=self.fmt,
-            b64_data=self.b64_data if self.b64_data is not None else "",
-            thumbnail_b64_data=self.thumbnail_b64_data,
-            exif_data=self.exif_data,
-            is_nsfw=self.is_nsfw if self.is_nsfw is not None else False,
+        return ImageFileEntity(**self.row, blob=ImageFileBlobEntity(**self.blob_row))
+
+
+def _exif_value(value: Any) -> Any:
+    """Decode a byte-valued EXIF entry to text; other values pass through."""
+    if isinstance(value, bytes):
+        return value.decode("utf-8", errors="ignore")
+    return value
+
+
+def _b64(data: bytes) -> str:
+    """Base64 encode image bytes for a data: URI."""
+    return base64.b64encode(data).decode("ascii")
+
+
+def _vips_thumbnail(data: bytes, thumbnail_size: tuple, fmt: str) -> Optional[bytes]:
+    """
+    Thumbnail encoded image bytes with libvips, if it is installed.
+
+    libvips shrinks on load (e.g. JPEG DCT scaling) instead of decoding the full
+    resolution image first. Returns None when pyvips is unavailable or cannot
+    handle the format, so the caller falls back to PIL.
+    """
+    if pyvips is None:
+        return None
+    try:
+        thumb = pyvips.Image.thumbnail_buffer(
+            data, thumbnail_size[0], height=thumbnail_size[1]
         )
+        return thumb.write_to_buffer(f".{fmt}")
+    except pyvips.Error:
+        return None
+
+
+def _populate_one(file_path: Path, thumbnail_size: tuple) -> Union[ImageFile, str]:
+    """Populate one image in a populate_many() worker; errors come back as text."""
+    try:
+        return ImageFile.populate(file_path, thumbnail_size)
+    except Exception as e:
+        return str(e)
+
+
+_FILES_ADAPTER = TypeAdapter(List[ImageFile])
+"""Dumps a whole list of ImageFile models in one pydantic-core call."""
 
 
 # endregion
@@ -447,6 +776,8 @@ class ImageScanResult(BaseScanResult):
         files (List[ImageFileModel]): List of image files found during the scan.
     """
 
+    model_config = ConfigDict(ser_json_bytes="base64")
+
     mode: Literal["image"] = "image"
     files: List[ImageFile] = Field(
         default_factory=list, description="List of image files found during the scan"
@@ -460,14 +791,22 @@ class ImageScanResult(BaseScanResult):
             return [ImageFile.model_validate(item) for item in v]
         return v
 
+    def scanned_files(self) -> List[ImageFile]:
+        return self.files
+
     @model_serializer(when_used="json")
     def serialize_model(self) -> dict:
-        return {
-            **super().serialize_model(),
-            "files": [file.model_dump() for file in self.files],
-        }
+        # extend the base dict in place rather than copying it into a new one
+        data = super().serialize_model()
+        data["files"] = _FILES_ADAPTER.dump_python(self.files)
+        return data
 
 
 # endregion
 
-__all__ = ["ImageFileEntity", "ImageFile", "ImageScanResult"]
+__all__ = [
+    "ImageFileEntity",
+    "ImageFileBlobEntity",
+    "ImageFile",
+    "ImageScanResult",
+]
@@ -22,29 +22,113 @@ Contents:
     - SQLiteFile:
         A domain model representing a SQLite database file. Extends BaseFileModel with
         SQLite-specific attributes: tables (list of table names) and schema (DDL string).
-        Includes validators and serializers for consistent API output.
+        Includes serializers for consistent API output.
 
 Design notes:
 - .model property on the SQLAlchemy entity provides immediate conversion to the Pydantic
-    model for safe I/O layers.
+    model for safe I/O layers; rows were validated when written, so it uses
+    model_construct() instead of validating again.
 - Computed columns reduce duplication and ensure consistent derivation of metadata from
     JSON fields without requiring application-side recomputation.
-- Pydantic validators ensure type safety for SQLite-specific fields (e.g., tables list).
+- extension and size_bytes share one composite (extension, size_bytes) index, which
+    serves both extension filters and "by extension, ordered by size" listings.
+- path_json/stat_json/tags/tables are JSONB. tags has a GIN index and path_json a
+    jsonb_path_ops GIN index for containment (@>) queries.
+- schema, stat_json, and tables, which list views (summary, summaries_from_rows())
+    never read, are deferred in the "heavy" group. .model, .dict, and as_dicts() do
+    read them; select_details() adds options(undefer_group("heavy")) so detail reads
+    load them in the same SELECT rather than one lazy SELECT per row.
+- SQLiteFile.dump_many_json() serializes a list through one module-level TypeAdapter
+    instead of one model_dump_json() call per model.
+- summaries_from_rows() converts a whole result list at once, reading each row with
+    one attrgetter call and skipping FilePath validation.
+    .dict and as_dicts() likewise read all columns with one attrgetter call per row.
+- stat_model, path_model, Path, and summary are cached per entity instance and dropped
+    whenever a column is set or the instance is expired/refreshed.
+- SQLiteFile.populate() reads table names and DDL with one read-only sqlite_master
+    query instead of shelling out to sqlite-utils, memoized on the file's
+    (path, mtime, size) in the scan cache (core.utils.get_file_extract).
+    populate_many() runs it on a thread pool; sqlite3 releases the GIL while reading.
+- Equality and hashing on the entity are based on the primary key (id) only, matching
+    DataFileEntity and ImageFileEntity, so set/dict operations never load another
+    column.
+- The Optional[List[str]] annotation on tables is checked by pydantic-core itself;
+    there is no Python-level validator on the field.
 """
 
 # endregion
 # region Imports
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from datetime import datetime
+from functools import cached_property
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, List, Literal, Optional
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from pydantic import ConfigDict, TypeAdapter, model_serializer
+from sqlalchemy import (
+    Boolean,
+    Computed,
+    DateTime,
+    Index,
+    Integer,
+    Select,
+    String,
+    Text,
+    func,
+    select,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column, undefer_group
+
+from core.base import _PLATFORM_STAT, BaseFileModel, BaseFileStat, FilePath
+from core.database import Base, invalidate_cached_properties
+from core.utils import get_file_extract
 
-from pydantic import ConfigDict, field_validator, model_serializer
-from sqlalchemy import Computed, DateTime, Integer, String, Text, func
-from sqlalchemy.orm import Mapped, mapped_column
-
-from core.base import BaseFileModel, BaseFileStat, FilePath
-from core.database import Base
-from core.utils import get_sqlite_schema, get_sqlite_tables
+# endregion
+# region Constants
+_SUMMARY_GETTER = attrgetter(
+    "id",
+    "path_json",
+    "sha256",
+    "mime_type",
+    "short_description",
+    "long_description",
+    "tags",
+)
+"""Fetches the columns a summary needs from an entity in one call."""
+
+_DICT_FIELDS = (
+    "id",
+    "sha256",
+    "path_json",
+    "stat_json",
+    "mime_type",
+    "tags",
+    "short_description",
+    "long_description",
+    "frozen",
+    "schema",
+    "tables",
+    "created_at",
+    "updated_at",
+)
+"""Keys of the entity's .dict representation, in order."""
+
+_DICT_GETTER = attrgetter(*_DICT_FIELDS)
+"""Fetches all _DICT_FIELDS columns from an entity in one call."""
 
 
 # endregion
@@ -70,6 +154,17 @@ class SQLiteFileEntity(Base):
     """
 
     __tablename__ = "sqlite_files"
+    __table_args__ = (
+        # "by extension, ordered by size" listings walk this index in order
+        Index("ix_sqlite_files_extension_size", "extension", "size_bytes"),
+        Index("ix_sqlite_files_tags_gin", "tags", postgresql_using="gin"),
+        Index(
+            "ix_sqlite_files_path_gin",
+            "path_json",
+            postgresql_using="gin",
+            postgresql_ops={"path_json": "jsonb_path_ops"},
+        ),
+    )
 
     id: Mapped[str] = mapped_column(primary_key=True)
 
@@ -78,25 +173,31 @@ class SQLiteFileEntity(Base):
         String(255), Computed("path_json->>'name'", persisted=True), index=True
     )
     extension: Mapped[str] = mapped_column(
-        String(20), Computed("path_json->>'suffix'", persisted=True), index=True
+        String(20), Computed("path_json->>'suffix'", persisted=True)
     )
     size_bytes: Mapped[int] = mapped_column(
-        Integer, Computed("(stat_json->>'st_size')::bigint", persisted=True), index=True
+        Integer, Computed("(stat_json->>'st_size')::bigint", persisted=True)
     )
 
     # Base File Columns
     sha256: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
-    path_json: Mapped[dict] = mapped_column(String, nullable=False)
-    stat_json: Mapped[dict] = mapped_column(String, nullable=False)
+    path_json: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    stat_json: Mapped[dict] = mapped_column(
+        JSONB, nullable=False, deferred=True, deferred_group="heavy"
+    )
     mime_type: Mapped[Optional[str]] = mapped_column(String, nullable=True)
-    tags: Mapped[Optional[list[str]]] = mapped_column(String, nullable=True)
+    tags: Mapped[Optional[list[str]]] = mapped_column(JSONB, nullable=True)
     short_description: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     long_description: Mapped[Optional[str]] = mapped_column(String, nullable=True)
-    frozen: Mapped[bool] = mapped_column(String, default=False, server_default="0")
+    frozen: Mapped[bool] = mapped_column(Boolean, default=False, server_default="0")
 
     # SQLite specific columns
-    schema: Mapped[str] = mapped_column(Text, nullable=False)
-    tables: Mapped[Optional[list[str]]] = mapped_column(String, nullable=True)
+    schema: Mapped[str] = mapped_column(
+        Text, nullable=False, deferred=True, deferred_group="heavy"
+    )
+    tables: Mapped[Optional[list[str]]] = mapped_column(
+        JSONB, nullable=True, deferred=True, deferred_group="heavy"
+    )
 
     # DB Record Timestamps
     created_at: Mapped[datetime] = mapped_column(
@@ -115,80 +216,84 @@ class SQLiteFileEntity(Base):
     def __repr__(self) -> str:
         return f"<SQLiteFile_Table(id={self.id}, filename={self.filename}, size_bytes={self.size_bytes})>"
 
-    def __eq__(self, other: Any) -> bool:
+    def __eq__(self, other: object) -> bool:
         if not isinstance(other, SQLiteFileEntity):
             return NotImplemented
-        return (
-            self.id == other.id
-            and self.scan_id == other.scan_id
-            and self.schema == other.schema
-            and self.tables == other.tables
-        )
+        return self.id == other.id
 
     def __hash__(self) -> int:
-        return hash(
-            (
-                self.id,
-                self.scan_id,
-                self.schema,
-                tuple(self.tables) if self.tables else None,
-            )
-        )
+        return hash(self.id)
 
     @property
     def model(self) -> "SQLiteFile":
-        """Return the Pydantic model representation of the SQLite file."""
-        return SQLiteFile.model_validate(
-            {
-                "type": "sqlite",
-                "id": self.id,
-                "path_json": self.path_json,
-                "stat_json": self.stat_json,
-                "mime_type": self.mime_type,
-                "tags": self.tags,
-                "short_description": self.short_description,
-                "long_description": self.long_description,
-                "frozen": self.frozen,
-                "schema": self.schema,
-                "tables": self.tables,
-            }
+        """
+        Return the Pydantic model representation of the SQLite file.
+
+        The row was validated when it was written, so the model is built with
+        model_construct() instead of being validated again. It reads the "heavy"
+        columns; load rows with select_details() to fetch them up front.
+        """
+        return SQLiteFile.model_construct(
+            path_json=FilePath.model_construct(**self.path_json),
+            stat_json=_PLATFORM_STAT.from_stat_json(self.stat_json),
+            sha256=self.sha256,
+            mime_type=self.mime_type,
+            tags=self.tags,
+            short_description=self.short_description,
+            long_description=self.long_description,
+            frozen=self.frozen,
+            db_schema=self.schema,
+            tables=self.tables,
         )
 
     @property
     def dict(self) -> dict[str, Any]:
-        """Return a dictionary representation of the SQLiteFileEntity."""
-        return {
-            "id": self.id,
-            "sha256": self.sha256,
-            "path_json": self.path_json,
-            "stat_json": self.stat_json,
-            "mime_type": self.mime_type,
-            "tags": self.tags,
-            "short_description": self.short_description,
-            "long_description": self.long_description,
-            "frozen": self.frozen,
-            "schema": self.schema,
-            "tables": self.tables,
-            "created_at": self.created_at,
-            "updated_at": self.updated_at,
-        }
+        """Return a dictionary representation of the SQLiteFileEntity (all columns)."""
+        return dict(zip(_DICT_FIELDS, _DICT_GETTER(self)))
 
-    @property
+    @classmethod
+    def select_details(cls) -> Select:
+        """
+        Build a SELECT that also loads the deferred "heavy" columns.
+
+        Use it wherever .model, .dict, or as_dicts() is read, so the deferred
+        columns come in the same query instead of one lazy SELECT per row.
+
+        Returns:
+            Select: The statement, e.g. for session.scalars().
+        """
+        return select(cls).options(undefer_group("heavy"))
+
+    @classmethod
+    def as_dicts(cls, rows: Iterable["SQLiteFileEntity"]) -> List[Dict[str, Any]]:
+        """
+        Build the .dict representation of many entities in one pass.
+
+        Args:
+            rows (Iterable[SQLiteFileEntity]): The entities, e.g. from
+                session.scalars(SQLiteFileEntity.select_details()).
+
+        Returns:
+            List[Dict[str, Any]]: One dict per row, in row order.
+        """
+        return [dict(zip(_DICT_FIELDS, values)) for values in map(_DICT_GETTER, rows)]
+
+    @cached_property
     def stat_model(self) -> BaseFileStat:
         """Return the FileStat model representation of the file's stat_json."""
-        return BaseFileStat.model_validate(self.stat_json)
+        return _PLATFORM_STAT.from_stat_json(self.stat_json)
 
-    @property
+    @cached_property
     def path_model(self) -> FilePath:
         """Return the FilePath model representation of the file's path_json."""
         return FilePath.model_validate(self.path_json)
 
-    @property
+    @cached_property
     def Path(self) -> Path:
         """Return the pathlib.Path representation of the file's full path."""
         return self.path_model.Path
 
-    @property
+    @cached_property
     def summary(self) -> dict:
         """Return a summary dictionary of the DataFileEntity."""
         return {
@@ -198,9 +303,47 @@ class SQLiteFileEntity(Base):
             "mimetype": self.mime_type or "unknown",
             "short_description": self.short_description or "",
             "long_description": self.long_description or "",
-            "tags": ", ".join(self.tags) if self.tags else "",
+            "tags": ", ".join(self.tags or ()),
         }
 
+    @classmethod
+    def summaries_from_rows(
+        cls, rows: Iterable["SQLiteFileEntity"]
+    ) -> List[Dict[str, Any]]:
+        """
+        Build the .summary dict of many entities in one pass.
+
+        The columns are fetched with a single attrgetter call per row and the path is
+        rebuilt from path_json directly, so no FilePath model is validated and
+        nothing is cached on the entities.
+
+        Args:
+            rows (Iterable[SQLiteFileEntity]): The entities, e.g. from session.scalars().
+
+        Returns:
+            List[Dict[str, Any]]: One summary per row, in row order.
+        """
+        return [
+            {
+                "file_id": file_id,
+                "path": Path(*path_json["parts"]).as_posix(),
+                "sha256": sha256,
+                "mimetype": mime_type or "unknown",
+                "short_description": short_description or "",
+                "long_description": long_description or "",
+                "tags": ", ".join(tags or ()),
+            }
+            for (
+                file_id,
+                path_json,
+                sha256,
+                mime_type,
+                short_description,
+                long_description,
+                tags,
+            ) in map(_SUMMARY_GETTER, rows)
+        ]
+
     def freeze(self) -> None:
         """Mark the file as frozen (immutable)."""
         self.frozen = True
@@ -210,6 +353,11 @@ class SQLiteFileEntity(Base):
         self.frozen = False
 
 
+invalidate_cached_properties(
+    SQLiteFileEntity, "stat_model", "path_model", "Path", "summary"
+)
+
+
 # endregion
 # region Pydantic Model for SQLiteFile
 class SQLiteFile(BaseFileModel):
@@ -236,38 +384,115 @@ class SQLiteFile(BaseFileModel):
 
     @classmethod
     def populate(cls, file_path: Path) -> "SQLiteFile":
+        """Populate the table names and schema from the database's sqlite_master."""
         instance = super().populate(file_path)
-        # SQLite-specific population logic can be added here if needed
-        schema = get_sqlite_schema(file_path)
-        tables = get_sqlite_tables(file_path)
-        instance.db_schema = schema
-        instance.tables = tables
+        stat = instance.stat_json
+        instance.tables, instance.db_schema = get_file_extract(
+            "sqlite_master", file_path, stat.st_mtime_ns, stat.st_size, _introspect
+        )
         return instance
 
-    @model_serializer()
-    def serialize_model(self) -> dict:
-        return {
-            **super().serialize_model(),
-            "tables": self.tables,
-            "schema": self.db_schema,
-        }
+    @classmethod
+    def populate_many(
+        cls,
+        paths: Iterable[Path],
+        max_workers: int = 16,
+        on_error: Optional[Callable[[Path, str], None]] = None,
+    ) -> List["SQLiteFile"]:
+        """
+        Populate many SQLite files on a thread pool.
+
+        sqlite3 and hashlib release the GIL while reading, so threads overlap the
+        I/O; each populate() opens its own read-only connection.
+
+        Args:
+            paths (Iterable[Path]): The SQLite file paths to populate.
+            max_workers (int): Number of worker threads. DEFAULT: 16
+            on_error (Optional[Callable[[Path, str], None]]): Called with the path and
+                error message of every file that could not be populated.
+
+        Returns:
+            List[SQLiteFile]: The populated SQLite files, in input order.
+        """
+        paths = list(paths)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_populate_one, paths))
+        files: List[SQLiteFile] = []
+        for path, result in zip(paths, results):
+            if isinstance(result, str):
+                if on_error is not None:
+                    on_error(path, result)
+                continue
+            files.append(result)
+        return files
 
-    @field_validator("tables", mode="before")
-    def validate_tables(cls, v):
+    @classmethod
+    def dump_many_json(cls, items: Sequence["SQLiteFile"]) -> bytes:
         """
-        Validator for 'tables' field to ensure it is a list of strings.
+        Serialize many models to a JSON array with one reusable serializer.
+
+        Args:
+            items (Sequence[SQLiteFile]): The models to dump.
+
+        Returns:
+            bytes: The JSON array.
         """
-        if v is None:
-            return v
-        if not isinstance(v, list) or not all(isinstance(item, str) for item in v):
-            raise ValueError("tables must be a list of strings")
-        return v
+        return _SQLITE_LIST_ADAPTER.dump_json(items)
+
+    @model_serializer()
+    def serialize_model(self) -> dict:
+        # extend the base dict in place rather than copying it into a new one
+        data = super().serialize_model()
+        data["tables"] = self.tables
+        data["schema"] = self.db_schema
+        return data
 
     model_config = ConfigDict(
         **BaseFileModel.model_config,
     )
 
 
+def _populate_one(file_path: Path) -> Union[SQLiteFile, str]:
+    """Populate one file in a populate_many() worker; errors come back as text."""
+    try:
+        return SQLiteFile.populate(file_path)
+    except Exception as e:
+        return str(e)
+
+
+_SQLITE_LIST_ADAPTER = TypeAdapter(List[SQLiteFile])
+"""Dumps a whole list of SQLiteFile models in one pydantic-core call."""
+
+
+def _introspect(file_path: Path) -> tuple[list[str], str]:
+    """
+    Read the table names and DDL of a SQLite database from sqlite_master.
+
+    The database is opened read-only, so only the pages holding sqlite_master are
+    read and the file is never modified.
+
+    Args:
+        file_path (Path): The SQLite database file.
+
+    Returns:
+        tuple[list[str], str]: The table names and the schema as SQL DDL.
+
+    Raises:
+        ValueError: If the file is not a readable SQLite database.
+    """
+    uri = f"{file_path.resolve().as_uri()}?mode=ro"
+    try:
+        with closing(sqlite3.connect(uri, uri=True)) as conn:
+            rows = conn.execute(
+                "SELECT type, name, sql FROM sqlite_master ORDER BY rowid"
+            ).fetchall()
+    except sqlite3.Error as e:
+        raise ValueError(f"Invalid SQLite database file: {file_path}: {e}") from e
+    tables = [name for type_, name, _ in rows if type_ == "table"]
+    schema = "".join(f"{sql};\n" for _, _, sql in rows if sql)
+    return tables, schema
+
+
 # endregion
 
 __all__ = ["SQLiteFileEntity", "SQLiteFile"]
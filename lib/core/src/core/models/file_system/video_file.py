@@ -16,7 +16,8 @@ Contents:
     - VideoFile_Table:
         Persists a single video file with path/stat metadata, content hash (SHA-256),
         and video-specific attributes (duration, width, height, resolution, codec).
-        Computed columns derive filename, extension, and size from JSON fields.
+        Computed columns derive filename, extension, and size from JSON fields, and
+        resolution ('WxH') from width/height.
         Includes helpers for equality (by sha256), hashing, and conversion to
         Pydantic models via .stat_model, .path_model, and .Path properties.
         Provides .summary for quick dictionary representation and .freeze/.unfreeze
@@ -27,7 +28,7 @@ Contents:
         A domain model representing a single video file. Extends BaseFileModel with
         video-specific fields: duration, resolution (width, height tuple), codec.
         Includes a .populate() method to extract metadata from a video file using
-        OpenCV (cv2) when available.
+        ffprobe.
     - VideoScanResultModel:
         Represents the result of scanning a directory in mode="video". Carries the
         list of discovered video file paths. Includes validators for flexible input
@@ -40,42 +41,119 @@ Contents:
     - PreviewGIF: Represents a preview GIF generated from a video.
 
 Design notes:
+- .model on the entity uses model_construct(): rows were validated when written.
 - Computed columns reduce duplication and ensure consistent derivation of metadata from
     JSON fields without requiring application-side recomputation.
+- extension and size_bytes share one composite (extension, size_bytes) index, which
+    serves both extension filters and "by extension, ordered by size" listings.
+- path_json/stat_json/tags are JSONB. tags has a GIN index and path_json a
+    jsonb_path_ops GIN index for containment (@>) queries.
+- stat_json, which list views (summary, summaries_from_rows()) never read, is
+    deferred in the "heavy" group. .model, .dict, and as_dicts() do read it;
+    select_details() adds options(undefer_group("heavy")) so detail reads load it in
+    the same SELECT rather than one lazy SELECT per row.
+- VideoFile.dump_many_json() serializes a list through one module-level TypeAdapter
+    instead of one model_dump_json() call per model.
+- summaries_from_rows() converts a whole result list at once, reading each row with
+    one attrgetter call and skipping FilePath validation.
+    .dict and as_dicts() likewise read all columns with one attrgetter call per row.
+- stat_model, path_model, Path, and summary are cached per entity instance and dropped
+    whenever a column is set or the instance is expired/refreshed.
+- width/height are the single source of truth for resolution: the entity's
+    resolution string is computed by the database, and .model builds the (width,
+    height) tuple from the integer columns.
 - Pydantic validators normalize flexible input shapes (lists of dicts vs. strings).
-- The .populate() method gracefully handles missing cv2 dependency for minimal environments.
+- The .populate() method reads duration, codec, and resolution with one
+    `ffprobe -print_format json` call per file; populate_many() runs it across a
+    process pool for bulk scans. Probe results are memoized on the file's
+    (path, mtime, size) in the scan cache (core.utils.get_file_extract), so rescans
+    of unchanged files start no ffprobe process at all.
 - Equality and hashing are based on SHA-256 content hash for deduplication support.
 """
 
-import subprocess
-
 # endregion
 # region Imports
+import json
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import cached_property
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Union,
+)
 
-from pydantic import Field, field_validator, model_serializer
+from pydantic import Field, TypeAdapter, field_validator, model_serializer
 from sqlalchemy import (
-    JSON,
     Boolean,
     Computed,
     DateTime,
     Float,
+    Index,
     Integer,
+    Select,
     String,
     Text,
     func,
+    select,
 )
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column, undefer_group
 
 from core.base import (
+    _PLATFORM_STAT,
     BaseFileModel,
     BaseFileStat,
     BaseScanResult,
     FilePath,
 )
-from core.database import Base
+from core.database import Base, invalidate_cached_properties
+from core.utils import get_file_extract
+
+# endregion
+# region Constants
+_SUMMARY_GETTER = attrgetter(
+    "id",
+    "path_json",
+    "sha256",
+    "mime_type",
+    "short_description",
+    "long_description",
+    "tags",
+)
+"""Fetches the columns a summary needs from an entity in one call."""
+
+_DICT_FIELDS = (
+    "id",
+    "sha256",
+    "path_json",
+    "stat_json",
+    "mime_type",
+    "tags",
+    "short_description",
+    "long_description",
+    "frozen",
+    "duration",
+    "width",
+    "height",
+    "resolution",
+    "codec",
+    "created_at",
+    "updated_at",
+)
+"""Keys of the entity's .dict representation, in order."""
+
+_DICT_GETTER = attrgetter(*_DICT_FIELDS)
+"""Fetches all _DICT_FIELDS columns from an entity in one call."""
 
 
 # endregion
@@ -104,6 +182,17 @@ class VideoFileEntity(Base):
     """
 
     __tablename__ = "video_files"
+    __table_args__ = (
+        # "by extension, ordered by size" listings walk this index in order
+        Index("ix_video_files_extension_size", "extension", "size_bytes"),
+        Index("ix_video_files_tags_gin", "tags", postgresql_using="gin"),
+        Index(
+            "ix_video_files_path_gin",
+            "path_json",
+            postgresql_using="gin",
+            postgresql_ops={"path_json": "jsonb_path_ops"},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
 
@@ -112,18 +201,20 @@ class VideoFileEntity(Base):
         String(255), Computed("path_json->>'name'", persisted=True), index=True
     )
     extension: Mapped[str] = mapped_column(
-        String(20), Computed("path_json->>'suffix'", persisted=True), index=True
+        String(20), Computed("path_json->>'suffix'", persisted=True)
     )
     size_bytes: Mapped[int] = mapped_column(
-        Integer, Computed("(stat_json->>'st_size')::bigint", persisted=True), index=True
+        Integer, Computed("(stat_json->>'st_size')::bigint", persisted=True)
     )
 
     # Standard Columns
     sha256: Mapped[str] = mapped_column(String(64), index=True)
-    path_json: Mapped[Dict[str, Any]] = mapped_column(JSON)
-    stat_json: Mapped[Dict[str, Any]] = mapped_column(JSON)
+    path_json: Mapped[Dict[str, Any]] = mapped_column(JSONB)
+    stat_json: Mapped[Dict[str, Any]] = mapped_column(
+        JSONB, deferred=True, deferred_group="heavy"
+    )
     mime_type: Mapped[Optional[str]] = mapped_column(String(100))
-    tags: Mapped[Optional[list[str]]] = mapped_column(JSON, default=None)
+    tags: Mapped[Optional[list[str]]] = mapped_column(JSONB, default=None)
     short_description: Mapped[Optional[str]] = mapped_column(Text, default=None)
     long_description: Mapped[Optional[str]] = mapped_column(Text, default=None)
     frozen: Mapped[bool] = mapped_column(Boolean, default=False, server_default="0")
@@ -132,7 +223,9 @@ class VideoFileEntity(Base):
     duration: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     width: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     height: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
-    resolution: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
+    resolution: Mapped[Optional[str]] = mapped_column(
+        String(20), Computed("width::text || 'x' || height::text", persisted=True)
+    )
     codec: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
 
     created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
@@ -154,68 +247,79 @@ class VideoFileEntity(Base):
 
     @property
     def model(self) -> "VideoFile":
-        """Return the Pydantic model representation of the video file."""
-        return VideoFile.model_validate(
-            {
-                "id": self.id,
-                "sha256": self.sha256,
-                "path_json": self.path_json,
-                "stat_json": self.stat_json,
-                "mime_type": self.mime_type,
-                "tags": self.tags,
-                "short_description": self.short_description,
-                "long_description": self.long_description,
-                "frozen": self.frozen,
-                "duration": self.duration,
-                "width": self.width,
-                "height": self.height,
-                "resolution": (
-                    tuple(map(int, self.resolution.split("x")))
-                    if self.resolution
-                    else None
-                ),
-                "codec": self.codec,
-            }
+        """
+        Return the Pydantic model representation of the video file.
+
+        The row was validated when it was written, so the model is built with
+        model_construct() instead of being validated again. It reads the "heavy"
+        columns; load rows with select_details() to fetch them up front.
+        """
+        return VideoFile.model_construct(
+            path_json=FilePath.model_construct(**self.path_json),
+            stat_json=_PLATFORM_STAT.from_stat_json(self.stat_json),
+            sha256=self.sha256,
+            mime_type=self.mime_type,
+            tags=self.tags,
+            short_description=self.short_description,
+            long_description=self.long_description,
+            frozen=self.frozen,
+            duration=self.duration,
+            width=self.width,
+            height=self.height,
+            resolution=(
+                (self.width, self.height) if self.width and self.height else None
+            ),
+            codec=self.codec,
         )
 
     @property
     def dict(self) -> dict[str, Any]:
         """Return a dictionary representation of the VideoFile_Table."""
-        return {
-            "id": self.id,
-            "sha256": self.sha256,
-            "path_json": self.path_json,
-            "stat_json": self.stat_json,
-            "mime_type": self.mime_type,
-            "tags": self.tags,
-            "short_description": self.short_description,
-            "long_description": self.long_description,
-            "frozen": self.frozen,
-            "duration": self.duration,
-            "width": self.width,
-            "height": self.height,
-            "resolution": self.resolution,
-            "codec": self.codec,
-            "created_at": self.created_at,
-            "updated_at": self.updated_at,
-        }
+        return dict(zip(_DICT_FIELDS, _DICT_GETTER(self)))
 
-    @property
+    @classmethod
+    def select_details(cls) -> Select:
+        """
+        Build a SELECT that also loads the deferred "heavy" columns.
+
+        Use it wherever .model, .dict, or as_dicts() is read, so the deferred
+        columns come in the same query instead of one lazy SELECT per row.
+
+        Returns:
+            Select: The statement, e.g. for session.scalars().
+        """
+        return select(cls).options(undefer_group("heavy"))
+
+    @classmethod
+    def as_dicts(cls, rows: Iterable["VideoFileEntity"]) -> List[Dict[str, Any]]:
+        """
+        Build the .dict representation of many entities in one pass.
+
+        Args:
+            rows (Iterable[VideoFileEntity]): The entities, e.g. from
+                session.scalars(VideoFileEntity.select_details()).
+
+        Returns:
+            List[Dict[str, Any]]: One dict per row, in row order.
+        """
+        return [dict(zip(_DICT_FIELDS, values)) for values in map(_DICT_GETTER, rows)]
+
+    @cached_property
     def stat_model(self) -> BaseFileStat:
         """Return the FileStat model representation of the file's stat_json."""
-        return BaseFileStat.model_validate(self.stat_json)
+        return _PLATFORM_STAT.from_stat_json(self.stat_json)
 
-    @property
+    @cached_property
     def path_model(self) -> FilePath:
         """Return the FilePath model representation of the file's path_json."""
         return FilePath.model_validate(self.path_json)
 
-    @property
+    @cached_property
     def Path(self) -> Path:
         """Return the pathlib.Path representation of the file's full path."""
         return self.path_model.Path
 
-    @property
+    @cached_property
     def summary(self) -> dict:
         """Return a summary dictionary of the DataFileEntity."""
         return {
@@ -225,9 +329,47 @@ class VideoFileEntity(Base):
             "mimetype": self.mime_type or "unknown",
             "short_description": self.short_description or "",
             "long_description": self.long_description or "",
-            "tags": ", ".join(self.tags) if self.tags else "",
+            "tags": ", ".join(self.tags or ()),
         }
 
+    @classmethod
+    def summaries_from_rows(
+        cls, rows: Iterable["VideoFileEntity"]
+    ) -> List[Dict[str, Any]]:
+        """
+        Build the .summary dict of many entities in one pass.
+
+        The columns are fetched with a single attrgetter call per row and the path is
+        rebuilt from path_json directly, so no FilePath model is validated and
+        nothing is cached on the entities.
+
+        Args:
+            rows (Iterable[VideoFileEntity]): The entities, e.g. from session.scalars().
+
+        Returns:
+            List[Dict[str, Any]]: One summary per row, in row order.
+        """
+        return [
+            {
+                "file_id": file_id,
+                "path": Path(*path_json["parts"]).as_posix(),
+                "sha256": sha256,
+                "mimetype": mime_type or "unknown",
+                "short_description": short_description or "",
+                "long_description": long_description or "",
+                "tags": ", ".join(tags or ()),
+            }
+            for (
+                file_id,
+                path_json,
+                sha256,
+                mime_type,
+                short_description,
+                long_description,
+                tags,
+            ) in map(_SUMMARY_GETTER, rows)
+        ]
+
     def freeze(self) -> None:
         """Mark the file as frozen (immutable)."""
         self.frozen = True
@@ -237,6 +379,11 @@ class VideoFileEntity(Base):
         self.frozen = False
 
 
+invalidate_cached_properties(
+    VideoFileEntity, "stat_model", "path_model", "Path", "summary"
+)
+
+
 # endregion
 # region Pydantic Model for Video File
 class VideoFile(BaseFileModel):
@@ -270,79 +417,20 @@ class VideoFile(BaseFileModel):
     # preview_gif_b64_data: Optional[str] = None  # TODO: Implement preview generation
     # timestamped_frames: Optional[dict[float, str]] = None  # TODO: Implement frame extraction
 
-    def _get_video_duration(self, file_path: Path) -> float:
-        """Helper method to get video duration using ffmpeg."""
-        import subprocess
-
-        result = subprocess.run(
-            [
-                "ffprobe",
-                "-v",
-                "error",
-                "-show_entries",
-                "format=duration",
-                "-of",
-                "default=noprint_wrappers=1:nokey=1",
-                str(file_path),
-            ],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-        )
-        return float(result.stdout)
-
-    def _get_video_codec(self, file_path: Path) -> str:
-        """Helper method to get video codec using ffmpeg."""
-
-        result = subprocess.run(
-            [
-                "ffprobe",
-                "-v",
-                "error",
-                "-select_streams",
-                "v:0",
-                "-show_entries",
-                "stream=codec_name",
-                "-of",
-                "default=noprint_wrappers=1:nokey=1",
-                str(file_path),
-            ],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-        )
-        return result.stdout.decode().strip()
-
-    def _get_video_resolution(self, file_path: Path) -> tuple[int, int]:
-        """Helper method to get video resolution using ffmpeg."""
-        result = subprocess.run(
-            [
-                "ffprobe",
-                "-v",
-                "error",
-                "-select_streams",
-                "v:0",
-                "-show_entries",
-                "stream=width,height",
-                "-of",
-                "csv=s=x:p=0",
-                str(file_path),
-            ],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-        )
-        resolution_str = result.stdout.decode().strip()
-        width, height = map(int, resolution_str.split("x"))
-        return width, height
-
     @classmethod
     def populate(cls, file_path: Path) -> "VideoFile":
-        """Populate video-specific metadata using ffmpeg."""
+        """Populate video-specific metadata with a single ffprobe call."""
         instance = super().populate(file_path)
         try:
-            duration = instance._get_video_duration(file_path)
-            codec = instance._get_video_codec(file_path)
-            width, height = instance._get_video_resolution(file_path)
-            if width and height:
-                resolution = (width, height)
+            stat = instance.stat_json
+            probe = get_file_extract(
+                "ffprobe", file_path, stat.st_mtime_ns, stat.st_size, _probe
+            )
+            stream = (probe.get("streams") or [{}])[0]
+            duration = float(probe["format"]["duration"])
+            codec = stream.get("codec_name")
+            width = stream.get("width")
+            height = stream.get("height")
         except Exception as e:
             # Handle exceptions (e.g., ffprobe not found, invalid file)
             raise Exception(f"Error populating video metadata: {e}")
@@ -351,9 +439,56 @@ class VideoFile(BaseFileModel):
         instance.width = width
         instance.height = height
         if width and height:
-            instance.resolution = resolution
+            instance.resolution = (width, height)
         return instance
 
+    @classmethod
+    def populate_many(
+        cls,
+        paths: Iterable[Path],
+        max_workers: Optional[int] = None,
+        on_error: Optional[Callable[[Path, str], None]] = None,
+    ) -> List["VideoFile"]:
+        """
+        Populate many video files in a process pool.
+
+        Each file costs an ffprobe process start and a container header read, so
+        the files are probed concurrently across worker processes.
+
+        Args:
+            paths (Iterable[Path]): The video file paths to populate.
+            max_workers (Optional[int]): Number of worker processes. DEFAULT: os.cpu_count()
+            on_error (Optional[Callable[[Path, str], None]]): Called with the path and
+                error message of every video that could not be populated.
+
+        Returns:
+            List[VideoFile]: The populated video files, in input order.
+        """
+        paths = list(paths)
+        videos: List[VideoFile] = []
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(_populate_one, paths, chunksize=16)
+            for path, result in zip(paths, results):
+                if isinstance(result, str):
+                    if on_error is not None:
+                        on_error(path, result)
+                    continue
+                videos.append(result)
+        return videos
+
+    @classmethod
+    def dump_many_json(cls, items: Sequence["VideoFile"]) -> bytes:
+        """
+        Serialize many models to a JSON array with one reusable serializer.
+
+        Args:
+            items (Sequence[VideoFile]): The models to dump.
+
+        Returns:
+            bytes: The JSON array.
+        """
+        return _VIDEO_LIST_ADAPTER.dump_json(items)
+
     @property
     def entity(self) -> VideoFileEntity:
         return VideoFileEntity(
@@ -369,13 +504,56 @@ class VideoFile(BaseFileModel):
             duration=self.duration,
             width=self.width,
             height=self.height,
-            resolution=(
-                f"{self.width}x{self.height}" if self.width and self.height else None
-            ),
             codec=self.codec,
         )
 
 
+def _populate_one(file_path: Path) -> Union[VideoFile, str]:
+    """Populate one video in a populate_many() worker; errors come back as text."""
+    try:
+        return VideoFile.populate(file_path)
+    except Exception as e:
+        return str(e)
+
+
+_VIDEO_LIST_ADAPTER = TypeAdapter(List[VideoFile])
+"""Dumps a whole list of VideoFile models in one pydantic-core call."""
+
+
+def _probe(file_path: Path) -> dict[str, Any]:
+    """
+    Read the container duration and first video stream's codec and size with ffprobe.
+
+    One ffprobe process opens and demuxes the file once, instead of one process per
+    value.
+
+    Args:
+        file_path (Path): The video file to probe.
+
+    Returns:
+        dict[str, Any]: ffprobe's JSON output ("format" and "streams" keys).
+    """
+    result = subprocess.run(
+        [
+            "ffprobe",
+            "-v",
+            "error",
+            "-print_format",
+            "json",
+            "-show_entries",
+            "format=duration:stream=codec_name,width,height",
+            "-select_streams",
+            "v:0",
+            str(file_path),
+        ],
+        capture_output=True,
+        check=True,
+    )
+    # stderr is captured separately, so warnings never reach the JSON; json.loads
+    # parses the raw stdout bytes without a decode() round-trip
+    return json.loads(result.stdout)
+
+
 class VideoScanResult(BaseScanResult):
     """
     Model representing the result of a video scan.
@@ -396,10 +574,10 @@ class VideoScanResult(BaseScanResult):
 
     @model_serializer(when_used="json")
     def serialize_model(self) -> dict:
-        return {
-            **super().serialize_model(),
-            "files": self.files,
-        }
+        # extend the base dict in place rather than copying it into a new one
+        data = super().serialize_model()
+        data["files"] = self.files
+        return data
 
     @field_validator("files", mode="before")
     def validate_files(cls, v: Union[List[str], List[dict[str, Any]]]) -> List[str]:
@@ -407,6 +585,11 @@ class VideoScanResult(BaseScanResult):
             return [item["path"] for item in v if "path" in item]
         return v
 
+    def scanned_files(self) -> List[str]:
+        # bare paths carry no stat information, so video files are counted but their
+        # stats are recorded as unknown rather than read from disk
+        return self.files
+
 
 # endregion
 
@@ -20,28 +20,77 @@ Contents:
         A domain model representing a single clipboard history entry. Includes content
         data, content type classification, optional file metadata, favorite marking,
         access counting, backup status, and timestamp tracking. Provides JSON schema
-        examples for API documentation and supports attribute-based instantiation.
+        examples for API documentation (development, or INCLUDE_OPENAPI_EXAMPLES=true)
+        and supports attribute-based instantiation.
 Design notes:
 - .model property on the SQLAlchemy entity provides immediate conversion to the Pydantic
-    model for safe I/O layers.
-- content_hash enables efficient deduplication of identical clipboard entries.
+    model for safe I/O layers, through a module-level TypeAdapter that reads the entity
+    attributes directly (from_attributes=True). from_entities() on the model converts
+    many rows in a single list validation.
+- content_hash is a raw 16-byte BLAKE2b digest (hashlib, in C), filled in by a
+    before_insert hook when the caller did not set one; a quarter the size of a hex
+    SHA-256 key, so more of the unique index fits per page.
+- content_hash enables efficient deduplication of identical clipboard entries; its
+    unique index is the only lookup key. content and file_path are not indexed, since
+    nothing queries by the full text and a B-tree over it bloats every insert.
+- thumbnail is stored as raw bytes (BYTEA) without an index: it is never a lookup key,
+    and base64 text would be a third larger. JSON carries it base64-encoded.
+- The indexes follow the two list queries, recent entries and recent favorites: one
+    on timestamp and one partial index on (is_favorite, timestamp) over favorites only.
 - access_count tracks usage frequency for potential sorting/prioritization features.
 - is_favorite and backed_up flags support user organization and data persistence workflows.
 - Timestamps (timestamp, created_at, updated_at) enable chronological ordering and
     audit trails.
+- The Pydantic model and its TypeAdapters are built with defer_build=True, so importing
+    this module for the entity alone does not compile the pydantic-core validator.
 """
 
 # endregion
 # region Imports
 from datetime import datetime
-from typing import Optional
+from functools import cached_property
+from hashlib import blake2b
+from typing import Iterable, List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field
-from sqlalchemy import Boolean, DateTime, Integer, String, Text
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    event,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 
-from core.database import Base
+from core.config.base import OPENAPI_EXAMPLES
+from core.database import Base, invalidate_cached_properties
+
+# endregion
+# region Constants
+CONTENT_HASH_SIZE = 16
+"""Size in bytes of the clipboard content_hash digest."""
+
+_EXAMPLES = [
+    {
+        "id": 1,
+        "content": "Sample clipboard text",
+        "content_hash": "Y7UTWRToxzQL52oOryjp9A==",
+        "content_type": "text",
+        "file_path": None,
+        "file_size": None,
+        "mime_type": "text/plain",
+        "thumbnail": None,
+        "timestamp": "2024-01-01T12:00:00Z",
+        "is_favorite": True,
+        "access_count": 5,
+        "backed_up": False,
+    }
+]
+"""JSON schema examples for ClipboardHistory, attached only when OPENAPI_EXAMPLES."""
 
 
 # endregion
@@ -52,12 +101,13 @@ class ClipboardHistoryEntity(Base):
     Attributes:
         id (int): Primary key.
         content (str): The clipboard content.
-        content_hash (Optional[str]): Hash of the content for deduplication.
+        content_hash (Optional[bytes]): 16-byte BLAKE2b digest of the content, for
+            deduplication. Filled in on insert when not set.
         content_type (str): Type of the content (e.g., text, image).
         file_path (Optional[str]): File path if the content is from a file.
         file_size (Optional[int]): Size of the file content in bytes.
         mime_type (Optional[str]): MIME type of the content.
-        thumbnail (Optional[str]): Thumbnail image data for visual content.
+        thumbnail (Optional[bytes]): Raw thumbnail image bytes for visual content.
         timestamp (datetime): Timestamp when the content was copied.
         is_favorite (bool): Whether the entry is marked as favorite.
         access_count (int): Number of times the entry has been accessed.
@@ -65,19 +115,30 @@ class ClipboardHistoryEntity(Base):
     """
 
     __tablename__ = "clipboard_history"
+    __table_args__ = (
+        # "recent entries": a b-tree on timestamp serves ORDER BY timestamp DESC too
+        Index("ix_clipboard_history_timestamp", "timestamp"),
+        # "recent favorites": only favorite rows are indexed, so other inserts skip it
+        Index(
+            "ix_clipboard_history_favorite_timestamp",
+            "is_favorite",
+            "timestamp",
+            postgresql_where=text("is_favorite"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    content: Mapped[str] = mapped_column(String, nullable=False, index=True)
-    content_hash: Mapped[Optional[str]] = mapped_column(
-        String, nullable=True, unique=True
+    content: Mapped[str] = mapped_column(String, nullable=False)
+    content_hash: Mapped[Optional[bytes]] = mapped_column(
+        LargeBinary(CONTENT_HASH_SIZE), nullable=True, unique=True
     )
     content_type: Mapped[str] = mapped_column(
         String(50), nullable=False, default="text"
     )
-    file_path: Mapped[Optional[str]] = mapped_column(String, nullable=True, index=True)
+    file_path: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     file_size: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     mime_type: Mapped[Optional[str]] = mapped_column(String, nullable=True)
-    thumbnail: Mapped[Optional[str]] = mapped_column(Text, nullable=True, index=True)
+    thumbnail: Mapped[Optional[bytes]] = mapped_column(LargeBinary, nullable=True)
     timestamp: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
@@ -100,26 +161,39 @@ class ClipboardHistoryEntity(Base):
         return self.id == other.id and self.content_hash == other.content_hash
 
     def __hash__(self) -> int:
+        return self._hash
+
+    @cached_property
+    def _hash(self) -> int:
+        """The hash of (id, content_hash), kept until one of the columns changes."""
         return hash((self.id, self.content_hash))
 
     @property
     def model(self) -> "ClipboardHistory":
-        return ClipboardHistory(
-            id=self.id,
-            content=self.content,
-            content_hash=self.content_hash,
-            content_type=self.content_type,
-            file_path=self.file_path,
-            file_size=self.file_size,
-            mime_type=self.mime_type,
-            thumbnail=self.thumbnail,
-            timestamp=self.timestamp,
-            is_favorite=self.is_favorite,
-            access_count=self.access_count,
-            backed_up=self.backed_up,
-            created_at=self.created_at,
-            updated_at=self.updated_at,
-        )
+        """Return the Pydantic model, read off this entity's attributes in one pass."""
+        return _CLIPBOARD_ADAPTER.validate_python(self, from_attributes=True)
+
+
+invalidate_cached_properties(ClipboardHistoryEntity, "_hash")
+
+
+def content_digest(content: str) -> bytes:
+    """
+    Compute the clipboard content_hash for a piece of content.
+
+    Args:
+        content (str): The clipboard content.
+
+    Returns:
+        bytes: The CONTENT_HASH_SIZE-byte BLAKE2b digest of the UTF-8 content.
+    """
+    return blake2b(content.encode("utf-8"), digest_size=CONTENT_HASH_SIZE).digest()
+
+
+@event.listens_for(ClipboardHistoryEntity, "before_insert")
+def _fill_content_hash(mapper, connection, target: ClipboardHistoryEntity) -> None:
+    if target.content_hash is None and target.content is not None:
+        target.content_hash = content_digest(target.content)
 
 
 # endregion
@@ -129,8 +203,8 @@ class ClipboardHistory(BaseModel):
         None, description="The unique ID of the clipboard history entry"
     )
     content: str = Field(..., description="The content of the clipboard entry")
-    content_hash: Optional[str] = Field(
-        None, description="The hash of the clipboard content"
+    content_hash: Optional[bytes] = Field(
+        None, description="The 16-byte BLAKE2b digest of the clipboard content"
     )
     content_type: str = Field(
         "text", description="The type of content (e.g., text, image)"
@@ -140,8 +214,8 @@ class ClipboardHistory(BaseModel):
     )
     file_size: Optional[int] = Field(None, description="The size of the file in bytes")
     mime_type: Optional[str] = Field(None, description="The MIME type of the content")
-    thumbnail: Optional[str] = Field(
-        None, description="Thumbnail data for image content"
+    thumbnail: Optional[bytes] = Field(
+        None, description="Raw thumbnail image bytes for image content", repr=False
     )
     timestamp: Optional[datetime] = Field(
         None, description="The timestamp of when the entry was created"
@@ -163,28 +237,43 @@ class ClipboardHistory(BaseModel):
     )
 
     model_config = ConfigDict(
-        json_schema_extra={
-            "examples": [
-                {
-                    "id": 1,
-                    "content": "Sample clipboard text",
-                    "content_hash": "abc123",
-                    "content_type": "text",
-                    "file_path": None,
-                    "file_size": None,
-                    "mime_type": "text/plain",
-                    "thumbnail": None,
-                    "timestamp": "2024-01-01T12:00:00Z",
-                    "is_favorite": True,
-                    "access_count": 5,
-                    "backed_up": False,
-                }
-            ]
-        },
+        json_schema_extra={"examples": _EXAMPLES} if OPENAPI_EXAMPLES else None,
         from_attributes=True,
+        defer_build=True,
+        ser_json_bytes="base64",
+        val_json_bytes="base64",
     )
 
+    @classmethod
+    def from_entities(
+        cls, rows: Iterable[ClipboardHistoryEntity]
+    ) -> List["ClipboardHistory"]:
+        """
+        Convert many loaded clipboard history entries in one validation pass.
+
+        Args:
+            rows (Iterable[ClipboardHistoryEntity]): The entities to convert.
+
+        Returns:
+            List[ClipboardHistory]: The models, in row order.
+        """
+        return _CLIPBOARD_LIST_ADAPTER.validate_python(list(rows), from_attributes=True)
+
+
+# endregion
+# region Adapters
+# created once at import and built on first use (defer_build); .model and
+# from_entities() then reuse the compiled validators
+_CLIPBOARD_ADAPTER = TypeAdapter(ClipboardHistory)
+_CLIPBOARD_LIST_ADAPTER = TypeAdapter(
+    List[ClipboardHistory], config=ConfigDict(defer_build=True)
+)
 
 # endregion
 
-__all__ = ["ClipboardHistoryEntity", "ClipboardHistory"]
+__all__ = [
+    "ClipboardHistoryEntity",
+    "ClipboardHistory",
+    "CONTENT_HASH_SIZE",
+    "content_digest",
+]
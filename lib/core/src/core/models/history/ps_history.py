@@ -52,12 +52,74 @@
 
 import json
 import os
-from asyncio import subprocess
+import subprocess
+import sys
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
+from pydantic import BaseModel, Field
 from sqlite_utils import Database
 
 DB_PATH = os.getenv("PS_HISTORY_LOGGING_DB_PATH", str(Path.home() / ".ps_history.db"))
-POWERSHELL_PROFILE_PATH = subprocess.run(
-    ["powershell", "-NoProfile", "-Command", "$profile"], capture_output=True, text=True
-).stdout.strip()
+
+
+@lru_cache(maxsize=1)
+def _get_ps_profile_path() -> Optional[str]:
+    """
+    Resolve the PowerShell $profile path, once, and only when logging is enabled.
+
+    Spawning PowerShell costs hundreds of milliseconds, so this is not done at import.
+
+    Returns:
+        Optional[str]: The profile path, or None when PS history logging is disabled
+            or the host is not Windows.
+    """
+    if os.getenv("PS_HISTORY_LOGGING_ENABLED", "").lower() != "true":
+        return None
+    if sys.platform != "win32":
+        return None
+    return subprocess.run(
+        ["powershell", "-NoProfile", "-Command", "$profile"],
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+
+class PSHistoryEntry(BaseModel):
+    """
+    One PowerShell command as POSTed by the profile hook sketched above.
+
+    Attributes:
+        working_directory (str): The directory the command ran in.
+        command (str): The command line.
+        timestamp (datetime): When the command ran (PowerShell "o" format, ISO 8601).
+        user (str): The user that ran the command.
+        session_id (Optional[str]): The PowerShell session id, if set.
+        exit_code (Optional[int]): $LASTEXITCODE; null until a native command has run.
+    """
+
+    working_directory: str = Field(..., description="Directory the command ran in")
+    command: str = Field(..., description="The command line")
+    timestamp: datetime = Field(..., description="When the command ran")
+    user: str = Field(..., description="User that ran the command")
+    session_id: Optional[str] = Field(None, description="PowerShell session id")
+    exit_code: Optional[int] = Field(None, description="$LASTEXITCODE")
+
+    @classmethod
+    def from_body(cls, body: bytes) -> "PSHistoryEntry":
+        """
+        Parse a raw request body.
+
+        The endpoint should hand the body bytes straight to this rather than
+        json.loads() them first: model_validate_json() parses and validates in
+        one pass inside pydantic-core.
+
+        Args:
+            body (bytes): The JSON request body.
+
+        Returns:
+            PSHistoryEntry: The validated entry.
+        """
+        return cls.model_validate_json(body)
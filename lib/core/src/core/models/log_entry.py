@@ -15,23 +15,34 @@ Contents:
 Design notes:
 - Timestamps are stored with timezone awareness and default to the current time
     on the database server.
+- LogEntryEntity.bulk_copy_insert() appends a batch of entries in one statement (or
+    one COPY), so ingestion pays one transaction per batch rather than per row.
 - The service field allows filtering logs by component (e.g., 'controller',
     'converter') for easier debugging and monitoring.
 - Equality and hashing are based on all log attributes to support set operations
-    and duplicate detection.
+    and duplicate detection. The hash and the .dict values are cached on the instance
+    until a column is set, the row is flushed, or the instance is expired; .dict hands
+    out a copy so callers cannot change the cached values.
+- .model converts through a module-level TypeAdapter that reads the entity attributes
+    directly; LogEntry also sets from_attributes=True so LogEntry.model_validate(entity)
+    takes the same path.
+- LogEntry.from_entities() converts many rows in a single list validation.
+- The Pydantic model and its TypeAdapters are built with defer_build=True, so importing
+    this module for the entity alone does not compile the pydantic-core validator.
 """
 
 # endregion
 # region Imports
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timezone
+from functools import cached_property
+from typing import Iterable, List, Optional, Sequence
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from sqlalchemy import DateTime, Integer, String
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import Mapped, Session, mapped_column
 from sqlalchemy.sql import func
 
-from core.database import Base
+from core.database import Base, copy_rows, invalidate_cached_properties
 
 # endregion
 # region Sqlalchemy Model
@@ -80,22 +91,42 @@ class LogEntryEntity(Base):
         )
 
     def __hash__(self) -> int:
+        return self._hash
+
+    @cached_property
+    def _hash(self) -> int:
+        """The hash of the log attributes, kept until one of the columns changes."""
         return hash((self.timestamp, self.level, self.service, self.message))
 
     @property
     def model(self) -> "LogEntry":
-        from core.models import LogEntry
-
-        return LogEntry(
-            id=self.id,
-            timestamp=self.timestamp,
-            level=self.level,
-            service=self.service,
-            message=self.message,
-        )
-
-    @property
-    def dict(self) -> dict:
+        """Return the Pydantic model, read off this entity's attributes in one pass."""
+        return _LOG_ENTRY_ADAPTER.validate_python(self, from_attributes=True)
+
+    @classmethod
+    def bulk_copy_insert(cls, session: Session, entries: Sequence["LogEntry"]) -> None:
+        """
+        Insert many LogEntry models in one round-trip.
+
+        Batches larger than core.database.COPY_THRESHOLD are streamed with
+        PostgreSQL COPY; smaller ones use a single multi-row INSERT. Entries
+        without a timestamp share one taken at call time, since every row of a
+        batch must carry the same columns. The caller owns the transaction.
+
+        Args:
+            session (Session): The session to insert with.
+            entries (Sequence[LogEntry]): The models to insert.
+        """
+        now = datetime.now(timezone.utc)
+        rows = [entry.model_dump(exclude={"id"}) for entry in entries]
+        for row in rows:
+            if row["timestamp"] is None:
+                row["timestamp"] = now
+        copy_rows(session, cls.__table__, rows)
+
+    @cached_property
+    def _dict(self) -> dict:
+        """The column values, kept until the row is changed, flushed, or expired."""
         return {
             "id": self.id,
             "timestamp": self.timestamp,
@@ -104,6 +135,14 @@ class LogEntryEntity(Base):
             "message": self.message,
         }
 
+    @property
+    def dict(self) -> dict:
+        """Return the column values as a new dict the caller may modify."""
+        return dict(self._dict)
+
+
+invalidate_cached_properties(LogEntryEntity, "_hash", "_dict")
+
 
 # endregion
 # region Pydantic Model
@@ -132,6 +171,21 @@ class LogEntry(BaseModel):
     )
     message: str = Field(..., description="Log message")
 
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
+
+    @classmethod
+    def from_entities(cls, rows: Iterable[LogEntryEntity]) -> List["LogEntry"]:
+        """
+        Convert many loaded log entries in one validation pass.
+
+        Args:
+            rows (Iterable[LogEntryEntity]): The entities to convert.
+
+        Returns:
+            List[LogEntry]: The models, in row order.
+        """
+        return _LOG_ENTRY_LIST_ADAPTER.validate_python(list(rows), from_attributes=True)
+
     @property
     def entity(self) -> LogEntryEntity:
         return LogEntryEntity(
@@ -143,6 +197,15 @@ class LogEntry(BaseModel):
         )
 
 
+# endregion
+# region Adapters
+# created once at import and built on first use (defer_build); .model and
+# from_entities() then reuse the compiled validators
+_LOG_ENTRY_ADAPTER = TypeAdapter(LogEntry)
+_LOG_ENTRY_LIST_ADAPTER = TypeAdapter(
+    List[LogEntry], config=ConfigDict(defer_build=True)
+)
+
 # endregion
 
-__all__ = ["LogEntryEntity"]
+__all__ = ["LogEntryEntity", "LogEntry"]
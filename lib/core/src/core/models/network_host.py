@@ -11,33 +11,49 @@ Contents:
 - SQLAlchemy entities:
     - NetworkHostEntity:
         Persists a single network host with hostname, IP address, MAC address,
-        device type, and notes. Includes helpers for equality (based on IP or MAC),
+        device type, and notes. Includes helpers for equality (MAC, else IP),
         hashing, and conversion to a NetworkHost Pydantic model via the .model property.
 - Pydantic models:
     - NetworkHost:
         A domain model representing a single network host. Includes hostname, IP address,
         MAC address, device type, notes, and timestamp fields. Added/updated timestamps
-        are parsed from ISO strings and serialized back to ISO strings.
+        accept ISO strings and dump to ISO strings in JSON mode.
 Design notes:
-- .model property on the SQLAlchemy entity provides an immediate conversion to the Pydantic
-    model for safe I/O layers.
-- Pydantic validators and serializers normalize timestamps (ISO 8601) and flexible input
-    shapes.
-- Equality comparison on NetworkHostEntity is based on IP address or MAC address matching,
-    reflecting that either can uniquely identify a network host.
+- .model on the SQLAlchemy entity validates the entity's attributes through a
+    module-level TypeAdapter (from_attributes=True); from_entities() on the model
+    converts many rows in a single list validation. added_at reads the entity's
+    created_at column through a validation alias.
+- NetworkHost.row holds the column values; .entity and
+    NetworkHostEntity.bulk_copy_insert() (core.database.copy_rows) both build on it.
+- Timestamps rely on pydantic-core's native datetime handling (ISO 8601 in and out);
+    there are no Python-level validators or serializers on the model.
+- Equality and hashing on NetworkHostEntity use one canonical key: the MAC address, or
+    the IP address for hosts without one. Matching on either field (the old OR) was
+    not consistent with __hash__, so sets and dicts silently dropped hosts.
+- The entity's _key and .dict values are cached until a column is set, the row is
+    flushed, or the instance is expired; .dict hands out a copy of the cached values.
 - The model uses ConfigDict with from_attributes=True to enable ORM mode compatibility.
+- The Pydantic model and its TypeAdapters are built with defer_build=True, so importing
+    this module for the entity alone does not compile the pydantic-core validator.
 """
 
 # endregion
 # region Imports
 from datetime import datetime
-from typing import Optional
-
-from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
+from functools import cached_property
+from typing import Any, Iterable, List, Optional, Sequence
+
+from pydantic import (
+    AliasChoices,
+    BaseModel,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+)
 from sqlalchemy import DateTime, Integer, String, func
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import Mapped, Session, mapped_column
 
-from core.database import Base
+from core.database import Base, copy_rows, invalidate_cached_properties
 
 # endregion
 # region SQLAlchemy Model
@@ -82,30 +98,39 @@ class NetworkHostEntity(Base):
         if not isinstance(other, NetworkHostEntity):
             return NotImplemented
 
-        return (
-            self.ip_address == other.ip_address
-            or self.mac_address == other.mac_address  # noqa: E501
-        )
+        return self._key == other._key
 
     def __hash__(self) -> int:
-        return hash((self.ip_address, self.mac_address))
+        return hash(self._key)
 
-    @property
-    def model(self) -> "NetworkHost":
-        """Return the Pydantic model representation of the network host."""
-        return NetworkHost.model_validate(
-            {
-                "id": self.id,
-                "hostname": self.hostname,
-                "ip_address": self.ip_address,
-                "mac_address": self.mac_address,
-                "device_type": self.device_type,
-                "notes": self.notes,
-            }
-        )
+    @cached_property
+    def _key(self) -> Optional[str]:
+        """The host identity: the MAC address, or the IP address when it has none."""
+        return self.mac_address or self.ip_address
 
     @property
-    def dict(self) -> dict[str, Optional[str]]:
+    def model(self) -> "NetworkHost":
+        """Return the Pydantic model, read off this entity's attributes in one pass."""
+        return _NETWORK_HOST_ADAPTER.validate_python(self, from_attributes=True)
+
+    @classmethod
+    def bulk_copy_insert(cls, session: Session, hosts: Sequence["NetworkHost"]) -> None:
+        """
+        Insert many NetworkHost models in one round-trip.
+
+        Batches larger than core.database.COPY_THRESHOLD are streamed with
+        PostgreSQL COPY; smaller ones use a single multi-row INSERT. The timestamp
+        columns are left to the database. The caller owns the transaction.
+
+        Args:
+            session (Session): The session to insert with.
+            hosts (Sequence[NetworkHost]): The models to insert.
+        """
+        copy_rows(session, cls.__table__, [host.row for host in hosts])
+
+    @cached_property
+    def _dict(self) -> dict[str, Any]:
+        """The column values, kept until the row is changed, flushed, or expired."""
         return {
             "id": self.id,
             "hostname": self.hostname,
@@ -117,6 +142,14 @@ class NetworkHostEntity(Base):
             "updated_at": self.updated_at,
         }
 
+    @property
+    def dict(self) -> dict[str, Any]:
+        """Return the column values as a new dict the caller may modify."""
+        return dict(self._dict)
+
+
+invalidate_cached_properties(NetworkHostEntity, "_key", "_dict")
+
 
 # endregion
 # region Pydantic Model
@@ -155,49 +188,59 @@ class NetworkHost(BaseModel):
         description="Additional notes about the network host",
     )
     added_at: Optional[datetime] = Field(
-        None, description="Timestamp when the network host was added"
+        None,
+        validation_alias=AliasChoices("added_at", "created_at"),
+        description="Timestamp when the network host was added",
     )
     updated_at: Optional[datetime] = Field(
         None, description="Timestamp when the network host was last updated"
     )
 
-    @field_serializer("added_at")
-    def serialize_added_at(self, v: Optional[datetime]) -> Optional[str]:
-        if v:
-            return v.isoformat()
-        return None
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
+
+    @classmethod
+    def from_entities(cls, rows: Iterable[NetworkHostEntity]) -> List["NetworkHost"]:
+        """
+        Convert many loaded network hosts in one validation pass.
 
-    @field_serializer("updated_at")
-    def serialize_updated_at(self, v: Optional[datetime]) -> Optional[str]:
-        if v:
-            return v.isoformat()
-        return None
+        Args:
+            rows (Iterable[NetworkHostEntity]): The entities to convert.
 
-    @field_validator("added_at", mode="before")
-    def validate_added_at(cls, v: Optional[datetime]) -> Optional[datetime]:
-        if isinstance(v, str):
-            return datetime.fromisoformat(v)
-        return v
+        Returns:
+            List[NetworkHost]: The models, in row order.
+        """
+        return _NETWORK_HOST_LIST_ADAPTER.validate_python(
+            list(rows), from_attributes=True
+        )
 
-    @field_validator("updated_at", mode="before")
-    def validate_updated_at(cls, v: Optional[datetime]) -> Optional[datetime]:
-        if isinstance(v, str):
-            return datetime.fromisoformat(v)
-        return v
+    @property
+    def row(self) -> dict[str, Any]:
+        """
+        Return the NetworkHostEntity column values, e.g. for a bulk INSERT.
 
-    model_config = ConfigDict(from_attributes=True)
+        The id is left out so the database assigns it.
+        """
+        return {
+            "hostname": self.hostname,
+            "ip_address": self.ip_address,
+            "mac_address": self.mac_address,
+            "device_type": self.device_type,
+            "notes": self.notes,
+        }
 
     @property
     def entity(self) -> NetworkHostEntity:
-        return NetworkHostEntity(
-            id=self.id if self.id is not None else None,
-            hostname=self.hostname,
-            ip_address=self.ip_address,
-            mac_address=self.mac_address,
-            device_type=self.device_type,
-            notes=self.notes,
-        )
+        return NetworkHostEntity(id=self.id, **self.row)
+
 
+# endregion
+# region Adapters
+# created once at import and built on first use (defer_build); .model and
+# from_entities() then reuse the compiled validators
+_NETWORK_HOST_ADAPTER = TypeAdapter(NetworkHost)
+_NETWORK_HOST_LIST_ADAPTER = TypeAdapter(
+    List[NetworkHost], config=ConfigDict(defer_build=True)
+)
 
 # endregion
 
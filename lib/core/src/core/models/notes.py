@@ -10,37 +10,151 @@ Overview:
 Contents:
 - SQLAlchemy entities:
     - NoteEntity:
-        Persists a single agent note with title, content, tags, and database timestamps.
+        Persists a single agent note with title, content, tags, database timestamps,
+        and the rendered markdown (rendered_md).
         Includes helpers for equality, hashing, YAML front matter generation, and conversion
         to a Note Pydantic model via the .model property.
 - Pydantic models:
     - Note:
-        A domain model representing a single agent note. Includes title, content, optional
-        tags, and created/updated timestamps. Provides YAML front matter generation for
-        Obsidian-compatible output. Validators ensure tags default to empty list when None.
-        Serializers normalize timestamps to ISO 8601 strings.
+        A domain model representing a single agent note. Includes title, content, tags
+        (a tuple, empty by default), and created/updated timestamps. Provides YAML front
+        matter generation for Obsidian-compatible output.
 Design notes:
 - .model property on SQLAlchemy entity provides immediate conversion to Pydantic model
-    for safe I/O layers.
+    for safe I/O layers, validating straight from the entity's attributes. The
+    frozen Note is cached on the entity until a column changes.
+- Note.from_entities() converts many rows in a single list validation, and
+    Note.dump_many_json() / Note.load_many_json() serialize and parse a batch in a
+    single pydantic-core pass each.
 - YAML front matter generation enables seamless integration with Obsidian and other
-    markdown-based note systems.
-- Pydantic validators and serializers normalize timestamps (ISO 8601) and ensure
-    consistent tag handling (empty list vs None).
+    markdown-based note systems. The block has a fixed shape (title, tags, two
+    timestamps), so _render_front_matter() writes it directly from a template instead
+    of going through yaml.dump; tests check the output with yaml.safe_load.
+    The rendered front matter is cached on NoteEntity until a column is set or the row
+    expires. Note renders it on each access: the template fill is cheap, and a cached
+    value would be carried over, stale, by model_copy(update=...).
+- The front matter is rendered in a fixed key order, so it is deterministic and
+    front_matter_sha1 can serve as a content hash (ETag, cache key) downstream.
+- Timestamps use pydantic-core's native datetime handling: model_dump(mode="json")
+    and model_dump_json() emit ISO 8601 strings. The one Python validator left maps
+    NULL tags from the nullable column to an empty tuple.
+- Timestamps are generated in Python (default/onupdate) rather than by the server, so
+    created_at and updated_at are known after a flush without a refresh.
+- rendered_md stores full_content_with_front_matter, written by before_insert and
+    before_update hooks, so serving a note's markdown is a column read rather than a
+    render. before_update only re-renders, and bumps updated_at, when a column
+    actually changed. It is deferred ("heavy" group) so listings do not load it.
+- tags is JSONB with a GIN index, so containment filters on tags are index lookups.
+- updated_at and title are indexed for the list queries (recent first, by title).
 - ConfigDict with from_attributes=True enables direct model validation from ORM objects.
+- NoteEntity equality and hashing use the id once the row has one; transient notes
+    (id None) compare by identity, so a batch of new notes does not collapse in a set.
+- Note is frozen, with tags as a tuple, and hashes by id, so notes can be collected in
+    sets and used as keys, and the Note cached on NoteEntity.model can be shared
+    without callers changing it under each other.
 
 """
 
 # endregion
 # region Imports
-from datetime import datetime
-from typing import Optional
-
-import yaml
-from pydantic import BaseModel, ConfigDict, field_serializer, field_validator
-from sqlalchemy import JSON, DateTime, Integer, String, func
+import json
+import re
+from datetime import datetime, timezone
+from functools import cached_property
+from hashlib import sha1
+from typing import Iterable, List, Optional, Sequence
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    TypeAdapter,
+    field_validator,
+)
+from sqlalchemy import DateTime, Index, Integer, String, event, inspect
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
-from core.database import Base
+from core.database import Base, invalidate_cached_properties
+
+
+# endregion
+# region Helpers
+def _utcnow() -> datetime:
+    """Timezone-aware now, for the note timestamp columns."""
+    return datetime.now(timezone.utc)
+
+
+# endregion
+# region Front Matter
+_FRONT_MATTER_TEMPLATE = (
+    "---\n"
+    "title: {title}\n"
+    "tags: [{tags}]\n"
+    "created_at: {created_at}\n"
+    "updated_at: {updated_at}\n"
+    "---\n"
+).format
+"""Fills the fixed front matter layout with already-quoted YAML scalars."""
+
+_PLAIN_YAML_STR = re.compile(
+    r"[\x20-\x7e\xa0-\u2027\u202a-\ud7ff\ue000-\ufffd\U00010000-\U0010ffff]*"
+)
+"""Strings a single-quoted YAML scalar holds as-is (printable, no line breaks)."""
+
+_YAML_UNSAFE_CHAR = re.compile(
+    r"[^\x20-\x7e\xa0-\u2027\u202a-\ud7ff\ue000-\ufffd\U00010000-\U0010ffff]"
+)
+"""Characters a double-quoted YAML scalar must hold as an escape sequence."""
+
+
+def _escape_yaml_char(match: re.Match) -> str:
+    return "\\u%04x" % ord(match.group())
+
+
+def _escape_yaml_str(value: str) -> str:
+    """Quote a string as a YAML scalar: single-quoted, else JSON-style double-quoted."""
+    if _PLAIN_YAML_STR.fullmatch(value):
+        return "'" + value.replace("'", "''") + "'"
+    # ensure_ascii=False keeps astral characters whole (JSON would write surrogate
+    # pairs, which YAML loads as two lone surrogates); the remaining controls, YAML
+    # line breaks, and lone surrogates are escaped the way YAML reads them
+    return _YAML_UNSAFE_CHAR.sub(
+        _escape_yaml_char, json.dumps(value, ensure_ascii=False)
+    )
+
+
+def _render_front_matter(
+    title: str,
+    tags: Optional[Sequence[str]],
+    created_at: Optional[datetime],
+    updated_at: Optional[datetime],
+) -> str:
+    """
+    Render the front matter block for a note.
+
+    The four fields have fixed scalar types, so the YAML is filled into a fixed
+    template (tags as a flow sequence) rather than going through PyYAML's
+    resolver/representer/emitter. Every string is quoted, so it loads back as the
+    same values yaml.dump would have produced.
+
+    Args:
+        title (str): The note title.
+        tags (Optional[Sequence[str]]): The note tags.
+        created_at (Optional[datetime]): When the note was created.
+        updated_at (Optional[datetime]): When the note was last updated.
+
+    Returns:
+        str: The front matter, including both --- fences and a trailing newline.
+    """
+    created = created_at.isoformat() if created_at else None
+    updated = updated_at.isoformat() if updated_at else None
+    return _FRONT_MATTER_TEMPLATE(
+        title=_escape_yaml_str(title),
+        tags=", ".join(map(_escape_yaml_str, tags or ())),
+        created_at=_escape_yaml_str(created) if created else "null",
+        updated_at=_escape_yaml_str(updated) if updated else "null",
+    )
+
 
 # endregion
 # region Sqlalchemy Note Model
@@ -53,26 +167,39 @@ class NoteEntity(Base):
         id (int): Primary key.
         content (str): The content of the note.
         title (str): The title of the note.
-        tags (JSON): Tags associated with the note.
+        tags (JSONB): Tags associated with the note.
+        rendered_md (str): Front matter and content as one markdown document.
         created_at (datetime): Timestamp when the note was created.
         updated_at (datetime): Timestamp when the note was last updated.
     """
 
     __tablename__ = "notes"
+    __table_args__ = (
+        # tag filters (tags @> '["x"]') use this instead of a table scan
+        Index("ix_notes_tags_gin", "tags", postgresql_using="gin"),
+        # list endpoints: recently updated first, and lookup/sort by title
+        Index("ix_notes_updated_at", "updated_at"),
+        Index("ix_notes_title", "title"),
+    )
 
     id: Mapped[int] = mapped_column(
         Integer, primary_key=True, autoincrement=True
     )  # noqa: E501
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     content: Mapped[str] = mapped_column(String, nullable=False)
-    tags: Mapped[list[str]] = mapped_column(JSON, nullable=True)
+    tags: Mapped[list[str]] = mapped_column(JSONB, nullable=True)
+    # front matter + content, written on every flush so markdown reads skip rendering
+    rendered_md: Mapped[str] = mapped_column(
+        String, nullable=False, deferred=True, deferred_group="heavy"
+    )
 
     # timestamps
+    # set in Python so the values are known after a flush without a refresh
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now()
+        DateTime(timezone=True), default=_utcnow
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+        DateTime(timezone=True), default=_utcnow, onupdate=_utcnow
     )
 
     def __repr__(self) -> str:
@@ -81,41 +208,40 @@ class NoteEntity(Base):
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, NoteEntity):
             return NotImplemented
-
+        # unsaved notes have no id yet; only the same object is equal to them
+        if self.id is None or other.id is None:
+            return self is other
         return self.id == other.id
 
     def __hash__(self) -> int:
-        return hash(self.id)
+        return hash(self.id) if self.id is not None else object.__hash__(self)
 
-    @property
+    @cached_property
     def yaml_front_matter(self) -> str:
-        """Generate YAML front matter for the note."""
-        front_matter = {
-            "title": self.title,
-            "tags": self.tags or [],
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
-        }
-        return "---\n" + yaml.dump(front_matter) + "---\n"
+        """Generate YAML front matter for the note, cached until a column changes."""
+        return _render_front_matter(
+            self.title, self.tags, self.created_at, self.updated_at
+        )
+
+    @cached_property
+    def front_matter_sha1(self) -> str:
+        """SHA-1 hex digest of the front matter, e.g. for an ETag or cache key."""
+        return sha1(self.yaml_front_matter.encode("utf-8")).hexdigest()
 
     @property
     def full_content_with_front_matter(self) -> str:
         """Get the full content of the note including YAML front matter."""
         return self.yaml_front_matter + self.content
 
-    @property
+    @cached_property
     def model(self) -> "Note":
-        """Return the Pydantic model representation of the note."""
-        return Note.model_validate(
-            {
-                "id": self.id,
-                "title": self.title,
-                "content": self.content,
-                "tags": self.tags,
-                "created_at": self.created_at,
-                "updated_at": self.updated_at,
-            }
-        )
+        """
+        Return the Pydantic model, read off this entity's attributes in one pass.
+
+        Note is frozen, so the model is cached and shared until a column is set or
+        the row expires; templates and debuggers touching .model do not revalidate.
+        """
+        return Note.model_validate(self)
 
     @property
     def dict(self) -> dict[str, Optional[str]]:
@@ -129,6 +255,36 @@ class NoteEntity(Base):
         }
 
 
+invalidate_cached_properties(
+    NoteEntity, "yaml_front_matter", "front_matter_sha1", "model"
+)
+
+
+@event.listens_for(NoteEntity, "before_insert")
+def _render_on_insert(mapper, connection, target: NoteEntity) -> None:
+    # the front matter carries the timestamps, and column defaults are only applied
+    # after this hook, so they are set here
+    now = _utcnow()
+    if target.created_at is None:
+        target.created_at = now
+    if target.updated_at is None:
+        target.updated_at = now
+    target.rendered_md = target.full_content_with_front_matter
+
+
+@event.listens_for(NoteEntity, "before_update")
+def _render_on_update(mapper, connection, target: NoteEntity) -> None:
+    # before_update also runs for notes that were only marked dirty (e.g. a column
+    # set to its current value); those keep their updated_at and rendered_md
+    changed = {attr.key for attr in inspect(target).attrs if attr.history.has_changes()}
+    if not changed - {"rendered_md"}:
+        return
+    # set here (not left to onupdate) so the rendered front matter matches the row
+    if "updated_at" not in changed:
+        target.updated_at = _utcnow()
+    target.rendered_md = target.full_content_with_front_matter
+
+
 # endregion
 # region Pydantic Note Model
 
@@ -137,22 +293,27 @@ class Note(BaseModel):
     id: Optional[int] = None
     title: str
     content: str
-    tags: Optional[list[str]] = None
+    tags: tuple[str, ...] = ()
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+    def __hash__(self) -> int:
+        # equal notes share an id, so this agrees with the field-wise __eq__
+        return hash(self.id)
 
     @property
     def yaml_front_matter(self) -> str:
         """Generate YAML front matter for the note."""
-        front_matter = {
-            "title": self.title,
-            "tags": self.tags or [],
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-        }
-        return "---\n" + yaml.dump(front_matter) + "---\n"
+        return _render_front_matter(
+            self.title, self.tags, self.created_at, self.updated_at
+        )
+
+    @property
+    def front_matter_sha1(self) -> str:
+        """SHA-1 hex digest of the front matter, e.g. for an ETag or cache key."""
+        return sha1(self.yaml_front_matter.encode("utf-8")).hexdigest()
 
     @property
     def full_content_with_front_matter(self) -> str:
@@ -160,24 +321,48 @@ class Note(BaseModel):
         return self.yaml_front_matter + self.content
 
     @field_validator("tags", mode="before")
-    def validate_tags(cls, v: Optional[list[str]]) -> list[str]:
-        """Ensure tags is always a list, even if None is provided."""
-        return v or []
+    def validate_tags(cls, v: Optional[Sequence[str]]) -> Sequence[str]:
+        """Read NULL tags (the column is nullable) as no tags."""
+        return v or ()
+
+    @classmethod
+    def from_entities(cls, rows: Iterable[NoteEntity]) -> List["Note"]:
+        """
+        Convert many loaded notes in one validation pass.
+
+        Args:
+            rows (Iterable[NoteEntity]): The entities to convert.
 
-    @field_serializer("tags")
-    def serialize_tags(self, v: Optional[list[str]]) -> list[str]:
-        """Serialize tags to an empty list if None."""
-        return v or []
+        Returns:
+            List[Note]: The models, in row order.
+        """
+        return _NOTE_LIST_ADAPTER.validate_python(list(rows), from_attributes=True)
 
-    @field_serializer("created_at")
-    def serialize_created_at(self, v: Optional[datetime]) -> Optional[str]:
-        """Serialize created_at to ISO format string."""
-        return v.isoformat() if v else None
+    @classmethod
+    def dump_many_json(cls, notes: Sequence["Note"]) -> bytes:
+        """
+        Serialize many notes to a JSON array with one reusable serializer.
 
-    @field_serializer("updated_at")
-    def serialize_updated_at(self, v: Optional[datetime]) -> Optional[str]:
-        """Serialize updated_at to ISO format string."""
-        return v.isoformat() if v else None
+        Args:
+            notes (Sequence[Note]): The notes to dump.
+
+        Returns:
+            bytes: The JSON array.
+        """
+        return _NOTE_LIST_ADAPTER.dump_json(notes)
+
+    @classmethod
+    def load_many_json(cls, data: bytes) -> List["Note"]:
+        """
+        Parse and validate a JSON array of notes in one pass, e.g. a bulk import body.
+
+        Args:
+            data (bytes): The JSON array, as written by dump_many_json().
+
+        Returns:
+            List[Note]: The validated notes.
+        """
+        return _NOTE_LIST_ADAPTER.validate_json(data)
 
     @property
     def entity(self) -> NoteEntity:
@@ -185,10 +370,16 @@ class Note(BaseModel):
             id=self.id if self.id is not None else None,
             title=self.title,
             content=self.content,
-            tags=self.tags,
+            tags=list(self.tags),
         )
 
 
+# endregion
+# region Adapters
+# built once at import; from_entities(), dump_many_json() and load_many_json() reuse
+# it, and are the batch API for I/O layers
+_NOTE_LIST_ADAPTER = TypeAdapter(List[Note])
+
 # endregion
 
 
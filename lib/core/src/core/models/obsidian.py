@@ -42,7 +42,8 @@ Contents:
         A PostgreSQL trigger function and trigger that:
             1) Deletes existing line rows for a note when its lines_json is inserted/updated.
             2) Re-inserts non-empty lines from lines_json into the obsidian_file_lines table
-               with line_number, content, and content_hash (MD5).
+               with line_number, content, and content_hash (MD5), as a single
+               INSERT ... SELECT over jsonb_array_elements() rather than a row loop.
         Expected lines_json shape:
             { "lines": [ {"content": "string", "line_number": 1}, ... ] }
 
@@ -89,6 +90,8 @@ Design Notes:
     are indexed into a relational structure suitable for fast full-text search.
 - All models use Pydantic v2 conventions with field_validator, field_serializer,
     and model_serializer decorators for consistent behavior.
+- Vault index JSON strings are parsed/dumped with core.database.json_loads/json_dumps
+    (orjson when the "speedups" extra is installed), like the JSON columns.
 """
 
 # endregion
@@ -127,7 +130,7 @@ from core.base import (
     BaseScanResult,
     TextFileLine,
 )
-from core.database import Base
+from core.database import Base, json_dumps, json_loads
 
 # endregion
 # region Constants
@@ -348,29 +351,24 @@ class ObsidianNoteEntity(Base):
 note_shred_lines_func = DDL("""
 CREATE OR REPLACE FUNCTION process_obsidian_file_lines()
 RETURNS TRIGGER AS $$
-DECLARE
-    line_obj jsonb;
 BEGIN
     -- 1. Clear existing lines
     DELETE FROM obsidian_file_lines WHERE file_id = NEW.id;
 
-    -- 2. Insert new lines
-    -- Cast to JSONB for better iteration if column is JSON
-    IF NEW.lines_json::jsonb -> 'lines' IS NOT NULL THEN
-        FOR line_obj IN SELECT * FROM jsonb_array_elements(NEW.lines_json::jsonb -> 'lines')
-        LOOP
-            -- Check content is not empty string
-            IF length(trim(line_obj->>'content')) > 0 THEN
-                INSERT INTO obsidian_file_lines (file_id, line_number, content, content_hash)
-                VALUES (
-                    NEW.id,
-                    (line_obj->>'line_number')::int,
-                    line_obj->>'content',
-                    md5(line_obj->>'content')
-                );
-            END IF;
-        END LOOP;
-    END IF;
+    -- 2. Insert new lines in one set-based statement
+    -- Cast to JSONB for better iteration if column is JSON; a missing 'lines'
+    -- array becomes '[]' and inserts nothing
+    INSERT INTO obsidian_file_lines (file_id, line_number, content, content_hash)
+    SELECT
+        NEW.id,
+        (line_obj->>'line_number')::int,
+        line_obj->>'content',
+        md5(line_obj->>'content')
+    FROM jsonb_array_elements(
+        COALESCE(NEW.lines_json::jsonb -> 'lines', '[]'::jsonb)
+    ) AS line_obj
+    -- Skip blank lines
+    WHERE length(btrim(line_obj->>'content')) > 0;
 
     RETURN NEW;
 END;
@@ -729,7 +727,7 @@ class ObsidianVault(BaseDirectory):
             return v
         if isinstance(v, str):
             try:
-                return json.loads(v)
+                return json_loads(v)
             except json.JSONDecodeError as e:
                 raise ValueError(f"Invalid JSON string for index_json: {e}")
         elif isinstance(v, dict):
@@ -740,7 +738,7 @@ class ObsidianVault(BaseDirectory):
         return {
             **super().serialize_model(),
             "notes": [note.model_dump() for note in self.notes],
-            "index_json": (json.dumps(self.index_json) if self.index_json else None),
+            "index_json": (json_dumps(self.index_json) if self.index_json else None),
             "added_at": self.serialize_added_at(self.added_at),
             "updated_at": self.serialize_updated_at(self.updated_at),
         }
@@ -801,11 +799,14 @@ class ObsidianScanResult(BaseScanResult):
         return {
             **super().serialize_model(),
             "vault_index_json": (
-                json.dumps(self.vault_index_json) if self.vault_index_json else None
+                json_dumps(self.vault_index_json) if self.vault_index_json else None
             ),
             "vault_notes": [file.model_dump() for file in self.vault_notes],
         }
 
+    def scanned_files(self) -> List["ObsidianNote"]:
+        return self.vault_notes
+
     @property
     def notes(self) -> List["ObsidianNote"]:
         return self.vault_notes
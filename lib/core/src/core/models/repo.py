@@ -779,6 +779,11 @@ class RepoScanResult(BaseScanResult):
             return Repo.model_validate(v)
         return v
 
+    def scanned_files(self) -> List[RepoFile]:
+        if self.repo_model is None:
+            return []
+        return self.repo_model.files
+
     @model_serializer(when_used="json")
     def serialize_model(self) -> dict:
         return {
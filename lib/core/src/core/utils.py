@@ -19,6 +19,10 @@ Functions for file operations and model creation:
 - get_file_stat_model: Get OS-appropriate file stat model
 - get_path_model: Get the PathModel for a given file path
 - get_mime_type: Get the MIME type of a file based on extension
+- get_fingerprint_cache: Open the on-disk (path, mtime, size) fingerprint cache
+- get_file_fingerprint: Get a file's SHA256 and MIME type, memoized on its stat
+- get_file_extract: Memoize an expensive per-file extraction (ffprobe, sqlite_master)
+    on the file's stat in the same cache
 - BaseFileModel_from_Path: Create a BaseFileModel from a file path
 - ImageFileModel_from_Path: Create an ImageFileModel from an image file path
 - VideoFileModel_from_Path: Create a VideoFileModel from a video file path
@@ -43,13 +47,23 @@ Dependencies
 # endregion
 # region Imports
 # import sys
+import json
+import os
+import sqlite3
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from logging import Logger
 from pathlib import Path
-from typing import Optional, Union
+from threading import Lock
+from typing import Any, Callable, Optional, Union
 
 import git
 
+try:
+    from ciso8601 import parse_datetime as _parse_datetime
+except ImportError:  # optional speedup, see the "speedups" extra
+    _parse_datetime = datetime.fromisoformat
+
 from core.constants import (
     DATA_FORMAT_LIST,
     IMAGE_FORMAT_LIST,
@@ -63,6 +77,12 @@ from core.constants import (
 # region General Utilities
 # General utility functions for various tasks.
 
+# O(1) suffix lookups for the is_*_file checks, which run once per scanned file
+_MARKDOWN_SUFFIXES = frozenset(MARKDOWN_EXTENSIONS)
+_IMAGE_SUFFIXES = frozenset(IMAGE_FORMAT_LIST)
+_VIDEO_SUFFIXES = frozenset(VIDEO_FORMAT_LIST)
+_DATA_SUFFIXES = frozenset(DATA_FORMAT_LIST)
+
 
 def is_markdown_formattable(path: Path) -> bool:
     """Check if the given path has a markdown file extension.
@@ -79,7 +99,7 @@ def is_markdown_formattable(path: Path) -> bool:
         >>> is_markdown_formattable(Path("image.png"))
         False
     """
-    return path.suffix.lower() in MARKDOWN_EXTENSIONS
+    return path.suffix.lower() in _MARKDOWN_SUFFIXES
 
 
 def is_image_file(path: Path) -> bool:
@@ -98,7 +118,7 @@ def is_image_file(path: Path) -> bool:
         >>> is_image_file(Path("video.mp4"))
         False
     """
-    return path.suffix.lower() in IMAGE_FORMAT_LIST
+    return path.suffix.lower() in _IMAGE_SUFFIXES
 
 
 def is_video_file(path: Path) -> bool:
@@ -117,7 +137,7 @@ def is_video_file(path: Path) -> bool:
         >>> is_video_file(Path("document.pdf"))
         False
     """
-    return path.suffix.lower() in VIDEO_FORMAT_LIST
+    return path.suffix.lower() in _VIDEO_SUFFIXES
 
 
 def is_binary_file(path: Path) -> bool:
@@ -168,7 +188,7 @@ def is_data_file(path: Path) -> bool:
         >>> is_data_file(Path("image.png"))
         False
     """
-    return path.suffix.lower() in DATA_FORMAT_LIST
+    return path.suffix.lower() in _DATA_SUFFIXES
 
 
 def get_sqlite_schema(path: Path) -> str:
@@ -246,6 +266,8 @@ def get_sqlite_tables(path: Path) -> list[str]:
 # - get_file_stat_model: Get the appropriate file stat model based on the OS.
 # - get_path_model: Get the PathModel for a given file path.
 # - get_mime_type: Get the MIME type of a file based on its extension.
+# - get_file_fingerprint: Get the SHA256 and MIME type of a file, memoized on its stat.
+# - get_file_extract: Memoize an expensive per-file extraction on the file's stat.
 # - extract_audio_track_from_video: Extract the audio track from a video file.
 # - BaseFileModel_from_Path: Create a BaseFileModel instance from a given file path.
 # - ImageFileModel_from_Path: Create an ImageFileModel instance from a given file path.
@@ -274,12 +296,11 @@ def get_file_sha256(file_path: Path) -> str:
     """
     import hashlib
 
-    sha256_hash = hashlib.sha256()
     try:
+        # file_digest reads in large blocks and hashes with the GIL released,
+        # using OpenSSL's SHA-NI/AVX2 code paths where available
         with file_path.open("rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
-        return sha256_hash.hexdigest()
+            return hashlib.file_digest(f, "sha256").hexdigest()
     except Exception as e:
         raise RuntimeError(f"Error calculating SHA256 for file {file_path}: {e}") from e
 
@@ -303,9 +324,7 @@ def get_file_stat_model(file_path: Path, logger: Optional[Logger] = None) -> Uni
 
     logger = logger.getChild(__name__) if logger else None
 
-    from core.base import (  # , LinuxFileStat, MacOSFileStat, WindowsFileStat,
-        BaseFileStat,
-    )
+    from core.base import _PLATFORM_STAT
 
     if logger:
         logger.debug(f"Getting file stat for: {file_path}")
@@ -318,33 +337,8 @@ def get_file_stat_model(file_path: Path, logger: Optional[Logger] = None) -> Uni
             raise FileNotFoundError(f"File not found: {file_path}")
         file_stat = os_stat(file_path)
 
-        # system = sys.platform
-        # if system == "Darwin":
-        #     return MacOSFileStat.model_validate(
-        #         {
-        #             stat_key: getattr(file_stat, stat_key)
-        #             for stat_key in dir(file_stat)
-        #             if not stat_key.startswith("_")
-        #         }, from_attributes=True
-        #     )
-        # elif system == "Windows":
-        #     return WindowsFileStat.model_validate(
-        #         {
-        #             stat_key: getattr(file_stat, stat_key)
-        #             for stat_key in dir(file_stat)
-        #             if not stat_key.startswith("_")
-        #         }, from_attributes=True
-        #     )
-        # elif system == "Linux":
-        #     return LinuxFileStat.model_validate(
-        #         {
-        #             stat_key: getattr(file_stat, stat_key)
-        #             for stat_key in dir(file_stat)
-        #             if not stat_key.startswith("_")
-        #         }, from_attributes=True
-        #     )
-        # else:
-        return BaseFileStat.model_validate(
+        # the platform model (MacOS/Linux/Windows/Base) is resolved once in core.base
+        return _PLATFORM_STAT.model_validate(
             {
                 stat_key: getattr(file_stat, stat_key)
                 for stat_key in dir(file_stat)
@@ -430,6 +424,166 @@ def get_mime_type(file_path: Path, logger: Optional[Logger] = None) -> str:
         raise RuntimeError(f"Error getting MIME type for file {file_path}") from e
 
 
+@lru_cache(maxsize=None)
+def get_fingerprint_cache() -> Optional[sqlite3.Connection]:
+    """
+    Open the on-disk file fingerprint cache, once per process.
+
+    The cache lives at ``AppSettings.cache_dir / "scan.db"`` and maps
+    ``(path, st_mtime_ns, st_size)`` to the file's ``(sha256, mime_type)`` so
+    rescans can skip hashing files that have not changed. Paths are stored
+    resolved, so relative and absolute spellings of a file share one entry. A second table holds
+    the JSON results of get_file_extract() under the same key plus a kind.
+
+    Returns:
+        Optional[sqlite3.Connection]: The cache connection, or None if the cache
+            could not be opened (callers then fall back to hashing every file).
+    """
+    from core.config import AppSettings, get_settings
+
+    try:
+        cache_dir = get_settings(AppSettings).cache_dir
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(
+            cache_dir / "scan.db", check_same_thread=False, isolation_level=None
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS file_fingerprints ("
+            "path TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL, "
+            "sha256 TEXT NOT NULL, mime_type TEXT NOT NULL)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS file_extracts ("
+            "kind TEXT NOT NULL, path TEXT NOT NULL, mtime_ns INTEGER NOT NULL, "
+            "size INTEGER NOT NULL, data TEXT NOT NULL, PRIMARY KEY (kind, path))"
+        )
+        return conn
+    except Exception:
+        return None
+
+
+_FINGERPRINT_LOCK = Lock()
+"""Serializes access to the shared fingerprint cache connection."""
+
+
+def _reset_fingerprint_cache() -> None:
+    """Drop the parent's cache connection and lock in a freshly forked child."""
+    global _FINGERPRINT_LOCK
+    get_fingerprint_cache.cache_clear()
+    _FINGERPRINT_LOCK = Lock()
+
+
+# SQLite connections must not be shared across fork(); worker processes (e.g.
+# ImageFile.populate_many) open their own connection on first use.
+os.register_at_fork(after_in_child=_reset_fingerprint_cache)
+
+
+def get_file_fingerprint(
+    file_path: Path, st_mtime_ns: Optional[int], st_size: Optional[int]
+) -> tuple[str, str]:
+    """
+    Get the SHA256 hash and MIME type of a file, memoized on its stat fingerprint.
+
+    Arguments:
+        file_path (Path): The file path to fingerprint.
+        st_mtime_ns (Optional[int]): The file's modification time, in nanoseconds.
+        st_size (Optional[int]): The file's size, in bytes.
+
+    Returns:
+        tuple[str, str]: The SHA256 hex digest and MIME type of the file.
+
+    Example:
+        >>> st = Path("document.txt").stat()
+        >>> get_file_fingerprint(Path("document.txt"), st.st_mtime_ns, st.st_size)
+        ('3a7bd3e2360a3d80c4f1b...', 'text/plain')
+    """
+    conn = get_fingerprint_cache()
+    key = file_path.resolve().as_posix()
+    if conn is not None and st_mtime_ns is not None and st_size is not None:
+        with _FINGERPRINT_LOCK:
+            row = conn.execute(
+                "SELECT sha256, mime_type FROM file_fingerprints "
+                "WHERE path = ? AND mtime_ns = ? AND size = ?",
+                (key, st_mtime_ns, st_size),
+            ).fetchone()
+        if row is not None:
+            return row[0], row[1]
+
+    file_sha256 = get_file_sha256(file_path)
+    mime_type = get_mime_type(file_path) or "application/octet-stream"
+
+    if conn is not None and st_mtime_ns is not None and st_size is not None:
+        try:
+            with _FINGERPRINT_LOCK:
+                conn.execute(
+                    "INSERT OR REPLACE INTO file_fingerprints "
+                    "(path, mtime_ns, size, sha256, mime_type) VALUES (?, ?, ?, ?, ?)",
+                    (key, st_mtime_ns, st_size, file_sha256, mime_type),
+                )
+        except sqlite3.Error:
+            pass
+    return file_sha256, mime_type
+
+
+def get_file_extract(
+    kind: str,
+    file_path: Path,
+    st_mtime_ns: Optional[int],
+    st_size: Optional[int],
+    extract: Callable[[Path], Any],
+) -> Any:
+    """
+    Run an expensive per-file extraction, memoized on the file's stat fingerprint.
+
+    Results are stored as JSON in the fingerprint cache, keyed by (kind, path) and
+    valid while the file's mtime and size are unchanged, so rescans skip e.g.
+    ffprobe or sqlite_master reads for files that have not changed.
+
+    Arguments:
+        kind (str): Name of the extraction (e.g. "ffprobe"), keeping results apart.
+        file_path (Path): The file to extract from.
+        st_mtime_ns (Optional[int]): The file's modification time, in nanoseconds.
+        st_size (Optional[int]): The file's size, in bytes.
+        extract (Callable[[Path], Any]): Computes the JSON-serializable result.
+
+    Returns:
+        Any: The (possibly cached) result of extract(file_path). Tuples come back
+            from the cache as lists.
+
+    Example:
+        >>> st = Path("clip.mp4").stat()
+        >>> get_file_extract("ffprobe", Path("clip.mp4"), st.st_mtime_ns, st.st_size, probe)
+        {'streams': [...], 'format': {...}}
+    """
+    conn = get_fingerprint_cache()
+    key = file_path.resolve().as_posix()
+    cacheable = conn is not None and st_mtime_ns is not None and st_size is not None
+    if cacheable:
+        with _FINGERPRINT_LOCK:
+            row = conn.execute(
+                "SELECT data FROM file_extracts "
+                "WHERE kind = ? AND path = ? AND mtime_ns = ? AND size = ?",
+                (kind, key, st_mtime_ns, st_size),
+            ).fetchone()
+        if row is not None:
+            return json.loads(row[0])
+
+    result = extract(file_path)
+
+    if cacheable:
+        try:
+            with _FINGERPRINT_LOCK:
+                conn.execute(
+                    "INSERT OR REPLACE INTO file_extracts "
+                    "(kind, path, mtime_ns, size, data) VALUES (?, ?, ?, ?, ?)",
+                    (kind, key, st_mtime_ns, st_size, json.dumps(result)),
+                )
+        except (sqlite3.Error, TypeError, ValueError):
+            pass
+    return result
+
+
 def BaseFileModel_from_Path(file_path: Path, logger: Optional[Logger] = None) -> "BaseFileModel":  # type: ignore  # noqa: F821
     """
     Create a BaseFileModel instance from a given file path.
@@ -659,6 +813,27 @@ def timestamp() -> float:
     return get_time().timestamp()
 
 
+def parse_iso_datetime(value: str) -> datetime:
+    """
+    Parse an ISO 8601 string into a datetime.
+
+    Uses the ciso8601 C parser when it is installed, otherwise falls back to
+    datetime.fromisoformat.
+
+    Arguments:
+        value (str): The ISO 8601 string to parse.
+
+    Returns:
+        datetime: The parsed datetime.
+
+    Example:
+        >>> from core.utils import parse_iso_datetime
+        >>> parse_iso_datetime("2026-01-26T13:25:52")
+        datetime.datetime(2026, 1, 26, 13, 25, 52)
+    """
+    return _parse_datetime(value)
+
+
 # endregion
 # region Path Utilities
 
@@ -13,6 +13,20 @@ src_path = Path(__file__).parent.parent / "src"
 sys.path.insert(0, str(src_path))
 
 
+@pytest.fixture(scope="session", autouse=True)
+def scan_cache_dir(tmp_path_factory):
+    """Keep the file fingerprint cache out of the user's real cache_dir."""
+    from core.config import AppSettings
+    from core.utils import get_fingerprint_cache
+
+    cache_dir = tmp_path_factory.mktemp("cache")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(AppSettings, "cache_dir", property(lambda self: cache_dir))
+        get_fingerprint_cache.cache_clear()
+        yield cache_dir
+    get_fingerprint_cache.cache_clear()
+
+
 @pytest.fixture(scope="session")
 def test_database_url():
     """Provide a test database URL (in-memory SQLite)."""
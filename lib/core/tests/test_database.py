@@ -0,0 +1,69 @@
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+from sqlalchemy import JSON, Column, Integer, MetaData, Table, create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+import core.database as db
+
+_METADATA = MetaData()
+_ROWS_TABLE = Table(
+    "copy_rows_test",
+    _METADATA,
+    Column("id", Integer, primary_key=True),
+    Column("data", JSON),
+    Column("data_or_null", JSON(none_as_null=True)),
+)
+
+
+class _CopyCursor:
+    """Stands in for a psycopg 3 cursor, recording the rows written to COPY."""
+
+    def __init__(self):
+        self.rows = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    @contextmanager
+    def copy(self, statement):
+        yield self
+
+    def write_row(self, row):
+        self.rows.append(row)
+
+
+class _CopySession:
+    """Stands in for a Session whose DBAPI connection hands out the given cursor."""
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def connection(self):
+        dbapi_connection = SimpleNamespace(cursor=lambda: self._cursor)
+        return SimpleNamespace(connection=dbapi_connection)
+
+
+def test_copy_rows_writes_json_none_like_insert(monkeypatch):
+    """Test that the COPY and INSERT paths store a JSON None the same way."""
+    rows = [{"id": 1, "data": None, "data_or_null": None}]
+
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    _METADATA.create_all(engine)
+    with Session(engine) as session:
+        db.copy_rows(session, _ROWS_TABLE, rows)
+        inserted = (
+            session.connection()
+            .exec_driver_sql("SELECT data, data_or_null FROM copy_rows_test")
+            .one()
+        )
+
+    cursor = _CopyCursor()
+    monkeypatch.setattr(db, "COPY_THRESHOLD", 0)
+    db.copy_rows(_CopySession(cursor), _ROWS_TABLE, rows)
+    assert cursor.rows == [[1, *inserted]]
+    assert tuple(inserted) == ("null", None)
@@ -253,3 +253,346 @@ def test_base_text_file_contents(test_base_text_file_path):
     content = text_file.content
     assert "# Test Markdown File" in content
     assert "def hello_world():" in content
+
+
+def test_populate_reuses_cached_fingerprint(monkeypatch):
+    """Test that an unchanged file is not re-hashed on a second populate."""
+    import core.utils as cu
+
+    first = fs.GenericFile.populate(TEST_GENERIC_FILE)
+
+    def fail_sha256(file_path):
+        raise AssertionError(f"unchanged file was re-hashed: {file_path}")
+
+    monkeypatch.setattr(cu, "get_file_sha256", fail_sha256)
+    second = fs.GenericFile.populate(TEST_GENERIC_FILE)
+    assert second.sha256 == first.sha256
+    assert second.mime_type == first.mime_type
+
+
+def test_fingerprint_cache_keys_on_resolved_path(monkeypatch, scan_cache_dir):
+    """Test that the fingerprint cache lives in cache_dir and keys on resolved paths."""
+    import os
+
+    import core.utils as cu
+
+    st = TEST_GENERIC_FILE.stat()
+    first = cu.get_file_fingerprint(TEST_GENERIC_FILE, st.st_mtime_ns, st.st_size)
+    assert (scan_cache_dir / "scan.db").exists()
+
+    def fail_sha256(file_path):
+        raise AssertionError(f"unchanged file was re-hashed: {file_path}")
+
+    monkeypatch.setattr(cu, "get_file_sha256", fail_sha256)
+    relative = Path(os.path.relpath(TEST_GENERIC_FILE))
+    assert cu.get_file_fingerprint(relative, st.st_mtime_ns, st.st_size) == first
+
+
+def test_sqlite_populate_reuses_cached_introspection(monkeypatch):
+    """Test that an unchanged SQLite file is not re-introspected on a second populate."""
+    from core.models.file_system import sqlite_file
+
+    first = fs.SQLiteFile.populate(TEST_SQLITE_FILE)
+
+    def fail_introspect(file_path):
+        raise AssertionError(f"unchanged file was re-introspected: {file_path}")
+
+    monkeypatch.setattr(sqlite_file, "_introspect", fail_introspect)
+    second = fs.SQLiteFile.populate(TEST_SQLITE_FILE)
+    assert second.tables == first.tables
+    assert second.db_schema == first.db_schema
+
+
+def test_directory_is_empty(tmp_path):
+    """Test that BaseDirectory.is_empty reflects the directory contents."""
+    assert fs.BaseDirectory.populate(tmp_path).is_empty()
+    (tmp_path / "file.txt").write_text("content")
+    assert not fs.BaseDirectory.populate(tmp_path).is_empty()
+
+
+def test_scan_result_stat_columns(test_image_file_path):
+    """Test that scan results aggregate the stats of their files."""
+    scan = fs.ImageScanResult(root=str(TEST_DATA_FOLDER), files=[test_image_file_path])
+    stat = test_image_file_path.stat_json
+    assert scan.file_count == 1
+    assert scan.total_size() == stat.st_size
+    assert scan.newest_mtime_ns() == stat.st_mtime_ns
+    assert scan.stat_at(0).st_size == stat.st_size
+    scan.files.append(test_image_file_path)
+    assert scan.file_count == 2
+    assert scan.total_size() == 2 * stat.st_size
+
+
+def test_scan_result_skips_missing_stats(test_image_file_path):
+    """Test that files without stats are recorded as unknown, not as zero."""
+    from core.base import BaseFileStat
+
+    no_stat = test_image_file_path.model_copy(update={"stat_json": BaseFileStat()})
+    scan = fs.ImageScanResult(root=str(TEST_DATA_FOLDER), files=[no_stat])
+    assert scan.total_size() == 0
+    assert scan.newest_mtime_ns() is None
+    assert scan.stat_at(0) is None
+    scan.files.append(test_image_file_path)
+    assert scan.total_size() == test_image_file_path.stat_json.st_size
+    assert scan.stat_at(1).st_size == test_image_file_path.stat_json.st_size
+
+
+def test_video_scan_result_stat_columns(tmp_path):
+    """Test that video scans count their paths without reading the disk."""
+    scan = fs.VideoScanResult(
+        root=str(TEST_DATA_FOLDER),
+        files=[str(TEST_MP4_FILE), str(tmp_path / "missing.mp4")],
+    )
+    assert scan.file_count == 2
+    assert scan.stat_at(0) is None
+    assert scan.total_size() == 0
+    assert scan.newest_mtime_ns() is None
+
+
+def test_image_populate_many(test_image_file_path):
+    """Test that populate_many batches images and reports failures."""
+    errors = []
+    batches = list(
+        fs.ImageFile.populate_many(
+            [TEST_PNG_FILE, TEST_GENERIC_FILE, TEST_PNG_FILE],
+            batch_size=1,
+            max_workers=2,
+            on_error=lambda path, error: errors.append(path),
+        )
+    )
+    assert [len(batch) for batch in batches] == [1, 1]
+    assert all(batch[0].id == test_image_file_path.id for batch in batches)
+    assert errors == [TEST_GENERIC_FILE]
+    assert batches[0][0].row["stat_json"]["st_size"] == TEST_PNG_FILE.stat().st_size
+
+
+def test_entity_model_round_trip(test_image_file_path):
+    """Test that an entity's .model rebuilds the model it was created from."""
+    model = test_image_file_path.entity.model
+    assert model.id == test_image_file_path.id
+    assert model.uuid == test_image_file_path.uuid
+    assert model.b64_data == test_image_file_path.b64_data
+
+
+def test_entity_stat_model_matches_model(test_image_file_path):
+    """Test that .stat_model and .model build the same platform stat type."""
+    entity = test_image_file_path.entity
+    assert type(entity.stat_model) is type(entity.model.stat_json)
+    assert entity.stat_model.st_size == test_image_file_path.stat_json.st_size
+
+
+def test_sqlite_entity_model(test_sqlite_file_path):
+    """Test that a SQLite entity's .model carries the schema and tables."""
+    sqlite_file = test_sqlite_file_path
+    entity = fs.SQLiteFileEntity(
+        id=sqlite_file.id,
+        sha256=sqlite_file.sha256,
+        path_json=sqlite_file.path_json.model_dump(),
+        stat_json=sqlite_file.stat_json.model_dump(),
+        mime_type=sqlite_file.mime_type,
+        frozen=False,
+        schema=sqlite_file.db_schema,
+        tables=sqlite_file.tables,
+    )
+    model = entity.model
+    assert model.id == sqlite_file.id
+    assert model.db_schema == sqlite_file.db_schema
+    assert model.tables == sqlite_file.tables
+    assert fs.SQLiteFileEntity.summaries_from_rows([entity]) == [entity.summary]
+    assert fs.SQLiteFileEntity.as_dicts([entity]) == [entity.dict]
+    assert entity.dict["schema"] == sqlite_file.db_schema
+    assert entity == fs.SQLiteFileEntity(id=sqlite_file.id)
+    assert entity != fs.SQLiteFileEntity(id="other", sha256=sqlite_file.sha256)
+    hashed = hash(entity)
+    entity.sha256 = "0" * 64
+    assert hash(entity) == hashed
+    assert len({entity, fs.SQLiteFileEntity(id=sqlite_file.id)}) == 1
+
+
+def _plain_sqlite_engine(entity_cls, rename=None):
+    """Return an in-memory engine holding an untyped copy of the entity's table.
+
+    SQLite cannot build the Postgres computed columns, and reserves names that start
+    with "sqlite_"; *rename* maps the table to a name SQLite accepts.
+    """
+    from sqlalchemy import create_engine, event
+    from sqlalchemy.pool import StaticPool
+
+    table = entity_cls.__table__
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    if rename:
+
+        @event.listens_for(engine, "before_cursor_execute", retval=True)
+        def _rename(conn, cursor, statement, parameters, context, executemany):
+            return statement.replace(table.name, rename), parameters
+
+    columns = ", ".join(column.name for column in table.columns)
+    with engine.begin() as conn:
+        conn.exec_driver_sql(f"CREATE TABLE {table.name} ({columns})")
+    return engine
+
+
+def test_sqlite_entity_reads_use_one_select(test_sqlite_file_path):
+    """Test that list and detail reads each take one SELECT, heavy columns deferred."""
+    from sqlalchemy import event, select
+    from sqlalchemy.orm import Session
+
+    engine = _plain_sqlite_engine(fs.SQLiteFileEntity, rename="t_sqlite_files")
+    sqlite_file = test_sqlite_file_path
+    with Session(engine) as session:
+        for n in range(3):
+            session.add(
+                fs.SQLiteFileEntity(
+                    id=f"{sqlite_file.id}-{n}",
+                    sha256=sqlite_file.sha256,
+                    path_json=sqlite_file.path_json.model_dump(mode="json"),
+                    stat_json=sqlite_file.stat_json.model_dump(mode="json"),
+                    frozen=False,
+                    schema=sqlite_file.db_schema,
+                    tables=sqlite_file.tables,
+                )
+            )
+        session.commit()
+
+    statements = []
+    event.listen(
+        engine, "before_cursor_execute", lambda *args: statements.append(args[2])
+    )
+    with Session(engine) as session:
+        rows = session.scalars(select(fs.SQLiteFileEntity)).all()
+        summaries = fs.SQLiteFileEntity.summaries_from_rows(rows)
+    assert len(statements) == 1
+    assert " schema" not in statements[0]
+    assert len(summaries) == 3
+
+    statements.clear()
+    with Session(engine) as session:
+        rows = session.scalars(fs.SQLiteFileEntity.select_details()).all()
+        models = [row.model for row in rows]
+        dicts = fs.SQLiteFileEntity.as_dicts(rows)
+        assert [row.dict for row in rows] == dicts
+    assert len(statements) == 1
+    assert [model.db_schema for model in models] == [sqlite_file.db_schema] * 3
+    assert dicts[0]["stat_json"]["st_size"] == sqlite_file.stat_json.st_size
+
+
+def test_image_entity_model_without_blob(test_image_file_path):
+    """Test that .model and .dict work on rows loaded without the blob."""
+    from sqlalchemy import select
+    from sqlalchemy.orm import Session, selectinload
+
+    engine = _plain_sqlite_engine(fs.ImageFileEntity)
+    fs.ImageFileBlobEntity.__table__.create(engine)
+    with Session(engine) as session:
+        session.add(test_image_file_path.entity)
+        session.commit()
+
+    with Session(engine) as session:
+        entity = session.scalars(select(fs.ImageFileEntity)).one()
+        assert entity.model.id == test_image_file_path.id
+        assert entity.model.b64_data is None
+        assert entity.dict["thumbnail_b64_data"] is None
+
+    with Session(engine) as session:
+        entity = session.scalars(
+            select(fs.ImageFileEntity).options(selectinload(fs.ImageFileEntity.blob))
+        ).one()
+        assert entity.model.b64_data == test_image_file_path.b64_data
+
+
+def test_sqlite_populate_many(test_sqlite_file_path):
+    """Test that populate_many populates SQLite files on threads and skips failures."""
+    errors = []
+    files = fs.SQLiteFile.populate_many(
+        [TEST_SQLITE_FILE, TEST_CSV_FILE],
+        max_workers=2,
+        on_error=lambda path, error: errors.append(path),
+    )
+    assert [f.tables for f in files] == [test_sqlite_file_path.tables]
+    assert errors == [TEST_CSV_FILE]
+
+
+def test_sqlite_dump_many_json(test_sqlite_file_path):
+    """Test that a list of SQLite models dumps to one JSON array."""
+    import json
+
+    dumped = json.loads(fs.SQLiteFile.dump_many_json([test_sqlite_file_path] * 2))
+    assert [item["id"] for item in dumped] == [test_sqlite_file_path.id] * 2
+    assert dumped[0] == json.loads(test_sqlite_file_path.model_dump_json())
+
+
+def test_entity_identity_is_id(test_image_file_path):
+    """Test that entity equality and hashing only use the primary key."""
+    first, second = test_image_file_path.entity, test_image_file_path.entity
+    second.sha256 = None
+    assert first == second
+    assert len({first, second}) == 1
+
+
+def test_entity_cached_properties_invalidate(test_image_file_path):
+    """Test that cached entity properties are dropped when a column changes."""
+    entity = test_image_file_path.entity
+    assert entity.summary["tags"] == ""
+    assert entity.summary is entity.summary
+    entity.tags = ["#cat"]
+    assert entity.summary["tags"] == "#cat"
+
+
+def test_image_scan_result_json_round_trip(test_image_file_path):
+    """Test that an image scan result survives a JSON round-trip."""
+    scan = fs.ImageScanResult(root=str(TEST_DATA_FOLDER), files=[test_image_file_path])
+    restored = fs.ImageScanResult.model_validate_json(scan.model_dump_json())
+    assert restored.files[0].id == test_image_file_path.id
+    assert restored.files[0].b64_data == test_image_file_path.b64_data
+
+
+def test_image_populate_batch(test_image_file_path):
+    """Test that populate_batch populates images on threads and skips failures."""
+    errors = []
+    images = fs.ImageFile.populate_batch(
+        [TEST_PNG_FILE, TEST_GENERIC_FILE],
+        workers=2,
+        on_error=lambda path, error: errors.append(path),
+    )
+    assert [image.id for image in images] == [test_image_file_path.id]
+    assert errors == [TEST_GENERIC_FILE]
+
+
+def test_data_file_skip_fs_checks(test_data_file_path):
+    """Test that trusted DataFile payloads can skip the file type check."""
+    data = test_data_file_path.model_dump()
+    data["path_json"] = fs.FilePath.model_validate(
+        {**data["path_json"], "suffix": ".bin", "parts": ["/", "data.bin"]}
+    )
+    with pytest.raises(ValueError):
+        fs.DataFile.model_validate(data)
+    fs.DataFile.model_validate(data, context={"skip_fs_checks": True})
+
+
+@pytest.mark.parametrize("mode", ["LA", "P", "RGBA"])
+def test_image_thumbnail_with_alpha(tmp_path, mode):
+    """Test that images with an alpha channel in any mode get a thumbnail."""
+    from PIL import Image
+
+    image_path = tmp_path / f"{mode}.png"
+    options = {"transparency": 0} if mode == "P" else {}
+    Image.new(mode, (900, 600)).save(image_path, **options)
+    image = fs.ImageFile.populate(image_path)
+    assert image.thumbnail_b64_data
+
+
+def test_image_tags_use_serve_url(test_image_file_path, monkeypatch):
+    """Test that image tags link to the serve URL when one is configured."""
+    from core.config import AppSettings, get_settings
+
+    image = test_image_file_path
+    assert image.html_img_tag.startswith('<img src="data:image/')
+    monkeypatch.setattr(
+        get_settings(AppSettings), "image_serve_url", "http://localhost/images/"
+    )
+    assert image.html_img_tag == (
+        f'<img src="http://localhost/images/{image.id}" alt="Image"/>'
+    )
+    assert image.md_thumbnail_tag == (
+        f"![Thumbnail](http://localhost/images/{image.id}/thumbnail)"
+    )
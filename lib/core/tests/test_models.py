@@ -0,0 +1,254 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import yaml
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from core.models import notes
+from core.models.history.clipboard_history import (
+    ClipboardHistoryEntity,
+    content_digest,
+)
+from core.models.log_entry import LogEntry, LogEntryEntity
+from core.models.network_host import NetworkHost, NetworkHostEntity
+from core.models.notes import Note, NoteEntity, _render_front_matter
+
+
+@compiles(JSONB, "sqlite")
+def _jsonb_as_sqlite_json(type_, compiler, **kw):
+    return "JSON"
+
+
+@pytest.fixture
+def session_for():
+    """Open a Session on an in-memory SQLite database holding the given tables."""
+    engines = []
+
+    def factory(*entities) -> Session:
+        engine = create_engine("sqlite://", poolclass=StaticPool)
+        for entity in entities:
+            entity.__table__.create(engine)
+        engines.append(engine)
+        return Session(engine)
+
+    yield factory
+    for engine in engines:
+        engine.dispose()
+
+
+def test_clipboard_hash_tracks_flushed_id(session_for):
+    """Test that the cached entity hash is recomputed once a flush assigns the id."""
+    session = session_for(ClipboardHistoryEntity)
+    entry = ClipboardHistoryEntity(content="copied", content_hash=b"\0" * 16)
+    assert hash(entry) == hash((None, b"\0" * 16))
+    session.add(entry)
+    session.flush()
+    assert entry.id is not None
+    assert hash(entry) == hash((entry.id, b"\0" * 16))
+
+
+@pytest.mark.parametrize(
+    "entity",
+    [
+        LogEntryEntity(level="INFO", service="controller", message="started"),
+        NetworkHostEntity(hostname="nas", ip_address="10.0.0.2"),
+    ],
+    ids=["log_entry", "network_host"],
+)
+def test_entity_dict_is_fresh_after_flush(session_for, entity):
+    """Test that .dict shows flushed values and hands out a copy of its cache."""
+    session = session_for(type(entity))
+    assert entity.dict["id"] is None
+    session.add(entity)
+    session.flush()
+    first = entity.dict
+    assert first["id"] == entity.id is not None
+    first["id"] = -1
+    assert entity.dict["id"] == entity.id
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["plain", "it's", "line\n😀", "tab\there", 'quote " and \\', "\x7f\x85\u2028\x9f"],
+)
+def test_front_matter_round_trips_through_yaml(text):
+    """Test that rendered front matter loads back to the same title and tags."""
+    front_matter = _render_front_matter(text, [text, "b"], None, None)
+    loaded = yaml.safe_load(front_matter.strip("-\n"))
+    assert loaded == {
+        "title": text,
+        "tags": [text, "b"],
+        "created_at": None,
+        "updated_at": None,
+    }
+
+
+def test_front_matter_matches_yaml_dump():
+    """Test that the templated front matter loads like the yaml.dump rendering."""
+    created = datetime(2026, 1, 1, 12, 30, tzinfo=timezone.utc)
+    front_matter = _render_front_matter("Title: 1", ["a", "b c"], created, created)
+    dumped = yaml.safe_dump(
+        {
+            "title": "Title: 1",
+            "tags": ["a", "b c"],
+            "created_at": created.isoformat(),
+            "updated_at": created.isoformat(),
+        },
+        sort_keys=False,
+    )
+    assert yaml.safe_load(front_matter.strip("-\n")) == yaml.safe_load(dumped)
+    assert front_matter.startswith("---\ntitle: ")
+    assert front_matter.endswith("\n---\n")
+
+
+def test_network_host_model_carries_added_at(session_for):
+    """Test that the host model reads added_at from the entity's created_at."""
+    session = session_for(NetworkHostEntity)
+    entity = NetworkHostEntity(hostname=None, ip_address="10.0.0.2")
+    session.add(entity)
+    session.flush()
+    model = entity.model
+    assert model.added_at is not None
+    assert model.added_at == entity.created_at
+    assert model.hostname is None
+    assert NetworkHost.from_entities([entity]) == [model]
+    assert NetworkHost(
+        hostname="nas", ip_address=None, added_at=model.added_at
+    ).added_at
+
+
+def test_cached_note_model_is_immutable():
+    """Test that the Note cached on the entity cannot be changed by a caller."""
+    entity = NoteEntity(title="t", content="c", tags=["a"])
+    model = entity.model
+    assert model is entity.model
+    assert model.tags == ("a",)
+    with pytest.raises(AttributeError):
+        model.tags.append("b")
+    with pytest.raises(ValueError):
+        model.title = "changed"
+    assert Note.model_validate(NoteEntity(title="t", content="c")).tags == ()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Make note timestamps advance by one second on every read of the clock."""
+    times = (
+        datetime(2026, 1, 1, tzinfo=timezone.utc) + timedelta(seconds=n)
+        for n in range(1000)
+    )
+    monkeypatch.setattr(notes, "_utcnow", lambda: next(times))
+
+
+def test_note_insert_renders_markdown(session_for, clock):
+    """Test that inserting a note sets its timestamps and stores the rendered markdown."""
+    session = session_for(NoteEntity)
+    entity = NoteEntity(title="Title", content="Body", tags=["a"])
+    session.add(entity)
+    session.flush()
+    assert entity.created_at == entity.updated_at is not None
+    assert entity.rendered_md == entity.full_content_with_front_matter
+    assert entity.rendered_md.endswith("---\nBody")
+    assert entity.model.updated_at == entity.updated_at
+
+
+def test_note_update_bumps_updated_at_only_on_change(session_for, clock):
+    """Test that updated_at and rendered_md only change when a column does."""
+    session = session_for(NoteEntity)
+    entity = NoteEntity(title="Title", content="Body")
+    session.add(entity)
+    session.flush()
+    created_at, updated_at = entity.created_at, entity.updated_at
+
+    statements = []
+    event.listen(
+        session.get_bind(),
+        "before_cursor_execute",
+        lambda *args: statements.append(args[2]),
+    )
+    entity.title = "Title"
+    session.flush()
+    assert statements == []
+    assert entity.updated_at == updated_at
+
+    entity.content = "New body"
+    session.flush()
+    assert entity.created_at == created_at
+    assert entity.updated_at > updated_at
+    assert entity.rendered_md.endswith("---\nNew body")
+    assert entity.model.content == "New body"
+
+
+def test_note_front_matter_follows_copies():
+    """Test that a copied note renders the front matter of its own fields."""
+    note = Note(title="before", content="c")
+    assert "title: 'before'" in note.yaml_front_matter
+    copy = note.model_copy(update={"title": "after"})
+    assert "title: 'after'" in copy.yaml_front_matter
+    assert copy.front_matter_sha1 != note.front_matter_sha1
+
+
+def test_note_load_many_json_round_trip():
+    """Test that load_many_json parses what dump_many_json wrote."""
+    batch = [
+        Note(id=1, title="a", content="x", tags=["t"]),
+        Note(id=2, title="b", content="y", created_at=datetime.now(timezone.utc)),
+    ]
+    assert Note.load_many_json(Note.dump_many_json(batch)) == batch
+
+
+def test_clipboard_insert_fills_content_hash(session_for):
+    """Test that the before_insert hook digests the content unless a hash is set."""
+    session = session_for(ClipboardHistoryEntity)
+    filled = ClipboardHistoryEntity(content="copied")
+    preset = ClipboardHistoryEntity(content="other", content_hash=b"\1" * 16)
+    session.add_all([filled, preset])
+    session.flush()
+    assert filled.content_hash == content_digest("copied")
+    assert len(filled.content_hash) == 16
+    assert preset.content_hash == b"\1" * 16
+
+
+def test_network_host_key_identity():
+    """Test that hosts compare and hash by MAC address, else by IP address."""
+    by_mac = NetworkHostEntity(ip_address="10.0.0.2", mac_address="aa:bb")
+    moved = NetworkHostEntity(ip_address="10.0.0.3", mac_address="aa:bb")
+    by_ip = NetworkHostEntity(ip_address="10.0.0.2")
+    assert by_mac == moved
+    assert len({by_mac, moved, by_ip}) == 2
+    assert by_mac != by_ip
+    by_ip.mac_address = "aa:bb"
+    assert by_ip == by_mac
+    assert hash(by_ip) == hash(by_mac)
+
+
+def test_bulk_copy_insert(session_for):
+    """Test that the bulk inserts write every model, filling missing log timestamps."""
+    session = session_for(LogEntryEntity, NetworkHostEntity)
+    stamped = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    LogEntryEntity.bulk_copy_insert(
+        session,
+        [
+            LogEntry(level="INFO", service="controller", message="one"),
+            LogEntry(
+                level="ERROR", service="converter", message="two", timestamp=stamped
+            ),
+        ],
+    )
+    NetworkHostEntity.bulk_copy_insert(
+        session,
+        [
+            NetworkHost(hostname="nas", ip_address="10.0.0.2"),
+            NetworkHost(hostname=None, ip_address="10.0.0.3", mac_address="aa:bb"),
+        ],
+    )
+    logs = session.scalars(select(LogEntryEntity).order_by(LogEntryEntity.id)).all()
+    assert [log.message for log in logs] == ["one", "two"]
+    assert all(log.timestamp is not None for log in logs)
+    assert logs[1].timestamp.replace(tzinfo=timezone.utc) == stamped
+    hosts = session.scalars(select(NetworkHostEntity)).all()
+    assert {host._key for host in hosts} == {"10.0.0.2", "aa:bb"}
@@ -18,7 +18,7 @@ from pathlib import Path
 from logging import Logger as T_Logger
 from typing import Generator
 
-from sqlalchemy import func
+from sqlalchemy import func, select
 
 from core.config import AppSettings
 from core.database import DatabaseSessionGenerator as DBSession
@@ -73,20 +73,19 @@ class ImageImporterService:
         yield StreamingServiceResponse(
             status="Initiated", message=f"Scanning directory {directory} for images."
         )
-        paths = ls_files(directory, logger=self.__logger)
-        images = []
-        for path in paths:
-            if is_image_file(path):
-                try:
-                    images.append(ImageFile.populate(path))
-                except Exception as e:
-                    self.__logger.warning(
-                        "Could not populate ImageFile for %s: %s", path, e
-                    )
+        paths = [
+            path
+            for path in ls_files(directory, logger=self.__logger)
+            if is_image_file(path)
+        ]
         yield StreamingServiceResponse(
-            status="Processing", message=f"Found {len(images)} images to import."
+            status="Processing", message=f"Found {len(paths)} images to import."
         )
-        yield from self.import_images(images)
+        for images in ImageFile.populate_many(paths, on_error=self.__populate_failed):
+            yield from self.import_images(images)
+
+    def __populate_failed(self, path: Path, error: str) -> None:
+        self.__logger.warning("Could not populate ImageFile for %s: %s", path, error)
 
     def import_images(
         self, images: list[ImageFile]
@@ -98,26 +97,36 @@ class ImageImporterService:
         )
         try:
             with self.__db_session.get_session() as session:
-                for image in images:
-                    existing_image = session.get(ImageFileEntity, image.id)
-                    if existing_image:
+                # One lookup and one multi-row INSERT per batch instead of a
+                # round-trip and commit per image.
+                ids = [image.id for image in images]
+                existing_ids = set(
+                    session.scalars(
+                        select(ImageFileEntity.id).where(ImageFileEntity.id.in_(ids))
+                    )
+                )
+                new_images: dict[str, ImageFile] = {}
+                for image, image_id in zip(images, ids):
+                    if image_id in existing_ids or image_id in new_images:
                         self.__logger.info(
                             "Image with ID %s already exists. Skipping import.",
-                            image.id,
+                            image_id,
                         )
                         yield StreamingServiceResponse(
                             status="Conflict",
-                            message=f"Image with ID {image.id} already exists.",
+                            message=f"Image with ID {image_id} already exists.",
                         )
                         continue
+                    new_images[image_id] = image
 
-                    image_entity = image.entity
-                    session.add(image_entity)
+                if new_images:
+                    ImageFileEntity.bulk_copy_insert(session, list(new_images.values()))
                     session.commit()
-                    self.__logger.info(f"Imported image with ID %s.", image_entity.id)
+                for image_id in new_images:
+                    self.__logger.info("Imported image with ID %s.", image_id)
                     yield StreamingServiceResponse(
                         status="Created",
-                        message=f"Imported image with ID {image_entity.id}.",
+                        message=f"Imported image with ID {image_id}.",
                     )
         except Exception as e:
             self.__logger.exception("Failed to import images. %s", str(e), exc_info=e)
@@ -139,21 +148,20 @@ class VideoImporterService:
         yield StreamingServiceResponse(
             status="Initiated", message=f"Scanning directory {directory} for videos."
         )
-        paths = ls_files(directory, logger=self.__logger)
-        videos = []
-        for path in paths:
-            if is_video_file(path):
-                try:
-                    videos.append(VideoFile.populate(path))
-                except Exception as e:
-                    self.__logger.warning(
-                        "Could not populate VideoFile for %s: %s", path, e
-                    )
+        paths = [
+            path
+            for path in ls_files(directory, logger=self.__logger)
+            if is_video_file(path)
+        ]
+        videos = VideoFile.populate_many(paths, on_error=self.__populate_failed)
         yield StreamingServiceResponse(
             status="Processing", message=f"Found {len(videos)} videos to import."
         )
         yield from self.import_videos(videos)
 
+    def __populate_failed(self, path: Path, error: str) -> None:
+        self.__logger.warning("Could not populate VideoFile for %s: %s", path, error)
+
     def import_videos(
         self, videos: list[VideoFile]
     ) -> Generator[StreamingServiceResponse, None, None]:
@@ -297,28 +305,34 @@ class DataImporterService:
         )
         try:
             with self.__db_session.get_session() as session:
-                for data_file in datas:
-                    existing_data = session.get(DataFileEntity, data_file.id)
-                    if existing_data:
+                ids = [data_file.id for data_file in datas]
+                existing_ids = set(
+                    session.scalars(
+                        select(DataFileEntity.id).where(DataFileEntity.id.in_(ids))
+                    )
+                )
+                new_datas: dict[str, DataFile] = {}
+                for data_file, data_id in zip(datas, ids):
+                    if data_id in existing_ids or data_id in new_datas:
                         self.__logger.info(
                             "Data file with ID %s already exists. Skipping import.",
-                            data_file.id,
+                            data_id,
                         )
                         yield StreamingServiceResponse(
                             status="Conflict",
-                            message=f"Data file with ID {data_file.id} already exists.",
+                            message=f"Data file with ID {data_id} already exists.",
                         )
                         continue
+                    new_datas[data_id] = data_file
 
-                    data_entity = data_file.entity
-                    session.add(data_entity)
+                if new_datas:
+                    DataFileEntity.bulk_copy_insert(session, list(new_datas.values()))
                     session.commit()
-                    self.__logger.info(
-                        f"Imported data file with ID %s.", data_entity.id
-                    )
+                for data_id in new_datas:
+                    self.__logger.info("Imported data file with ID %s.", data_id)
                     yield StreamingServiceResponse(
                         status="Created",
-                        message=f"Imported data file with ID {data_entity.id}.",
+                        message=f"Imported data file with ID {data_id}.",
                     )
         except Exception as e:
             self.__logger.exception(